@@ -0,0 +1,39 @@
+from logging.config import fileConfig
+from alembic import context
+from app.db import models
+from app.db.base import engine
+from app.db.migrations import include_name
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = models.Base.metadata
+
+def run_migrations_offline() -> None:
+    context.configure(url=engine.url, target_metadata=target_metadata, include_name=include_name,
+                      literal_binds=True, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    # app.db.migrations hands over its own connection; the alembic CLI uses
+    # the app engine (DATABASE_URL with the configured engine profile).
+    connection = config.attributes.get("connection")
+    if connection is None:
+        with engine.connect() as connection:
+            _run(connection)
+    else:
+        _run(connection)
+
+def _run(connection) -> None:
+    # Batch mode lets the same migrations alter tables on SQLite.
+    context.configure(connection=connection, target_metadata=target_metadata,
+                      include_name=include_name, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
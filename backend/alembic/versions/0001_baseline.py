@@ -0,0 +1,92 @@
+"""Baseline: the schema create_all produced before migrations existed.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("avatar", sa.String()),
+        sa.Column("department", sa.String()),
+        sa.Column("experience", sa.Integer()),
+        *timestamps(),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_table(
+        "skills",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("description", sa.Text()),
+        *timestamps(),
+    )
+    op.create_table(
+        "scores",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("employee_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("skill_id", sa.String(), sa.ForeignKey("skills.id"), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("trainer_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("feedback", sa.Text()),
+        *timestamps(),
+    )
+    op.create_table(
+        "learning_paths",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("employee_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("assigned_by", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("assigned_date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        *timestamps(),
+    )
+    op.create_table(
+        "learning_steps",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("learning_path_id", sa.String(), sa.ForeignKey("learning_paths.id"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("skill_type", sa.String(), nullable=False),
+        sa.Column("completed", sa.Boolean()),
+        sa.Column("completed_date", sa.DateTime(timezone=True)),
+        *timestamps(),
+    )
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("read", sa.Boolean()),
+        *timestamps(),
+    )
+
+
+def downgrade() -> None:
+    for table in ("notifications", "learning_steps", "learning_paths", "scores", "skills", "users"):
+        op.drop_table(table)
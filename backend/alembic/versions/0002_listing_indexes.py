@@ -0,0 +1,37 @@
+"""Indexes for the role listings and the score feeds.
+
+Databases created by create_all after these indexes were added to the
+models already have them, so each one is only created when missing.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_role_id", "users", ["role", "id"]),
+    ("ix_scores_date_id", "scores", ["date", "id"]),
+    ("ix_scores_skill_date_id", "scores", ["skill_id", "date", "id"]),
+    ("ix_scores_trainer_date_id", "scores", ["trainer_id", "date", "id"]),
+    ("ix_scores_employee_skill_date_id", "scores", ["employee_id", "skill_id", "date", "id"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,36 @@
+"""Skill matrix table: latest and best score per employee and skill.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("skill_matrix"):
+        return
+    op.create_table(
+        "skill_matrix",
+        sa.Column("employee_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("skill_id", sa.String(), sa.ForeignKey("skills.id"), primary_key=True),
+        sa.Column("latest_score_id", sa.String(), nullable=False),
+        sa.Column("latest_score", sa.Float(), nullable=False),
+        sa.Column("latest_date", sa.DateTime(timezone=True)),
+        sa.Column("best_score", sa.Float(), nullable=False),
+        sa.Column("attempt_count", sa.Integer(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("score_sum_squares", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_skill_matrix_skill_employee", "skill_matrix", ["skill_id", "employee_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("skill_matrix")
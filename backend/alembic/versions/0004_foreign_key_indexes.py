@@ -0,0 +1,35 @@
+"""Indexes on the foreign keys every per-user lookup filters on.
+
+scores.skill_id, scores.trainer_id and scores.employee_id already lead an
+index from 0002; the employee feed also needs (employee_id, date, id) to
+page without a sort.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_scores_employee_date_id", "scores", ["employee_id", "date", "id"]),
+    ("ix_learning_paths_employee_id", "learning_paths", ["employee_id"]),
+    ("ix_learning_paths_assigned_by", "learning_paths", ["assigned_by"]),
+    ("ix_learning_steps_learning_path_id", "learning_steps", ["learning_path_id"]),
+    ("ix_notifications_user_id", "notifications", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,40 @@
+"""Rebuild the skill matrix from the scores table.
+
+Databases upgraded by create_all got an empty skill_matrix table; cells
+created by score writes since then only hold the newer scores. The matrix
+is derived data, so every cell is recomputed here.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM skill_matrix")
+    op.execute("""
+        INSERT INTO skill_matrix (employee_id, skill_id, attempt_count, score_sum, score_sum_squares,
+                                  best_score, latest_score_id, latest_score, latest_date)
+        SELECT employee_id, skill_id, count(*), sum(score), sum(score * score), max(score),
+               max(CASE WHEN latest_rank = 1 THEN id END),
+               max(CASE WHEN latest_rank = 1 THEN score END),
+               max(CASE WHEN latest_rank = 1 THEN date END)
+        FROM (
+            SELECT employee_id, skill_id, id, score, date,
+                   row_number() OVER (PARTITION BY employee_id, skill_id
+                                      ORDER BY date DESC, id DESC) AS latest_rank
+            FROM scores
+        ) AS ranked
+        GROUP BY employee_id, skill_id
+    """)
+
+
+def downgrade() -> None:
+    pass
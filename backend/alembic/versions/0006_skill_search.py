@@ -0,0 +1,63 @@
+"""Full-text index over skill names and descriptions, and skills.category index.
+
+On SQLite, skills_fts is an FTS5 table kept in step with skills by
+triggers, so every write path (API, bulk inserts, plain SQL) stays
+searchable. It stores its own copy of the text rather than pointing at
+skills rowids, which VACUUM may renumber. Other databases search with
+LIKE and get no FTS table.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+TRIGGERS = {
+    "skills_fts_insert": """
+        CREATE TRIGGER skills_fts_insert AFTER INSERT ON skills BEGIN
+            INSERT INTO skills_fts (name, description, category, skill_id)
+            VALUES (new.name, coalesce(new.description, ''), new.category, new.id);
+        END""",
+    "skills_fts_update": """
+        CREATE TRIGGER skills_fts_update AFTER UPDATE OF id, name, description, category ON skills BEGIN
+            DELETE FROM skills_fts WHERE skill_id = old.id;
+            INSERT INTO skills_fts (name, description, category, skill_id)
+            VALUES (new.name, coalesce(new.description, ''), new.category, new.id);
+        END""",
+    "skills_fts_delete": """
+        CREATE TRIGGER skills_fts_delete AFTER DELETE ON skills BEGIN
+            DELETE FROM skills_fts WHERE skill_id = old.id;
+        END""",
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_skills_category", "skills", ["category"])
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    # Prefix indexes for 2 and 3 characters make short as-you-type prefixes
+    # cheap; longer prefixes use the main index.
+    op.execute("""
+        CREATE VIRTUAL TABLE skills_fts USING fts5(
+            name, description, category UNINDEXED, skill_id UNINDEXED,
+            prefix = '2 3', tokenize = 'unicode61 remove_diacritics 2'
+        )""")
+    op.execute("""
+        INSERT INTO skills_fts (name, description, category, skill_id)
+        SELECT name, coalesce(description, ''), category, id FROM skills""")
+    for trigger in TRIGGERS.values():
+        op.execute(trigger)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for name in TRIGGERS:
+            op.execute(f"DROP TRIGGER {name}")
+        op.execute("DROP TABLE skills_fts")
+    op.drop_index("ix_skills_category", table_name="skills")
@@ -0,0 +1,40 @@
+"""Per-user unread notification counter and the notification feed index.
+
+users.unread_notifications is maintained by the notification writes so the
+unread count is a primary-key read; it is backfilled here. The feed pages
+by (date, id) within a user, which the composite index serves without a
+sort (and makes the plain user_id index redundant).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 09:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("unread_notifications", sa.Integer(), nullable=False,
+                                     server_default="0"))
+    op.execute("UPDATE notifications SET read = false WHERE read IS NULL")
+    op.execute("""
+        UPDATE users SET unread_notifications = (
+            SELECT count(*) FROM notifications
+            WHERE notifications.user_id = users.id AND notifications.read = false
+        )
+    """)
+    op.create_index("ix_notifications_user_date_id", "notifications", ["user_id", "date", "id"])
+    op.drop_index("ix_notifications_user_id", table_name="notifications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_notifications_user_id", "notifications", ["user_id"])
+    op.drop_index("ix_notifications_user_date_id", table_name="notifications")
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("unread_notifications")
@@ -0,0 +1,50 @@
+"""Learning path listings and step order.
+
+An employee's paths and a manager's assigned paths page by id within their
+owner, which (employee_id, id) and (assigned_by, id) serve without a sort;
+they replace the single-column indexes from 0004. Steps get an explicit
+position, backfilled in order of creation, and (learning_path_id, position)
+replaces the plain learning_path_id index.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 09:00:00
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_learning_paths_employee_id_id", "learning_paths", ["employee_id", "id"])
+    op.create_index("ix_learning_paths_assigned_by_id", "learning_paths", ["assigned_by", "id"])
+    op.drop_index("ix_learning_paths_employee_id", table_name="learning_paths")
+    op.drop_index("ix_learning_paths_assigned_by", table_name="learning_paths")
+
+    op.add_column("learning_steps", sa.Column("position", sa.Integer(), nullable=False, server_default="0"))
+    op.execute("""
+        UPDATE learning_steps SET position = (
+            SELECT count(*) FROM learning_steps AS earlier
+            WHERE earlier.learning_path_id = learning_steps.learning_path_id
+              AND (earlier.created_at < learning_steps.created_at
+                   OR (earlier.created_at = learning_steps.created_at AND earlier.id < learning_steps.id))
+        )
+    """)
+    op.create_index("ix_learning_steps_path_position", "learning_steps", ["learning_path_id", "position"])
+    op.drop_index("ix_learning_steps_learning_path_id", table_name="learning_steps")
+
+
+def downgrade() -> None:
+    op.create_index("ix_learning_steps_learning_path_id", "learning_steps", ["learning_path_id"])
+    op.drop_index("ix_learning_steps_path_position", table_name="learning_steps")
+    with op.batch_alter_table("learning_steps") as batch:
+        batch.drop_column("position")
+    op.create_index("ix_learning_paths_employee_id", "learning_paths", ["employee_id"])
+    op.create_index("ix_learning_paths_assigned_by", "learning_paths", ["assigned_by"])
+    op.drop_index("ix_learning_paths_employee_id_id", table_name="learning_paths")
+    op.drop_index("ix_learning_paths_assigned_by_id", table_name="learning_paths")
@@ -1 +1 @@
-from . import auth, employees, trainers, skills, scores, managers 
\ No newline at end of file
+from . import auth, employees, trainers, skills, scores, managers, users, admin, exports, notifications, learning_paths 
\ No newline at end of file
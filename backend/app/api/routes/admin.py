@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from ...db.base import async_engine, engine, replicas
+from ...db.engine import pool_stats
+from ...db.session import get_db
+from ...db import crud
+from ...api.dependencies import get_current_super_user
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/db/pool")
+def get_pool_stats(current_user = Depends(get_current_super_user)):
+    """Live connection pool figures for the sync and async engines and any read replicas."""
+    return {
+        "sync": pool_stats(engine),
+        "async": pool_stats(async_engine),
+        "replicas": replicas.stats(),
+    }
+
+@router.get("/email-outbox")
+def get_email_outbox_stats(db: Session = Depends(get_db), current_user = Depends(get_current_super_user)):
+    """Pending and dead-lettered message counts, and when the oldest pending message was due."""
+    return crud.get_outbox_stats(db)
+
+@router.post("/email-outbox/requeue")
+def requeue_dead_emails(db: Session = Depends(get_db), current_user = Depends(get_current_super_user)):
+    """Retry every dead-lettered message from scratch (e.g. after fixing the SMTP settings)."""
+    return {"requeued": crud.requeue_dead_emails(db)}
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from ...db.session import get_db
-from ...core.security import authenticate_user, create_access_token
+from ...core.security import authenticate_user_async, create_access_token
 from ...schemas.auth import UserLogin, UserRegister, Token, UserResponse, LoginResponse
 from ...db import crud
-from ...utils.email import send_welcome_email
 from ...api.dependencies import get_current_user_dependency
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -24,8 +23,8 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
     # return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/login", response_model=LoginResponse)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    user = authenticate_user(db, user_credentials.email, user_credentials.password)
+async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+    user = await authenticate_user_async(db, user_credentials.email, user_credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -69,12 +68,10 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
         role=user_data.role,
         avatar=user_data.avatar,
         department=user_data.department,
-        experience=user_data.experience
+        experience=user_data.experience,
+        send_welcome=True
     )
     
-    # Send welcome email
-    send_welcome_email(user_data.email, user_data.name)
-    
     return UserResponse.model_validate(db_user)
 
 @router.get("/me", response_model=UserResponse)
@@ -1,43 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from ...db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ...db.session import get_async_db, get_async_read_db
+from ...utils.pagination import NEXT_CURSOR_HEADER, cursor_headers
+from ...utils.serialization import json_response
 from ...schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeWithScores
-from ...services.employee_service import EmployeeService
+from ...services.employee_service import AsyncEmployeeService
 from ...api.dependencies import get_current_manager, get_current_employee
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
 @router.post("/", response_model=EmployeeResponse)
-def create_employee(
+async def create_employee(
     employee_data: EmployeeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_manager)
 ):
     """Create a new employee."""
-    service = EmployeeService(db)
-    return service.create_employee(employee_data)
+    service = AsyncEmployeeService(db)
+    return await service.create_employee(employee_data)
 
 @router.get("/", response_model=List[EmployeeResponse])
-def get_employees(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+async def get_employees(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
-    """Get all employees."""
-    service = EmployeeService(db)
-    return service.get_employees(skip, limit)
+    """Get employees ordered by id. Pass the X-Next-Cursor response header back as ``cursor`` for the next page."""
+    service = AsyncEmployeeService(db)
+    try:
+        body, next_cursor = await service.get_employees(skip, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/with-scores", response_model=List[EmployeeWithScores])
+async def get_employees_with_scores(
+    response: Response,
+    ids: Optional[List[str]] = Query(None),
+    department: Optional[str] = None,
+    latest: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """
+    Get many employees with their scores (newest first), optionally only the
+    ``latest`` N per employee. Paged by the X-Next-Cursor response header.
+    """
+    service = AsyncEmployeeService(db)
+    try:
+        employees, next_cursor = await service.get_employees_with_scores(ids, department, latest, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return employees
 
 @router.get("/{employee_id}", response_model=EmployeeResponse)
-def get_employee(
+async def get_employee(
     employee_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get employee by ID."""
-    service = EmployeeService(db)
-    employee = service.get_employee(employee_id)
+    service = AsyncEmployeeService(db)
+    employee = await service.get_employee(employee_id)
     if not employee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -46,14 +77,14 @@ def get_employee(
     return employee
 
 @router.get("/{employee_id}/with-scores", response_model=EmployeeWithScores)
-def get_employee_with_scores(
+async def get_employee_with_scores(
     employee_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get employee with their scores."""
-    service = EmployeeService(db)
-    employee = service.get_employee_with_scores(employee_id)
+    service = AsyncEmployeeService(db)
+    employee = await service.get_employee_with_scores(employee_id)
     if not employee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -62,15 +93,15 @@ def get_employee_with_scores(
     return employee
 
 @router.put("/{employee_id}", response_model=EmployeeResponse)
-def update_employee(
+async def update_employee(
     employee_id: str,
     employee_data: EmployeeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_manager)
 ):
     """Update employee."""
-    service = EmployeeService(db)
-    employee = service.update_employee(employee_id, employee_data)
+    service = AsyncEmployeeService(db)
+    employee = await service.update_employee(employee_id, employee_data)
     if not employee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,14 +110,14 @@ def update_employee(
     return employee
 
 @router.delete("/{employee_id}")
-def delete_employee(
+async def delete_employee(
     employee_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_manager)
 ):
     """Delete employee."""
-    service = EmployeeService(db)
-    success = service.delete_employee(employee_id)
+    service = AsyncEmployeeService(db)
+    success = await service.delete_employee(employee_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -95,13 +126,13 @@ def delete_employee(
     return {"message": "Employee deleted successfully"}
 
 @router.get("/me/profile", response_model=EmployeeResponse)
-def get_my_profile(
-    db: Session = Depends(get_db),
+async def get_my_profile(
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_employee)
 ):
     """Get current employee's profile."""
-    service = EmployeeService(db)
-    employee = service.get_employee(current_user.id)
+    service = AsyncEmployeeService(db)
+    employee = await service.get_employee(current_user.id)
     if not employee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Callable, Iterator, Optional, Sequence
+from ...core.config import settings
+from ...db.session import read_session
+from ...schemas.user import UserRole
+from ...services.export_service import (
+    ExportService, learning_path_export, score_export, user_export,
+)
+from ...utils.export import ExportFormat, export_response
+from ...utils.serialization import RowListEncoder
+from ...api.dependencies import get_current_manager
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+# An export reads for as long as its body streams. The session is owned by
+# the stream rather than a get_read_db dependency, whose cleanup may run
+# before a streamed body is finished, and is closed when the stream ends or
+# the client goes away.
+def stream_export(request: Request, format: ExportFormat, filename: str, encoder: RowListEncoder,
+                  batches: Callable[[ExportService], Iterator[Sequence]]) -> StreamingResponse:
+    db = read_session(request)
+    
+    def rows():
+        try:
+            yield from batches(ExportService(db))
+        finally:
+            db.close()
+    
+    return export_response(request, rows(), encoder, format, filename, settings.export_gzip_level)
+
+@router.get("/scores")
+def export_scores(
+    request: Request,
+    format: ExportFormat = "ndjson",
+    employee_id: Optional[str] = None,
+    skill_id: Optional[str] = None,
+    trainer_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    current_user = Depends(get_current_manager)
+):
+    """Stream every matching score, newest first, with skill, trainer and employee names."""
+    return stream_export(request, format, "scores", score_export, lambda service: service.score_batches(
+        employee_id, skill_id, trainer_id, date_from, date_to))
+
+@router.get("/users")
+def export_users(
+    request: Request,
+    format: ExportFormat = "ndjson",
+    role: Optional[UserRole] = None,
+    current_user = Depends(get_current_manager)
+):
+    """Stream every user (optionally of one role) by id."""
+    return stream_export(request, format, "users", user_export,
+                         lambda service: service.user_batches(role))
+
+@router.get("/learning-paths")
+def export_learning_paths(
+    request: Request,
+    format: ExportFormat = "ndjson",
+    employee_id: Optional[str] = None,
+    current_user = Depends(get_current_manager)
+):
+    """Stream every learning path by id with the employee's and assigner's names."""
+    return stream_export(request, format, "learning-paths", learning_path_export,
+                         lambda service: service.learning_path_batches(employee_id))
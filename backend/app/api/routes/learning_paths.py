@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ...db import crud
+from ...db.session import get_db, get_read_db
+from ...schemas.learning_path import (
+    LearningPathCreate, LearningPathDetail, LearningPathProgress, LearningStepUpdate, TeamMemberProgress,
+)
+from ...services.learning_path_service import LearningPathService
+from ...utils.pagination import cursor_headers
+from ...utils.serialization import json_response
+from ...api.dependencies import get_current_manager, get_current_user_dependency
+
+router = APIRouter(prefix="/learning-paths", tags=["learning-paths"])
+
+def can_view(current_user, employee_id: str) -> bool:
+    """Employees see their own paths; managers and super users see everyone's."""
+    return current_user.id == employee_id or current_user.role in ["manager", "super-user"]
+
+def path_page(service: LearningPathService, cursor: Optional[str], limit: int, **filters):
+    try:
+        body, next_cursor = service.get_paths(cursor=cursor, limit=limit, **filters)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/me", response_model=List[LearningPathProgress])
+def get_my_learning_paths(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Get the current user's learning paths with their progress."""
+    return path_page(LearningPathService(db), cursor, limit, employee_id=current_user.id)
+
+@router.get("/assigned", response_model=List[LearningPathProgress])
+def get_assigned_learning_paths(
+    employee_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """Get the learning paths the current manager assigned, optionally to one employee."""
+    return path_page(LearningPathService(db), cursor, limit, assigned_by=current_user.id, employee_id=employee_id)
+
+@router.get("/team", response_model=List[TeamMemberProgress])
+def get_team_progress(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """Get each employee's progress over the learning paths the current manager assigned them."""
+    service = LearningPathService(db)
+    try:
+        body, next_cursor = service.get_team_progress(current_user.id, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/employee/{employee_id}", response_model=List[LearningPathProgress])
+def get_employee_learning_paths(
+    employee_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """Get an employee's learning paths with their progress."""
+    return path_page(LearningPathService(db), cursor, limit, employee_id=employee_id)
+
+@router.get("/{path_id}", response_model=LearningPathDetail)
+def get_learning_path(
+    path_id: str,
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Get a learning path with its progress and steps."""
+    path = LearningPathService(db).get_path(path_id)
+    if not path or not can_view(current_user, path.employee_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning path not found")
+    return path
+
+@router.post("/", response_model=LearningPathDetail, status_code=status.HTTP_201_CREATED)
+def create_learning_path(
+    path_in: LearningPathCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_manager)
+):
+    """Assign a learning path with its steps to an employee, who is notified."""
+    path = LearningPathService(db).create_path(path_in, current_user.id)
+    if not path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
+    return path
+
+@router.put("/{path_id}/steps/{step_id}", response_model=LearningPathDetail)
+def update_learning_step(
+    path_id: str,
+    step_id: str,
+    step_in: LearningStepUpdate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Mark a step of a learning path done or not done; returns the path with its new progress."""
+    db_path = crud.get_learning_path(db, path_id)
+    if not db_path or not can_view(current_user, db_path.employee_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning path not found")
+    path = LearningPathService(db).set_step_completed(path_id, step_id, step_in.completed)
+    if not path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Learning step not found")
+    return path
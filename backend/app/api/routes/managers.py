@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
-from ...db.session import get_db
+from typing import List, Optional
+from ...db.session import get_db, get_read_db
+from ...utils.pagination import cursor_headers
+from ...utils.serialization import json_response
 from ...schemas.manager import ManagerCreate, ManagerUpdate, ManagerOut
 from ...services.manager_service import ManagerService
 from ...api.dependencies import get_current_super_user
@@ -10,18 +12,23 @@ router = APIRouter(prefix="/managers", tags=["managers"])
 
 @router.get("/", response_model=List[ManagerOut])
 def get_managers(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_super_user)
 ):
     service = ManagerService(db)
-    return service.get_all_managers(skip, limit)
+    try:
+        body, next_cursor = service.get_all_managers(skip, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
 
 @router.get("/{manager_id}", response_model=ManagerOut)
 def get_manager(
     manager_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_super_user)
 ):
     service = ManagerService(db)
@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, List, Optional
+from ...core.config import settings
+from ...db.base import AsyncSessionLocal
+from ...db.session import get_db, get_read_db
+from ...schemas.notification import (
+    NotificationMarkRead, NotificationReadResult, NotificationResponse, UnreadCount,
+)
+from ...services.notification_broker import Subscription, notification_broker
+from ...services.notification_service import AsyncNotificationService, NotificationService
+from ...utils.pagination import cursor_headers
+from ...utils.serialization import json_response
+from ...utils.sse import KEEP_ALIVE, format_event
+from ...api.dependencies import get_current_user_dependency
+
+router = APIRouter(prefix="/notifications", tags=["notifications"])
+
+@router.get("/", response_model=List[NotificationResponse])
+def get_notifications(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    unread_only: bool = False,
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """
+    Get the current user's notifications, newest first. Pass the
+    X-Next-Cursor header of a page as ``cursor`` to get the next one.
+    """
+    service = NotificationService(db)
+    body, next_cursor = service.get_notifications(current_user.id, cursor, limit, unread_only)
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/unread-count", response_model=UnreadCount)
+def get_unread_count(
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Get the current user's number of unread notifications."""
+    service = NotificationService(db)
+    return service.get_unread_count(current_user.id)
+
+@router.post("/read", response_model=NotificationReadResult)
+def mark_notifications_read(
+    mark: NotificationMarkRead,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Mark all of the current user's notifications read, or those up to ``up_to_id``."""
+    service = NotificationService(db)
+    result = service.mark_all_read(current_user.id, mark.up_to_id)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
+    return result
+
+@router.put("/{notification_id}/read", response_model=NotificationResponse)
+def mark_notification_read(
+    notification_id: str,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user_dependency)
+):
+    """Mark one of the current user's notifications read."""
+    service = NotificationService(db)
+    notification = service.mark_read(current_user.id, notification_id)
+    if not notification:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification not found"
+        )
+    return notification
+
+async def notification_events(subscription: Subscription, unread: UnreadCount,
+                              heartbeat: float) -> AsyncIterator[bytes]:
+    """
+    The body of an event stream: the unread count, then each event published
+    for the user, with a keep-alive comment after ``heartbeat`` idle seconds.
+    Unsubscribes when the client goes away or the broker closes.
+    """
+    try:
+        yield format_event("unread", unread.model_dump_json())
+        while True:
+            try:
+                event = await subscription.get(heartbeat)
+            except EOFError:
+                return
+            yield KEEP_ALIVE if event is None else format_event(*event)
+    finally:
+        notification_broker.unsubscribe(subscription)
+
+@router.get("/stream")
+async def stream_notifications(
+    current_user = Depends(get_current_user_dependency)
+):
+    """
+    Server-sent events for the current user: ``unread`` with the new count
+    whenever it changes, ``notification`` for each new one, and ``resync``
+    when the stream fell too far behind and the feed should be refetched.
+    """
+    # Subscribe before reading the count so no change can fall in between.
+    # The count is read from the primary in a session of its own: a session
+    # dependency would hold its connection for as long as the stream is open.
+    subscription = notification_broker.subscribe(current_user.id)
+    try:
+        async with AsyncSessionLocal() as db:
+            unread = await AsyncNotificationService(db).get_unread_count(current_user.id)
+    except BaseException:
+        notification_broker.unsubscribe(subscription)
+        raise
+    return StreamingResponse(
+        notification_events(subscription, unread, settings.notification_stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,53 +1,166 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from ...db.session import get_db
-from ...schemas.score import ScoreCreate, ScoreUpdate, ScoreResponse, ScoreWithDetails
-from ...services.score_service import ScoreService
+from datetime import datetime
+from typing import List, Optional
+from ...db.session import get_async_db, get_async_read_db, get_db
+from ...core.config import settings
+from ...utils.ingest import UploadTooLarge, parse_records, read_upload
+from ...utils.pagination import NEXT_CURSOR_HEADER, cursor_headers
+from ...utils.serialization import json_response
+from ...schemas.score import (
+    ScoreCreate, ScoreUpdate, ScoreResponse, ScoreWithDetails, ScoreAggregate, ScoreGroupBy,
+    ScoreBulkResult,
+    SkillMatrixEntryResponse,
+)
+from ...services.score_service import AsyncScoreService, ScoreService
+from ...services.score_aggregation_service import AsyncScoreAggregationService
+from ...services.skill_matrix_service import AsyncSkillMatrixService
 from ...api.dependencies import get_current_trainer, get_current_manager
 
 router = APIRouter(prefix="/scores", tags=["scores"])
 
 @router.post("/", response_model=ScoreResponse)
-def create_score(
+async def create_score(
     score_data: ScoreCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_trainer)
 ):
     """Create a new score."""
+    service = AsyncScoreService(db)
+    return await service.create_score(score_data)
+
+@router.post("/bulk", response_model=ScoreBulkResult)
+async def bulk_create_scores(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_trainer)
+):
+    """
+    Create many scores from a JSON array, NDJSON or CSV body (by Content-Type)
+    in one transaction. ``trainer_id`` defaults to the current trainer; rows
+    that fail validation are listed in ``errors`` and the rest are stored.
+    """
+    try:
+        body = await read_upload(request, settings.score_bulk_max_bytes)
+    except UploadTooLarge as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+    try:
+        records = parse_records(request.headers.get("content-type", ""), body)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if len(records) > settings.score_bulk_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.score_bulk_max_rows} rows per upload"
+        )
     service = ScoreService(db)
-    return service.create_score(score_data)
+    return await run_in_threadpool(service.bulk_create_scores, records, current_user.id)
 
 @router.get("/", response_model=List[ScoreResponse])
-def get_scores(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+async def get_scores(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skill_id: Optional[str] = None,
+    trainer_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
-    """Get all scores."""
-    service = ScoreService(db)
-    return service.get_scores(skip, limit)
+    """Get scores newest first. Pass the X-Next-Cursor response header back as ``cursor`` for the next page."""
+    service = AsyncScoreService(db)
+    try:
+        body, next_cursor = await service.get_scores(skip, limit, cursor, skill_id, trainer_id, date_from, date_to)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/details", response_model=List[ScoreWithDetails])
+async def get_scores_with_details(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    employee_id: Optional[str] = None,
+    skill_id: Optional[str] = None,
+    trainer_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """Get scores with skill, trainer and employee names, newest first, paged by the X-Next-Cursor header."""
+    service = AsyncScoreService(db)
+    try:
+        body, next_cursor = await service.get_scores_with_details(
+            limit, cursor, employee_id, skill_id, trainer_id, date_from, date_to
+        )
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
+
+@router.get("/aggregate", response_model=List[ScoreAggregate])
+async def aggregate_scores(
+    group_by: List[ScoreGroupBy] = Query([]),
+    employee_id: Optional[str] = None,
+    skill_id: Optional[str] = None,
+    trainer_id: Optional[str] = None,
+    department: Optional[str] = None,
+    category: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """
+    Count, average, min, max, standard deviation and latest score for every
+    combination of the ``group_by`` keys (repeat the parameter to combine them).
+    """
+    service = AsyncScoreAggregationService(db)
+    return await service.aggregate(group_by, employee_id, skill_id, trainer_id,
+                             department, category, date_from, date_to)
+
+@router.get("/matrix", response_model=List[SkillMatrixEntryResponse])
+async def get_skill_matrix(
+    response: Response,
+    employee_id: Optional[str] = None,
+    skill_id: Optional[str] = None,
+    department: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_manager)
+):
+    """Latest and best score per employee and skill, paged by the X-Next-Cursor header."""
+    service = AsyncSkillMatrixService(db)
+    try:
+        cells, next_cursor = await service.get_matrix(employee_id, skill_id, department, cursor, limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return cells
 
 @router.get("/employee/{employee_id}", response_model=List[ScoreResponse])
-def get_scores_by_employee(
+async def get_scores_by_employee(
     employee_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get scores for a specific employee."""
-    service = ScoreService(db)
-    return service.get_scores_by_employee(employee_id)
+    service = AsyncScoreService(db)
+    return json_response(await service.get_scores_by_employee(employee_id))
 
 @router.get("/{score_id}", response_model=ScoreResponse)
-def get_score(
+async def get_score(
     score_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get score by ID."""
-    service = ScoreService(db)
-    score = service.get_score(score_id)
+    service = AsyncScoreService(db)
+    score = await service.get_score(score_id)
     if not score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,14 +169,14 @@ def get_score(
     return score
 
 @router.get("/{score_id}/details", response_model=ScoreWithDetails)
-def get_score_with_details(
+async def get_score_with_details(
     score_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get score with additional details."""
-    service = ScoreService(db)
-    score = service.get_score_with_details(score_id)
+    service = AsyncScoreService(db)
+    score = await service.get_score_with_details(score_id)
     if not score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,15 +185,15 @@ def get_score_with_details(
     return score
 
 @router.put("/{score_id}", response_model=ScoreResponse)
-def update_score(
+async def update_score(
     score_id: str,
     score_data: ScoreUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_trainer)
 ):
     """Update score."""
-    service = ScoreService(db)
-    score = service.update_score(score_id, score_data)
+    service = AsyncScoreService(db)
+    score = await service.update_score(score_id, score_data)
     if not score:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,14 +202,14 @@ def update_score(
     return score
 
 @router.delete("/{score_id}")
-def delete_score(
+async def delete_score(
     score_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_manager)
 ):
     """Delete score."""
-    service = ScoreService(db)
-    success = service.delete_score(score_id)
+    service = AsyncScoreService(db)
+    success = await service.delete_score(score_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -105,14 +218,14 @@ def delete_score(
     return {"message": "Score deleted successfully"}
 
 @router.get("/employee/{employee_id}/average")
-def get_employee_average_score(
+async def get_employee_average_score(
     employee_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get average score for an employee."""
-    service = ScoreService(db)
-    average = service.get_employee_average_score(employee_id)
+    service = AsyncScoreService(db)
+    average = await service.get_employee_average_score(employee_id)
     if average is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
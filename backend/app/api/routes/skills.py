@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from ...db.session import get_db
-from ...schemas.skill import SkillCreate, SkillUpdate, SkillResponse
+from typing import List, Optional
+from ...db.session import get_db, get_read_db
+from ...schemas.skill import SkillCreate, SkillSearchResult, SkillUpdate, SkillResponse
 from ...services.skill_service import SkillService
+from ...services.skill_catalog import SkillCatalog, skill_catalog
 from ...api.dependencies import get_current_manager
 
 router = APIRouter(prefix="/skills", tags=["skills"])
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def catalog_response(request: Request, catalog: SkillCatalog, body: bytes) -> Response:
+    """
+    Pre-encoded catalog JSON tagged with the catalog version; a client that
+    already holds this version gets an empty 304.
+    """
+    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), catalog.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.post("/", response_model=SkillResponse)
 def create_skill(
     skill_data: SkillCreate,
@@ -20,37 +37,49 @@ def create_skill(
 
 @router.get("/", response_model=List[SkillResponse])
 def get_skills(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = 100
 ):
-    """Get all skills."""
+    """Get all skills (served from the in-memory catalog)."""
+    catalog = skill_catalog.get()
+    return catalog_response(request, catalog, catalog.page_json(skip, limit))
+
+@router.get("/search", response_model=SkillSearchResult)
+def search_skills(
+    q: str = Query(..., min_length=1, max_length=200),
+    category: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """Search skills by name and description; every word matches as a prefix."""
     service = SkillService(db)
-    return service.get_skills(skip, limit)
+    return service.search_skills(q, category, skip, limit)
 
 @router.get("/category/{category}", response_model=List[SkillResponse])
 def get_skills_by_category(
-    category: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    category: str
 ):
     """Get skills by category."""
-    service = SkillService(db)
-    return service.get_skills_by_category(category)
+    catalog = skill_catalog.get()
+    return catalog_response(request, catalog, catalog.category_json(category))
 
 @router.get("/{skill_id}", response_model=SkillResponse)
 def get_skill(
-    skill_id: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    skill_id: str
 ):
     """Get skill by ID."""
-    service = SkillService(db)
-    skill = service.get_skill(skill_id)
-    if not skill:
+    catalog = skill_catalog.get()
+    body = catalog.skill_json(skill_id)
+    if body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Skill not found"
         )
-    return skill
+    return catalog_response(request, catalog, body)
 
 @router.put("/{skill_id}", response_model=SkillResponse)
 def update_skill(
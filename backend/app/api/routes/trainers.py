@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
-from ...db.session import get_db
+from datetime import datetime
+from typing import List, Optional
+from ...db.session import get_db, get_read_db
+from ...utils.pagination import cursor_headers
+from ...utils.serialization import json_response
 from ...schemas.trainer import TrainerCreate, TrainerUpdate, TrainerResponse
+from ...schemas.score import ScoreWithDetails
 from ...services.trainer_service import TrainerService
+from ...services.score_service import ScoreService
 from ...api.dependencies import get_current_manager, get_current_trainer
 
 router = APIRouter(prefix="/trainers", tags=["trainers"])
@@ -20,19 +25,24 @@ def create_trainer(
 
 @router.get("/", response_model=List[TrainerResponse])
 def get_trainers(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_manager)
 ):
-    """Get all trainers."""
+    """Get trainers ordered by id. Pass the X-Next-Cursor response header back as ``cursor`` for the next page."""
     service = TrainerService(db)
-    return service.get_trainers(skip, limit)
+    try:
+        body, next_cursor = service.get_trainers(skip, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
 
 @router.get("/{trainer_id}", response_model=TrainerResponse)
 def get_trainer(
     trainer_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_manager)
 ):
     """Get trainer by ID."""
@@ -80,7 +90,7 @@ def delete_trainer(
 
 @router.get("/me/profile", response_model=TrainerResponse)
 def get_my_profile(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user = Depends(get_current_trainer)
 ):
     """Get current trainer's profile."""
@@ -91,4 +101,25 @@ def get_my_profile(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Trainer not found"
         )
-    return trainer 
\ No newline at end of file
+    return trainer
+
+@router.get("/me/activity", response_model=List[ScoreWithDetails])
+def get_my_activity(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    employee_id: Optional[str] = None,
+    skill_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_trainer)
+):
+    """Scores given by the current trainer, newest first, paged by the X-Next-Cursor header."""
+    service = ScoreService(db)
+    try:
+        body, next_cursor = service.get_scores_with_details(
+            limit, cursor, employee_id, skill_id, current_user.id, date_from, date_to
+        )
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return json_response(body, cursor_headers(next_cursor))
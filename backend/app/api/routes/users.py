@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from ...db.session import get_db
+from ...core.config import settings
+from ...utils.ingest import UploadTooLarge, parse_records, read_upload
+from ...schemas.user import UserImportResult
+from ...services.user_import_service import UserImportService
+from ...api.dependencies import get_current_super_user
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+@router.post("/import", response_model=UserImportResult)
+async def import_users(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_super_user)
+):
+    """
+    Create users from a CSV body (email, name, password, role, department,
+    experience, avatar columns); JSON arrays and NDJSON are accepted too.
+    Already registered emails are skipped.
+    """
+    try:
+        body = await read_upload(request, settings.user_import_max_bytes)
+    except UploadTooLarge as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+    try:
+        records = parse_records(request.headers.get("content-type", ""), body)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if len(records) > settings.user_import_max_rows:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.user_import_max_rows} rows per upload; use import_users.py for more"
+        )
+    service = UserImportService(db)
+    return await run_in_threadpool(service.import_users, records)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 import os
 from dotenv import load_dotenv
 
@@ -8,20 +8,101 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./skills_tracking.db"
+    # Used by the async routes; derived from database_url when unset
+    # (sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg).
+    async_database_url: Optional[str] = None
+    
+    # Read replicas for GET routes (comma-separated URLs; async URLs are
+    # derived the same way as async_database_url). Callers that committed a
+    # write within read_your_writes_seconds keep reading from the primary.
+    database_replica_urls: Optional[str] = None
+    replica_check_interval_seconds: float = 5.0
+    read_your_writes_seconds: float = 5.0
+    
+    # Run pending migrations at startup instead of refusing to start.
+    db_auto_migrate: bool = False
+    
+    # Engine profile: "tuned" applies the pool and SQLite settings below,
+    # "default" leaves SQLAlchemy's defaults.
+    db_engine_profile: Literal["tuned", "default"] = "tuned"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    # Server databases only
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    # SQLite only, applied to every new connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size_mb: int = 256
     
     # Security
     secret_key: str = "your-super-secret-key-change-this-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
+    # Authenticated-user cache (0 disables it)
+    user_cache_max_size: int = 10000
+    user_cache_ttl_seconds: float = 30.0
+    
+    # In-memory skills catalog; other workers' skill writes show up once a
+    # snapshot is this old (0: only on this process's writes)
+    skill_catalog_max_age_seconds: float = 60.0
+    
+    # Password hashing (workers: None = one per CPU, 0 = hash inline)
+    bcrypt_rounds: int = 12
+    password_hash_workers: Optional[int] = None
+    
+    # Bulk score uploads
+    score_bulk_max_rows: int = 50000
+    score_bulk_max_bytes: int = 10 * 1024 * 1024
+    score_bulk_chunk_size: int = 1000
+    
+    # Notification event streams: comment line sent to idle streams this
+    # often, and events queued per stream before it is told to resync
+    notification_stream_heartbeat_seconds: float = 15.0
+    notification_stream_max_queued: int = 100
+    
+    # Streaming exports: rows fetched per round trip, and the gzip level
+    # used when the client sends Accept-Encoding: gzip
+    export_batch_size: int = 1000
+    export_gzip_level: int = 6
+    
+    # Bulk user imports (each row costs a bcrypt hash)
+    user_import_max_rows: int = 20000
+    user_import_max_bytes: int = 10 * 1024 * 1024
+    
+    # Request metrics on /metrics, and statements slower than slow_query_ms
+    # logged (logger "app.sql") with the route that issued them
+    metrics_enabled: bool = True
+    slow_query_ms: float = 200.0
+    
     # CORS
     frontend_url: str = "http://localhost:8081"
     
-    # Email (for future use)
+    # Email: messages are printed instead of sent while smtp_host is unset
     smtp_host: Optional[str] = None
     smtp_port: Optional[int] = None
     smtp_user: Optional[str] = None
     smtp_password: Optional[str] = None
+    smtp_starttls: bool = False
+    smtp_timeout_seconds: float = 10.0
+    email_from: str = "noreply@skills-portal.local"
+    
+    # Email outbox worker: run it in this process, messages per batch, how
+    # long it sleeps when the outbox is empty, and retries (delay doubling
+    # from email_retry_base_seconds up to email_retry_max_seconds) before a
+    # message is dead-lettered. A claimed batch is left to other workers
+    # after email_claim_seconds, in case this one died mid-batch.
+    email_outbox_worker: bool = True
+    email_batch_size: int = 50
+    email_poll_seconds: float = 5.0
+    email_max_attempts: int = 8
+    email_retry_base_seconds: float = 30.0
+    email_retry_max_seconds: float = 3600.0
+    email_claim_seconds: float = 300.0
     
     # Environment
     environment: str = "development"
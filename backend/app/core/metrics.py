@@ -0,0 +1,229 @@
+import bisect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .config import settings
+
+logger = logging.getLogger("app.sql")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+class Histogram:
+    """Bucket counts, sum and count of observations; updated under the owning Metrics' lock."""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        # bisect_left puts a value equal to a bound in that bound's bucket ("le").
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class RequestStats:
+    """The SQL one request has issued so far."""
+    __slots__ = ("scope", "statements", "db_seconds")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.statements = 0
+        self.db_seconds = 0.0
+
+# Set by MetricsMiddleware for the duration of a request. Starlette copies the
+# context into the threadpool and run_sync keeps it, so the engine hooks see
+# it from sync and async routes alike.
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+def route_label(scope: dict) -> str:
+    """The matched route's path template, so /employees/{employee_id} is one series."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+class Metrics:
+    """
+    Request and SQL figures for the /metrics endpoint, kept per process.
+
+    Recording is a few dict lookups and additions under one lock, so it
+    costs microseconds per request; everything is formatted only when
+    /metrics is scraped.
+    """
+
+    def __init__(self, slow_query_seconds: float):
+        self.slow_query_seconds = slow_query_seconds
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.statements: Dict[str, Histogram] = {}
+        self.db_time: Dict[str, Histogram] = {}
+        self.slow_queries: Dict[str, int] = {}
+        # Statements issued outside any request (startup, background workers).
+        self.background_statements = 0
+        self.background_db_seconds = 0.0
+        # Components' own stats() read at scrape time: (prefix, stats, {key: (type, help)}).
+        self._collectors: List[Tuple[str, Callable[[], Dict[str, float]], Dict[str, Tuple[str, str]]]] = []
+
+    def add_stats(self, prefix: str, stats: Callable[[], Dict[str, float]],
+                  series: Dict[str, Tuple[str, str]]) -> None:
+        """
+        Also export the ``series`` keys of ``stats()``, as ``{key: (type,
+        help)}`` with type "gauge" or "counter", named ``<prefix>_<key>``
+        (counters get ``_total``). ``stats`` is called on every scrape.
+        """
+        self._collectors.append((prefix, stats, series))
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, method: str, route: str, status: int, seconds: float,
+                         stats: RequestStats) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            key = (method, route, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            latency = self.latency.get((method, route))
+            if latency is None:
+                latency = self.latency[(method, route)] = Histogram(LATENCY_BUCKETS)
+            statements = self.statements.get(route)
+            if statements is None:
+                statements = self.statements[route] = Histogram(STATEMENT_BUCKETS)
+                self.db_time[route] = Histogram(LATENCY_BUCKETS)
+            latency.observe(seconds)
+            statements.observe(stats.statements)
+            self.db_time[route].observe(stats.db_seconds)
+
+    def query_finished(self, statement: str, seconds: float) -> None:
+        stats = current_request.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += seconds
+        else:
+            with self._lock:
+                self.background_statements += 1
+                self.background_db_seconds += seconds
+        if seconds >= self.slow_query_seconds:
+            route = route_label(stats.scope) if stats is not None else "background"
+            with self._lock:
+                self.slow_queries[route] = self.slow_queries.get(route, 0) + 1
+            logger.warning("Slow query (%.0f ms) on %s: %s", seconds * 1000, route, " ".join(statement.split()))
+
+    def render(self) -> str:
+        """All figures in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                "# HELP http_requests_in_flight Requests being served, including open streams.",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self.in_flight}",
+                "# HELP http_requests_total Requests served, by route and status code.",
+                "# TYPE http_requests_total counter",
+            ]
+            lines += [f"http_requests_total{_labels(method=method, route=route, status=str(status))} {count}"
+                      for (method, route, status), count in sorted(self.requests.items())]
+            lines += self._histogram("http_request_duration_seconds", "Time to serve a request, body included.",
+                                     ((dict(method=m, route=r), h) for (m, r), h in sorted(self.latency.items())))
+            lines += self._histogram("db_statements_per_request", "SQL statements issued by one request.",
+                                     ((dict(route=r), h) for r, h in sorted(self.statements.items())))
+            lines += self._histogram("db_seconds_per_request", "Time one request spent executing SQL.",
+                                     ((dict(route=r), h) for r, h in sorted(self.db_time.items())))
+            lines += [
+                f"# HELP db_slow_queries_total Statements slower than {self.slow_query_seconds:g}s.",
+                "# TYPE db_slow_queries_total counter",
+            ]
+            lines += [f"db_slow_queries_total{_labels(route=route)} {count}"
+                      for route, count in sorted(self.slow_queries.items())]
+            lines += [
+                "# HELP db_background_statements_total SQL statements issued outside requests.",
+                "# TYPE db_background_statements_total counter",
+                f"db_background_statements_total {self.background_statements}",
+                "# HELP db_background_seconds_total Time spent executing SQL outside requests.",
+                "# TYPE db_background_seconds_total counter",
+                f"db_background_seconds_total {self.background_db_seconds:.6f}",
+            ]
+            collectors = list(self._collectors)
+        # Outside our lock: each stats() takes its owner's.
+        for prefix, stats, series in collectors:
+            values = stats()
+            for key, (kind, help) in series.items():
+                name = f"{prefix}_{key}" + ("_total" if kind == "counter" else "")
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}", f"{name} {values[key]:g}"]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram(name: str, help: str, series: Iterable[Tuple[Dict[str, str], Histogram]]) -> List[str]:
+        lines = [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+        for labels, histogram in series:
+            cumulative = 0
+            bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+        return lines
+
+metrics = Metrics(slow_query_seconds=settings.slow_query_ms / 1000)
+
+class MetricsMiddleware:
+    """
+    Times every HTTP request (until its last body chunk is sent) and records
+    it with its status and the SQL it issued. A plain ASGI middleware rather
+    than BaseHTTPMiddleware, which would buffer streamed responses through a
+    task and cost far more per request.
+    """
+
+    def __init__(self, app, metrics: Metrics = metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats(scope)
+        token = current_request.set(stats)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.request_started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.request_finished(scope["method"], route_label(scope), status,
+                                          time.perf_counter() - start, stats)
+            current_request.reset(token)
+
+# Every engine: the primary, the async engine's sync core and the replicas.
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _finish_statement(conn, cursor, statement, parameters, context, executemany):
+    metrics.query_finished(statement, time.perf_counter() - conn.info["statement_start"].pop())
+
+@event.listens_for(Engine, "handle_error")
+def _fail_statement(exception_context):
+    starts = exception_context.connection.info.get("statement_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
@@ -1,11 +1,14 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from ..core.config import settings
-from ..utils.password import verify_password
+from ..utils.password import password_hasher
+from ..db import crud
 from ..db.models import User
-from ..db.session import get_db
+from ..db.base import SessionLocal
+from .cache import user_cache
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
@@ -29,11 +32,31 @@ def verify_token(token: str) -> Optional[dict]:
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate a user with email and password."""
-    user = db.query(User).filter(User.email == email).first()
+    user = crud.get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    valid, new_hash = password_hasher.verify_and_update(password, user.hashed_password)
+    if not valid:
         return None
+    if new_hash:
+        user = crud.update_user(db, user.id, hashed_password=new_hash)
+    return user
+
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+    """
+    Same as authenticate_user, but awaits the hashing pool so a login storm
+    does not tie up the request threadpool. Database calls still run in the
+    threadpool because the session is synchronous.
+    """
+    user = await run_in_threadpool(crud.get_user_by_email, db, email)
+    if not user:
+        return None
+    valid, new_hash = await password_hasher.averify_and_update(password, user.hashed_password)
+    if not valid:
+        return None
+    if new_hash:
+        # Transparent upgrade when settings.bcrypt_rounds has changed.
+        user = await run_in_threadpool(crud.update_user, db, user.id, hashed_password=new_hash)
     return user
 
 def get_current_user(token: str) -> Optional[User]:
@@ -46,6 +69,15 @@ def get_current_user(token: str) -> Optional[User]:
     if user_id is None:
         return None
     
-    db = next(get_db())
-    user = db.query(User).filter(User.id == user_id).first()
-    return user 
\ No newline at end of file
+    return user_cache.get_or_load(user_id, _load_user)
+
+def _load_user(user_id: str) -> Optional[User]:
+    """Load a user in a short-lived session and detach it so it can be cached."""
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            db.expunge(user)
+        return user
+    finally:
+        db.close() 
\ No newline at end of file
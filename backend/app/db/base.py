@@ -1,13 +1,35 @@
-from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
+from .engine import create_async_db_engine, create_db_engine
+from .replicas import ReplicaSet
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
+# Async drivers for the dialects we run on; other URLs are used as given.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def async_database_url(url: str) -> str:
+    """Return ``url`` with its driver swapped for the async one (sqlite -> aiosqlite, postgresql -> asyncpg)."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    return parsed.set(drivername=driver).render_as_string(hide_password=False) if driver else url
+
+engine = create_db_engine(settings.database_url)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base() 
\ No newline at end of file
+async_engine = create_async_db_engine(settings.async_database_url or async_database_url(settings.database_url))
+
+# expire_on_commit=False: services build their responses inside run_sync,
+# but nothing should lazy-load from an expired row on the event loop.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+replica_urls = [url.strip() for url in (settings.database_replica_urls or "").split(",") if url.strip()]
+replicas = ReplicaSet.from_urls(replica_urls, [async_database_url(url) for url in replica_urls],
+                                settings.replica_check_interval_seconds)
+
+Base = declarative_base()
@@ -1,7 +1,34 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import re
+from collections import Counter
+from sqlalchemy import Select, String, and_, case, column, delete, func, insert, literal_column, or_, select, table, type_coerce
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from . import models
+from ..utils.email import welcome_email
 from ..utils.password import get_password_hash
+from ..core.cache import user_cache
+
+def get_existing_ids(db: Session, id_column, ids: Iterable[str], *criteria,
+                     chunk_size: int = 500) -> Set[str]:
+    """Return the members of ``ids`` (ids, emails, ...) found in ``id_column`` and matching ``criteria``."""
+    ids = list(set(ids))
+    found = set()
+    for start in range(0, len(ids), chunk_size):
+        query = select(id_column).where(id_column.in_(ids[start:start + chunk_size]), *criteria)
+        found.update(db.execute(query).scalars())
+    return found
+
+def stream_rows(db: Session, statement, batch_size: int = 1000) -> Iterator[Sequence]:
+    """
+    Rows of ``statement`` in lists of up to ``batch_size``, fetched from a
+    server-side cursor as they are consumed, so memory stays flat whatever
+    the table size. The session must stay open until iteration ends.
+    """
+    return db.execute(statement.execution_options(yield_per=batch_size)).partitions()
 
 # User CRUD
 def get_user(db: Session, user_id: str) -> Optional[models.User]:
@@ -13,10 +40,83 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[models.User]:
     return db.query(models.User).offset(skip).limit(limit).all()
 
+def get_users_by_role(db: Session, role: str, after_id: Optional[str] = None,
+                      skip: int = 0, limit: int = 100, columns: Sequence = ()) -> list:
+    """
+    Users with ``role`` ordered by id, starting after ``after_id`` (keyset
+    pagination). Given ``columns``, rows of just those columns instead of
+    User objects.
+    """
+    query = db.query(*columns) if columns else db.query(models.User)
+    query = query.filter(models.User.role == role)
+    if after_id is not None:
+        query = query.filter(models.User.id > after_id)
+    return query.order_by(models.User.id).offset(skip).limit(limit).all()
+
+def stream_users(db: Session, columns: Sequence, role: Optional[str] = None,
+                 batch_size: int = 1000) -> Iterator[Sequence]:
+    """``columns`` of every user (or every user with ``role``) by id, in batches (see stream_rows)."""
+    statement = select(*columns).order_by(models.User.id)
+    if role is not None:
+        statement = statement.where(models.User.role == role)
+    return stream_rows(db, statement, batch_size)
+
+def get_user_with_scores(db: Session, user_id: str) -> Optional[models.User]:
+    """A user with ``scores`` loaded up front by one extra query."""
+    return (
+        db.query(models.User)
+        .options(selectinload(models.User.scores))
+        .filter(models.User.id == user_id)
+        .first()
+    )
+
+def get_employees_with_scores(db: Session, employee_ids: Optional[Sequence[str]] = None,
+                              department: Optional[str] = None, after_id: Optional[str] = None,
+                              limit: int = 100, latest: Optional[int] = None) -> List[models.User]:
+    """
+    Employees ordered by id with ``scores`` populated newest first, in two
+    queries whatever the page size. ``latest`` keeps only each employee's N
+    most recent scores, ranked in SQL rather than trimmed in Python.
+    """
+    query = db.query(models.User).filter(models.User.role == "employee")
+    if employee_ids is not None:
+        query = query.filter(models.User.id.in_(employee_ids))
+    if department is not None:
+        query = query.filter(models.User.department == department)
+    if after_id is not None:
+        query = query.filter(models.User.id > after_id)
+    query = query.order_by(models.User.id).limit(limit)
+    if latest is None:
+        return query.options(selectinload(models.User.scores)).all()
+
+    employees = query.all()
+    scores_by_employee = {employee.id: [] for employee in employees}
+    if scores_by_employee:
+        rank = func.row_number().over(
+            partition_by=models.Score.employee_id,
+            order_by=(score_sort_date.desc(), models.Score.id.desc()),
+        ).label("rank")
+        ranked = (
+            select(models.Score, rank)
+            .where(models.Score.employee_id.in_(scores_by_employee))
+            .subquery()
+        )
+        recent = aliased(models.Score, ranked)
+        for score in (db.query(recent).filter(ranked.c.rank <= latest)
+                      .order_by(ranked.c.employee_id, ranked.c.rank)):
+            scores_by_employee[score.employee_id].append(score)
+    for employee in employees:
+        # Mark the collection as loaded so reading it does not lazy-load.
+        set_committed_value(employee, "scores", scores_by_employee[employee.id])
+    return employees
+
 def create_user(db: Session, email: str, name: str, password: str, role: str, 
                 avatar: Optional[str] = None, department: Optional[str] = None, 
-                experience: Optional[int] = None) -> models.User:
-    hashed_password = get_password_hash(password)
+                experience: Optional[int] = None,
+                hashed_password: Optional[str] = None, send_welcome: bool = False) -> models.User:
+    # Callers that hashed ahead of time (e.g. off the event loop) pass the hash.
+    if hashed_password is None:
+        hashed_password = get_password_hash(password)
     db_user = models.User(
         email=email,
         name=name,
@@ -27,10 +127,27 @@ def create_user(db: Session, email: str, name: str, password: str, role: str,
         experience=experience
     )
     db.add(db_user)
+    if send_welcome:
+        queue_email(db, email, *welcome_email(name))
     db.commit()
     db.refresh(db_user)
     return db_user
 
+def bulk_create_users(db: Session, rows: Sequence[dict], chunk_size: int = 1000) -> List[str]:
+    """
+    Insert user rows that already carry ``hashed_password`` with one
+    executemany per chunk and a single commit. Returns the new ids in order.
+    """
+    columns = ("email", "name", "hashed_password", "role", "avatar", "department", "experience")
+    ids = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = [dict({column: row.get(column) for column in columns}, id=models.generate_uuid())
+                 for row in rows[start:start + chunk_size]]
+        db.execute(insert(models.User), chunk)
+        ids.extend(row["id"] for row in chunk)
+    db.commit()
+    return ids
+
 def update_user(db: Session, user_id: str, **kwargs) -> Optional[models.User]:
     db_user = get_user(db, user_id)
     if db_user:
@@ -38,6 +155,7 @@ def update_user(db: Session, user_id: str, **kwargs) -> Optional[models.User]:
             if hasattr(db_user, key):
                 setattr(db_user, key, value)
         db.commit()
+        user_cache.invalidate(user_id)
         db.refresh(db_user)
     return db_user
 
@@ -46,6 +164,7 @@ def delete_user(db: Session, user_id: str) -> bool:
     if db_user:
         db.delete(db_user)
         db.commit()
+        user_cache.invalidate(user_id)
         return True
     return False
 
@@ -54,7 +173,65 @@ def get_skill(db: Session, skill_id: str) -> Optional[models.Skill]:
     return db.query(models.Skill).filter(models.Skill.id == skill_id).first()
 
 def get_skills(db: Session, skip: int = 0, limit: int = 100) -> List[models.Skill]:
-    return db.query(models.Skill).offset(skip).limit(limit).all()
+    return db.query(models.Skill).order_by(models.Skill.id).offset(skip).limit(limit).all()
+
+def get_all_skills(db: Session, columns: Sequence = ()) -> list:
+    """The whole skills table (or just ``columns`` of it), in the same order as get_skills."""
+    return (db.query(*columns) if columns else db.query(models.Skill)).order_by(models.Skill.id).all()
+
+def get_skills_by_category(db: Session, category: str) -> List[models.Skill]:
+    return db.query(models.Skill).filter(models.Skill.category == category).all()
+
+# FTS5 index over skill names and descriptions (SQLite only, see migration 0006).
+skills_fts = table("skills_fts", column("skill_id"), column("category"))
+skills_fts_match = literal_column("skills_fts").op("MATCH")
+# bm25 with name matches weighted 10x over description matches; lower is better.
+skills_fts_rank = literal_column("bm25(skills_fts, 10.0, 1.0)")
+
+def skill_search_terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query)
+
+def _skill_search_condition(db: Session, terms: Sequence[str]):
+    if db.get_bind().dialect.name == "sqlite":
+        # Each word is quoted (no FTS syntax from users) and prefix-matched.
+        return skills_fts_match(" ".join(f'"{term}"*' for term in terms))
+    return and_(*(
+        or_(func.lower(models.Skill.name).contains(term.lower(), autoescape=True),
+            func.lower(models.Skill.description).contains(term.lower(), autoescape=True))
+        for term in terms
+    ))
+
+def search_skills(db: Session, query: str, category: Optional[str] = None,
+                  skip: int = 0, limit: int = 20) -> Tuple[List[models.Skill], List[Tuple[str, int]]]:
+    """
+    Skills matching every word of ``query`` as a word prefix, best match
+    first, and the number of matches per category (before the ``category``
+    filter). SQLite ranks with the FTS5 index; other databases fall back to
+    unranked substring matching.
+    """
+    terms = skill_search_terms(query)
+    if not terms:
+        return [], []
+    condition = _skill_search_condition(db, terms)
+    if db.get_bind().dialect.name == "sqlite":
+        # Rank and page inside the FTS table, then join only the page.
+        page = select(skills_fts.c.skill_id, skills_fts_rank.label("rank")).where(condition)
+        if category is not None:
+            page = page.where(skills_fts.c.category == category)
+        page = page.order_by(skills_fts_rank).offset(skip).limit(limit).subquery()
+        hits = (select(models.Skill)
+                .join(page, page.c.skill_id == models.Skill.id)
+                .order_by(page.c.rank))
+        facets = select(skills_fts.c.category, func.count()).where(condition).group_by(skills_fts.c.category)
+    else:
+        hits = select(models.Skill).where(condition).order_by(models.Skill.name)
+        if category is not None:
+            hits = hits.where(models.Skill.category == category)
+        hits = hits.offset(skip).limit(limit)
+        facets = select(models.Skill.category, func.count()).where(condition).group_by(models.Skill.category)
+    skills = db.execute(hits).scalars().all()
+    counts = sorted(db.execute(facets).all(), key=lambda row: (-row[1], row[0]))
+    return skills, [(name, count) for name, count in counts]
 
 def create_skill(db: Session, name: str, category: str, description: Optional[str] = None) -> models.Skill:
     db_skill = models.Skill(name=name, category=category, description=description)
@@ -63,6 +240,15 @@ def create_skill(db: Session, name: str, category: str, description: Optional[st
     db.refresh(db_skill)
     return db_skill
 
+def bulk_create_skills(db: Session, rows: Sequence[dict]) -> List[str]:
+    """Insert skill rows (name, category, description) in one statement and commit."""
+    rows = [{"id": models.generate_uuid(), "name": row["name"], "category": row["category"],
+             "description": row.get("description")} for row in rows]
+    if rows:
+        db.execute(insert(models.Skill), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
 def update_skill(db: Session, skill_id: str, **kwargs) -> Optional[models.Skill]:
     db_skill = get_skill(db, skill_id)
     if db_skill:
@@ -85,12 +271,181 @@ def delete_skill(db: Session, skill_id: str) -> bool:
 def get_score(db: Session, score_id: str) -> Optional[models.Score]:
     return db.query(models.Score).filter(models.Score.id == score_id).first()
 
-def get_scores_by_employee(db: Session, employee_id: str) -> List[models.Score]:
-    return db.query(models.Score).filter(models.Score.employee_id == employee_id).all()
+def get_scores_by_employee(db: Session, employee_id: str, columns: Sequence = ()) -> list:
+    query = db.query(*columns) if columns else db.query(models.Score)
+    return query.filter(models.Score.employee_id == employee_id).all()
 
 def get_scores(db: Session, skip: int = 0, limit: int = 100) -> List[models.Score]:
     return db.query(models.Score).offset(skip).limit(limit).all()
 
+# SQLite stores server-default score dates as 'YYYY-MM-DD HH:MM:SS' while bound
+# datetimes carry microseconds, so comparing them as DateTime breaks ties
+# within a second. Keyset queries compare the stored text instead; type_coerce
+# emits no CAST, so the (date, id) indexes still apply.
+score_sort_date = type_coerce(models.Score.date, String)
+
+def score_date_bound(value: datetime) -> str:
+    """Format a datetime for comparison against score_sort_date."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(sep=" ")
+
+def _score_feed_query(query, after: Optional[Tuple[str, str]], employee_id: Optional[str],
+                      skill_id: Optional[str], trainer_id: Optional[str],
+                      date_from: Optional[str], date_to: Optional[str]):
+    """Apply the score feed filters, keyset and (date, id) descending order to ``query``."""
+    if employee_id is not None:
+        query = query.filter(models.Score.employee_id == employee_id)
+    if skill_id is not None:
+        query = query.filter(models.Score.skill_id == skill_id)
+    if trainer_id is not None:
+        query = query.filter(models.Score.trainer_id == trainer_id)
+    if date_from is not None:
+        query = query.filter(score_sort_date >= date_from)
+    if date_to is not None:
+        query = query.filter(score_sort_date <= date_to)
+    if after is not None:
+        after_date, after_id = after
+        query = query.filter(
+            score_sort_date <= after_date,
+            or_(score_sort_date < after_date, models.Score.id < after_id),
+        )
+    return query.order_by(score_sort_date.desc(), models.Score.id.desc())
+
+def _score_feed(query, after: Optional[Tuple[str, str]], employee_id: Optional[str],
+                skill_id: Optional[str], trainer_id: Optional[str],
+                date_from: Optional[str], date_to: Optional[str], skip: int, limit: int):
+    query = _score_feed_query(query, after, employee_id, skill_id, trainer_id, date_from, date_to)
+    return query.offset(skip).limit(limit).all()
+
+def get_scores_page(db: Session, after: Optional[Tuple[str, str]] = None,
+                    skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                    date_from: Optional[str] = None, date_to: Optional[str] = None,
+                    skip: int = 0, limit: int = 100,
+                    employee_id: Optional[str] = None, columns: Sequence = ()) -> list:
+    """
+    Scores newest first by (date, id), starting after the ``(date, id)`` key in
+    ``after``. Each row is the Score (or the given ``columns``) followed by its
+    stored date for the next cursor.
+    """
+    return _score_feed(db.query(*(columns or (models.Score,)), score_sort_date), after, employee_id,
+                       skill_id, trainer_id, date_from, date_to, skip, limit)
+
+def _score_details_query(db: Session, columns: Sequence = ()):
+    # Skill, trainer and employee names resolved by outer joins so a score
+    # whose skill or user has gone still comes back, with None names.
+    trainer = aliased(models.User)
+    employee = aliased(models.User)
+    return (
+        db.query(
+            *(columns or (models.Score,)),
+            models.Skill.name.label("skill_name"),
+            trainer.name.label("trainer_name"),
+            employee.name.label("employee_name"),
+            score_sort_date.label("sort_date"),
+        )
+        .outerjoin(models.Skill, models.Skill.id == models.Score.skill_id)
+        .outerjoin(trainer, trainer.id == models.Score.trainer_id)
+        .outerjoin(employee, employee.id == models.Score.employee_id)
+    )
+
+def get_score_with_details(db: Session, score_id: str):
+    """Score row with its skill, trainer and employee names, in one statement."""
+    return _score_details_query(db).filter(models.Score.id == score_id).first()
+
+def get_score_details_page(db: Session, after: Optional[Tuple[str, str]] = None,
+                           employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                           trainer_id: Optional[str] = None, date_from: Optional[str] = None,
+                           date_to: Optional[str] = None, skip: int = 0, limit: int = 100,
+                           columns: Sequence = ()):
+    """
+    Same feed as get_scores_page, with each row also carrying ``skill_name``,
+    ``trainer_name``, ``employee_name`` and ``sort_date``.
+    """
+    return _score_feed(_score_details_query(db, columns), after, employee_id,
+                       skill_id, trainer_id, date_from, date_to, skip, limit)
+
+def stream_score_details(db: Session, columns: Sequence, employee_id: Optional[str] = None,
+                         skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                         date_from: Optional[str] = None, date_to: Optional[str] = None,
+                         batch_size: int = 1000) -> Iterator[Sequence]:
+    """The whole get_score_details_page feed, newest first, in batches (see stream_rows)."""
+    query = _score_feed_query(_score_details_query(db, columns), None, employee_id,
+                              skill_id, trainer_id, date_from, date_to)
+    return stream_rows(db, query.statement, batch_size)
+
+# Dimensions scores can be grouped by; department and category come from
+# the employee and skill rows.
+SCORE_GROUP_COLUMNS = {
+    "employee": models.Score.employee_id,
+    "skill": models.Score.skill_id,
+    "trainer": models.Score.trainer_id,
+    "department": models.User.department,
+    "category": models.Skill.category,
+}
+
+def score_aggregate_statement(group_by: Sequence[str] = (),
+                              employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                              trainer_id: Optional[str] = None, department: Optional[str] = None,
+                              category: Optional[str] = None, date_from: Optional[str] = None,
+                              date_to: Optional[str] = None,
+                              employee_ids: Optional[Sequence[str]] = None) -> Select:
+    """
+    Count, average, min, max, sum, sum of squares and latest score per group
+    as a single SELECT. ``group_by`` names keys of SCORE_GROUP_COLUMNS; with
+    no keys everything matched is aggregated into one row.
+    """
+    group_columns = [SCORE_GROUP_COLUMNS[name] for name in group_by]
+    latest_rank = func.row_number().over(
+        partition_by=group_columns or None,
+        order_by=(score_sort_date.desc(), models.Score.id.desc()),
+    )
+    ranked = select(
+        *(column.label(name) for name, column in zip(group_by, group_columns)),
+        models.Score.id,
+        models.Score.score,
+        models.Score.date,
+        latest_rank.label("latest_rank"),
+    )
+    if "department" in group_by or department is not None:
+        ranked = ranked.join(models.User, models.User.id == models.Score.employee_id)
+    if "category" in group_by or category is not None:
+        ranked = ranked.join(models.Skill, models.Skill.id == models.Score.skill_id)
+    for column, value in ((models.Score.employee_id, employee_id), (models.Score.skill_id, skill_id),
+                          (models.Score.trainer_id, trainer_id), (models.User.department, department),
+                          (models.Skill.category, category)):
+        if value is not None:
+            ranked = ranked.where(column == value)
+    if employee_ids is not None:
+        ranked = ranked.where(models.Score.employee_id.in_(employee_ids))
+    if date_from is not None:
+        ranked = ranked.where(score_sort_date >= date_from)
+    if date_to is not None:
+        ranked = ranked.where(score_sort_date <= date_to)
+    ranked = ranked.subquery()
+
+    keys = [ranked.c[name] for name in group_by]
+    is_latest = ranked.c.latest_rank == 1
+    stmt = select(
+        *keys,
+        func.count().label("count"),
+        func.avg(ranked.c.score).label("average"),
+        func.min(ranked.c.score).label("min"),
+        func.max(ranked.c.score).label("max"),
+        func.sum(ranked.c.score).label("sum"),
+        func.sum(ranked.c.score * ranked.c.score).label("sum_squares"),
+        func.max(case((is_latest, ranked.c.id))).label("latest_score_id"),
+        func.max(case((is_latest, ranked.c.score))).label("latest_score"),
+        func.max(case((is_latest, ranked.c.date))).label("latest_date"),
+    )
+    if keys:
+        stmt = stmt.group_by(*keys).order_by(*keys)
+    return stmt
+
+def aggregate_scores(db: Session, group_by: Sequence[str] = (), *filters, **named_filters) -> list:
+    """Execute score_aggregate_statement and return its rows."""
+    return db.execute(score_aggregate_statement(group_by, *filters, **named_filters)).all()
+
 def create_score(db: Session, employee_id: str, skill_id: str, score: float, 
                 trainer_id: str, feedback: Optional[str] = None) -> models.Score:
     db_score = models.Score(
@@ -101,16 +456,45 @@ def create_score(db: Session, employee_id: str, skill_id: str, score: float,
         feedback=feedback
     )
     db.add(db_score)
+    db.flush()
+    db.refresh(db_score)  # load the server-default date for the matrix
+    add_score_to_matrix(db, db_score)
     db.commit()
     db.refresh(db_score)
     return db_score
 
+def bulk_create_scores(db: Session, rows: Sequence[dict], chunk_size: int = 1000,
+                       notifications: Sequence[dict] = ()) -> Tuple[List[str], List[str]]:
+    """
+    Insert already validated score rows (employee_id, skill_id, trainer_id,
+    score, feedback) with one executemany per chunk, refresh the affected
+    matrix cells, store ``notifications`` (see add_notifications) and commit
+    once. Returns the new score ids and notification ids in input order.
+    """
+    ids = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = [
+            {"id": models.generate_uuid(), "employee_id": row["employee_id"], "skill_id": row["skill_id"],
+             "trainer_id": row["trainer_id"], "score": row["score"], "feedback": row.get("feedback")}
+            for row in rows[start:start + chunk_size]
+        ]
+        db.execute(insert(models.Score), chunk)
+        ids.extend(row["id"] for row in chunk)
+    refresh_skill_matrix(db, {row["employee_id"] for row in rows})
+    notification_ids = add_notifications(db, notifications, chunk_size)
+    db.commit()
+    return ids, notification_ids
+
 def update_score(db: Session, score_id: str, **kwargs) -> Optional[models.Score]:
     db_score = get_score(db, score_id)
     if db_score:
+        old = (db_score.employee_id, db_score.skill_id, db_score.id, db_score.score)
         for key, value in kwargs.items():
             if hasattr(db_score, key):
                 setattr(db_score, key, value)
+        db.flush()
+        remove_score_from_matrix(db, *old)
+        add_score_to_matrix(db, db_score)
         db.commit()
         db.refresh(db_score)
     return db_score
@@ -118,15 +502,188 @@ def update_score(db: Session, score_id: str, **kwargs) -> Optional[models.Score]
 def delete_score(db: Session, score_id: str) -> bool:
     db_score = get_score(db, score_id)
     if db_score:
+        old = (db_score.employee_id, db_score.skill_id, db_score.id, db_score.score)
         db.delete(db_score)
+        db.flush()
+        remove_score_from_matrix(db, *old)
         db.commit()
         return True
     return False
 
+# Skill Matrix CRUD
+#
+# One row per (employee, skill) with running totals. Callers must have
+# flushed the score change first; nothing here commits.
+def _get_matrix_entry(db: Session, employee_id: str, skill_id: str) -> Optional[models.SkillMatrixEntry]:
+    return (
+        db.query(models.SkillMatrixEntry)
+        .filter(models.SkillMatrixEntry.employee_id == employee_id,
+                models.SkillMatrixEntry.skill_id == skill_id)
+        .with_for_update()
+        .first()
+    )
+
+def _upsert(db: Session):
+    """The dialect's INSERT with ON CONFLICT support (SQLite and PostgreSQL)."""
+    return postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+def add_score_to_matrix(db: Session, score: models.Score) -> None:
+    """
+    Fold a newly stored score into its matrix cell in O(1). The cell is
+    created or updated by one upsert, so two first scores for the same cell
+    cannot both insert it; the upsert also locks the row for the latest check.
+    """
+    # remove_score_from_matrix may have left the cell dirty (update_score).
+    db.flush()
+    entry = models.SkillMatrixEntry
+    statement = _upsert(db)(entry).values(
+        employee_id=score.employee_id, skill_id=score.skill_id,
+        latest_score_id=score.id, latest_score=score.score, latest_date=score.date,
+        best_score=score.score, attempt_count=1, score_sum=score.score,
+        score_sum_squares=score.score * score.score,
+    )
+    new = statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=[entry.employee_id, entry.skill_id],
+        set_={
+            "attempt_count": entry.attempt_count + 1,
+            "score_sum": entry.score_sum + new.score_sum,
+            "score_sum_squares": entry.score_sum_squares + new.score_sum_squares,
+            "best_score": case((new.best_score > entry.best_score, new.best_score), else_=entry.best_score),
+        },
+    ).returning(entry)
+    cell = db.scalars(statement, execution_options={"populate_existing": True}).one()
+    # Dates are compared in Python: SQLite may hold the same instant as
+    # differently formatted text.
+    if (score.date, score.id) > (cell.latest_date, cell.latest_score_id):
+        cell.latest_score_id = score.id
+        cell.latest_score = score.score
+        cell.latest_date = score.date
+
+def remove_score_from_matrix(db: Session, employee_id: str, skill_id: str,
+                             score_id: str, value: float) -> None:
+    """
+    Take a score that was changed or deleted out of its cell. Best and latest
+    are only re-read, through the (employee_id, skill_id, date, id) index,
+    when the removed score held one of them.
+    """
+    entry = _get_matrix_entry(db, employee_id, skill_id)
+    if entry is None:
+        return
+    entry.attempt_count -= 1
+    if entry.attempt_count <= 0:
+        db.delete(entry)
+        db.flush()
+        return
+    entry.score_sum -= value
+    entry.score_sum_squares -= value * value
+    cell = (models.Score.employee_id == employee_id, models.Score.skill_id == skill_id)
+    if value >= entry.best_score:
+        entry.best_score = db.query(func.max(models.Score.score)).filter(*cell).scalar()
+    if score_id == entry.latest_score_id:
+        latest = (
+            db.query(models.Score)
+            .filter(*cell)
+            .order_by(score_sort_date.desc(), models.Score.id.desc())
+            .first()
+        )
+        entry.latest_score_id = latest.id
+        entry.latest_score = latest.score
+        entry.latest_date = latest.date
+
+def get_matrix_entries(db: Session, employee_id: Optional[str] = None,
+                       skill_id: Optional[str] = None, department: Optional[str] = None,
+                       after: Optional[Tuple[str, str]] = None,
+                       limit: int = 100) -> List[models.SkillMatrixEntry]:
+    """Matrix cells ordered by (employee_id, skill_id), starting after the key in ``after``."""
+    entry = models.SkillMatrixEntry
+    query = db.query(entry)
+    if employee_id is not None:
+        query = query.filter(entry.employee_id == employee_id)
+    if skill_id is not None:
+        query = query.filter(entry.skill_id == skill_id)
+    if department is not None:
+        query = query.join(models.User, models.User.id == entry.employee_id).filter(
+            models.User.department == department)
+    if after is not None:
+        after_employee, after_skill = after
+        query = query.filter(
+            entry.employee_id >= after_employee,
+            or_(entry.employee_id > after_employee, entry.skill_id > after_skill),
+        )
+    return query.order_by(entry.employee_id, entry.skill_id).limit(limit).all()
+
+def _insert_matrix_cells(db: Session, employee_ids: Optional[Sequence[str]] = None) -> None:
+    grouped = score_aggregate_statement(["employee", "skill"], employee_ids=employee_ids).order_by(None).subquery()
+    db.execute(insert(models.SkillMatrixEntry).from_select(
+        ["employee_id", "skill_id", "attempt_count", "score_sum", "score_sum_squares",
+         "best_score", "latest_score_id", "latest_score", "latest_date"],
+        select(grouped.c.employee, grouped.c.skill, grouped.c["count"], grouped.c.sum,
+               grouped.c.sum_squares, grouped.c.max, grouped.c.latest_score_id,
+               grouped.c.latest_score, grouped.c.latest_date),
+    ))
+
+def rebuild_skill_matrix(db: Session) -> int:
+    """Recompute every matrix cell from the scores table in one statement."""
+    db.execute(delete(models.SkillMatrixEntry))
+    _insert_matrix_cells(db)
+    db.commit()
+    return db.query(func.count()).select_from(models.SkillMatrixEntry).scalar()
+
+def refresh_skill_matrix(db: Session, employee_ids: Iterable[str], chunk_size: int = 500) -> None:
+    """Recompute the matrix cells of ``employee_ids`` from their scores. The caller commits."""
+    employee_ids = list(employee_ids)
+    for start in range(0, len(employee_ids), chunk_size):
+        chunk = employee_ids[start:start + chunk_size]
+        db.execute(delete(models.SkillMatrixEntry).where(models.SkillMatrixEntry.employee_id.in_(chunk)))
+        _insert_matrix_cells(db, chunk)
+
+def check_skill_matrix(db: Session, tolerance: float = 1e-6) -> List[dict]:
+    """
+    Compare every matrix cell with a fresh aggregate of the scores table and
+    return one dict per disagreement (an empty list means consistent).
+    """
+    expected = {(row.employee, row.skill): row for row in aggregate_scores(db, ["employee", "skill"])}
+    actual = {(e.employee_id, e.skill_id): e for e in db.query(models.SkillMatrixEntry)}
+    problems = []
+    for key in expected.keys() - actual.keys():
+        problems.append({"employee_id": key[0], "skill_id": key[1], "field": "missing"})
+    for key in actual.keys() - expected.keys():
+        problems.append({"employee_id": key[0], "skill_id": key[1], "field": "orphaned"})
+    for key in expected.keys() & actual.keys():
+        row, entry = expected[key], actual[key]
+        for field, want, have in (("attempt_count", row.count, entry.attempt_count),
+                                  ("score_sum", row.sum, entry.score_sum),
+                                  ("score_sum_squares", row.sum_squares, entry.score_sum_squares),
+                                  ("best_score", row.max, entry.best_score),
+                                  ("latest_score_id", row.latest_score_id, entry.latest_score_id)):
+            if want != have and not (isinstance(want, float) and abs(want - have) <= tolerance * max(1.0, abs(want))):
+                problems.append({"employee_id": key[0], "skill_id": key[1], "field": field,
+                                 "expected": want, "actual": have})
+    return problems
+
 # Learning Path CRUD
 def get_learning_path(db: Session, path_id: str) -> Optional[models.LearningPath]:
     return db.query(models.LearningPath).filter(models.LearningPath.id == path_id).first()
 
+def stream_learning_paths(db: Session, columns: Sequence, employee_id: Optional[str] = None,
+                          batch_size: int = 1000) -> Iterator[Sequence]:
+    """
+    ``columns`` of every learning path by id, followed by ``employee_name``
+    and ``assigned_by_name``, in batches (see stream_rows).
+    """
+    employee = aliased(models.User)
+    assigner = aliased(models.User)
+    statement = (
+        select(*columns, employee.name.label("employee_name"), assigner.name.label("assigned_by_name"))
+        .outerjoin(employee, employee.id == models.LearningPath.employee_id)
+        .outerjoin(assigner, assigner.id == models.LearningPath.assigned_by)
+        .order_by(models.LearningPath.id)
+    )
+    if employee_id is not None:
+        statement = statement.where(models.LearningPath.employee_id == employee_id)
+    return stream_rows(db, statement, batch_size)
+
 def get_learning_paths_by_employee(db: Session, employee_id: str) -> List[models.LearningPath]:
     return db.query(models.LearningPath).filter(models.LearningPath.employee_id == employee_id).all()
 
@@ -145,13 +702,20 @@ def create_learning_path(db: Session, title: str, employee_id: str, assigned_by:
 def get_learning_step(db: Session, step_id: str) -> Optional[models.LearningStep]:
     return db.query(models.LearningStep).filter(models.LearningStep.id == step_id).first()
 
-def get_learning_steps_by_path(db: Session, path_id: str) -> List[models.LearningStep]:
-    return db.query(models.LearningStep).filter(models.LearningStep.learning_path_id == path_id).all()
+def get_learning_steps_by_path(db: Session, path_id: str, columns: Sequence = ()) -> list:
+    """A path's steps (or the given ``columns`` of them) in order."""
+    query = db.query(*columns) if columns else db.query(models.LearningStep)
+    return (query.filter(models.LearningStep.learning_path_id == path_id)
+            .order_by(models.LearningStep.position).all())
 
 def create_learning_step(db: Session, learning_path_id: str, title: str, 
                         skill_type: str, description: Optional[str] = None) -> models.LearningStep:
     db_step = models.LearningStep(
         learning_path_id=learning_path_id,
+        # Appended after the path's last step, in the INSERT itself.
+        position=select(func.coalesce(func.max(models.LearningStep.position) + 1, 0))
+        .where(models.LearningStep.learning_path_id == learning_path_id)
+        .scalar_subquery(),
         title=title,
         skill_type=skill_type,
         description=description
@@ -171,29 +735,312 @@ def update_learning_step(db: Session, step_id: str, **kwargs) -> Optional[models
         db.refresh(db_step)
     return db_step
 
+def create_learning_path_with_steps(db: Session, title: str, employee_id: str, assigned_by: str,
+                                    steps: Sequence[dict]) -> models.LearningPath:
+    """Create a path and its steps (dicts of LearningStep fields, in order) in one transaction."""
+    db_path = models.LearningPath(title=title, employee_id=employee_id, assigned_by=assigned_by)
+    db.add(db_path)
+    db.flush()
+    db.add_all(models.LearningStep(learning_path_id=db_path.id, position=position, completed=False, **step)
+               for position, step in enumerate(steps))
+    db.commit()
+    db.refresh(db_path)
+    return db_path
+
+def set_learning_step_completed(db: Session, path_id: str, step_id: str, completed: bool) -> Optional[bool]:
+    """
+    Mark a step of a path completed (dated now) or not done. Returns whether
+    it changed, or None if the path has no such step. Only an actual change
+    is written, so repeating a request or racing another one is harmless.
+    """
+    step = models.LearningStep
+    changed = db.execute(
+        step.__table__.update()
+        .where(step.id == step_id, step.learning_path_id == path_id,
+               func.coalesce(step.completed, False) != completed)
+        .values(completed=completed, completed_date=func.now() if completed else None, updated_at=func.now())
+    ).rowcount
+    if not changed and db.query(step.id).filter(step.id == step_id, step.learning_path_id == path_id).first() is None:
+        return None
+    db.commit()
+    return bool(changed)
+
+# Progress is always aggregated from the steps, so no counter can drift from
+# them. NULL completed (rows from before the column default) counts as not done.
+learning_step_done = case((models.LearningStep.completed.is_(True), 1), else_=0)
+
+def _percent(part, whole):
+    return func.coalesce(func.round(100.0 * part / func.nullif(whole, 0), 1), 0.0)
+
+def get_learning_paths_progress(db: Session, columns: Sequence, path_id: Optional[str] = None,
+                                employee_id: Optional[str] = None, assigned_by: Optional[str] = None,
+                                after_id: Optional[str] = None, limit: Optional[int] = None) -> list:
+    """
+    ``columns`` of learning paths by id, each followed by step_count,
+    completed_steps, percent_complete, last_completed_date and
+    employee_name: one grouped query over the paths and their steps.
+    """
+    step_count = func.count(models.LearningStep.id)
+    completed = func.coalesce(func.sum(learning_step_done), 0)
+    # A subquery rather than a join, so that grouping by the path id alone
+    # lets the (owner, id) indexes deliver the groups in order.
+    employee_name = (select(models.User.name).where(models.User.id == models.LearningPath.employee_id)
+                     .scalar_subquery())
+    statement = (
+        select(*columns, step_count.label("step_count"), completed.label("completed_steps"),
+               _percent(completed, step_count).label("percent_complete"),
+               func.max(models.LearningStep.completed_date).label("last_completed_date"),
+               employee_name.label("employee_name"))
+        .select_from(models.LearningPath)
+        .outerjoin(models.LearningStep, models.LearningStep.learning_path_id == models.LearningPath.id)
+        .group_by(models.LearningPath.id)
+        .order_by(models.LearningPath.id)
+        .limit(limit)
+    )
+    if path_id is not None:
+        statement = statement.where(models.LearningPath.id == path_id)
+    if employee_id is not None:
+        statement = statement.where(models.LearningPath.employee_id == employee_id)
+    if assigned_by is not None:
+        statement = statement.where(models.LearningPath.assigned_by == assigned_by)
+    if after_id is not None:
+        statement = statement.where(models.LearningPath.id > after_id)
+    return db.execute(statement).all()
+
+def get_team_learning_progress(db: Session, assigned_by: str, after_employee_id: Optional[str] = None,
+                               limit: int = 100) -> list:
+    """
+    Per employee, by id, their progress over the paths ``assigned_by``
+    assigned them: employee_id, employee_name, path_count, completed_paths,
+    step_count, completed_steps, percent_complete. The paths are grouped
+    first, then their totals per employee, in one statement.
+    """
+    paths = (
+        select(models.LearningPath.employee_id,
+               func.count(models.LearningStep.id).label("step_count"),
+               func.coalesce(func.sum(learning_step_done), 0).label("completed_steps"))
+        .outerjoin(models.LearningStep, models.LearningStep.learning_path_id == models.LearningPath.id)
+        .where(models.LearningPath.assigned_by == assigned_by)
+        .group_by(models.LearningPath.id)
+    )
+    if after_employee_id is not None:
+        paths = paths.where(models.LearningPath.employee_id > after_employee_id)
+    paths = paths.subquery()
+    step_count, completed = func.sum(paths.c.step_count), func.sum(paths.c.completed_steps)
+    finished = and_(paths.c.step_count > 0, paths.c.completed_steps == paths.c.step_count)
+    return db.execute(
+        select(paths.c.employee_id, models.User.name.label("employee_name"),
+               func.count().label("path_count"),
+               func.sum(case((finished, 1), else_=0)).label("completed_paths"),
+               step_count.label("step_count"), completed.label("completed_steps"),
+               _percent(completed, step_count).label("percent_complete"))
+        .outerjoin(models.User, models.User.id == paths.c.employee_id)
+        .group_by(paths.c.employee_id, models.User.name)
+        .order_by(paths.c.employee_id)
+        .limit(limit)
+    ).all()
+
 # Notification CRUD
+# Same stored-text comparison as score_sort_date, for the notification feed.
+notification_sort_date = type_coerce(models.Notification.date, String)
+
 def get_notification(db: Session, notification_id: str) -> Optional[models.Notification]:
     return db.query(models.Notification).filter(models.Notification.id == notification_id).first()
 
 def get_notifications_by_user(db: Session, user_id: str) -> List[models.Notification]:
     return db.query(models.Notification).filter(models.Notification.user_id == user_id).all()
 
+def get_notifications_page(db: Session, user_id: str, after: Optional[Tuple[str, str]] = None,
+                           unread_only: bool = False, limit: int = 50, columns: Sequence = ()) -> list:
+    """
+    A user's notifications newest first by (date, id), starting after the
+    ``(date, id)`` key in ``after``. Each row is the Notification (or the
+    given ``columns``) followed by its stored date for the next cursor.
+    """
+    query = db.query(*(columns or (models.Notification,)), notification_sort_date)
+    query = query.filter(models.Notification.user_id == user_id)
+    if unread_only:
+        query = query.filter(models.Notification.read.is_(False))
+    if after is not None:
+        after_date, after_id = after
+        query = query.filter(
+            notification_sort_date <= after_date,
+            or_(notification_sort_date < after_date, models.Notification.id < after_id),
+        )
+    return (
+        query.order_by(notification_sort_date.desc(), models.Notification.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+def get_notification_key(db: Session, user_id: str, notification_id: str) -> Optional[Tuple[str, str]]:
+    """The feed key ``(date, id)`` of one of the user's notifications."""
+    row = db.execute(
+        select(notification_sort_date, models.Notification.id)
+        .where(models.Notification.id == notification_id, models.Notification.user_id == user_id)
+    ).first()
+    return tuple(row) if row else None
+
+def get_unread_count(db: Session, user_id: str) -> int:
+    """The maintained unread counter: a primary-key read, however many notifications there are."""
+    return db.execute(
+        select(models.User.unread_notifications).where(models.User.id == user_id)
+    ).scalar() or 0
+
+def _add_unread(db: Session, user_id: str, delta: int) -> None:
+    # Relative update, so concurrent writers never lose each other's change.
+    db.execute(
+        models.User.__table__.update()
+        .where(models.User.id == user_id)
+        .values(unread_notifications=models.User.unread_notifications + delta)
+    )
+
 def create_notification(db: Session, user_id: str, type: str, title: str, message: str) -> models.Notification:
     db_notification = models.Notification(
         user_id=user_id,
         type=type,
         title=title,
-        message=message
+        message=message,
+        read=False
     )
     db.add(db_notification)
+    _add_unread(db, user_id, 1)
     db.commit()
     db.refresh(db_notification)
     return db_notification
 
+def add_notifications(db: Session, notifications: Sequence[dict], chunk_size: int = 1000) -> List[str]:
+    """
+    Insert unread notifications (user_id, type, title, message) with one
+    executemany per chunk and one counter update per user, without
+    committing. Returns the new ids in input order.
+    """
+    ids = []
+    for start in range(0, len(notifications), chunk_size):
+        chunk = [
+            {"id": models.generate_uuid(), "user_id": row["user_id"], "type": row["type"],
+             "title": row["title"], "message": row["message"], "read": False}
+            for row in notifications[start:start + chunk_size]
+        ]
+        db.execute(insert(models.Notification), chunk)
+        ids.extend(row["id"] for row in chunk)
+    for user_id, count in Counter(row["user_id"] for row in notifications).items():
+        _add_unread(db, user_id, count)
+    return ids
+
+def get_notifications_by_ids(db: Session, notification_ids: Sequence[str], columns: Sequence = ()) -> list:
+    return db.query(*(columns or (models.Notification,))).filter(
+        models.Notification.id.in_(notification_ids)).all()
+
 def mark_notification_read(db: Session, notification_id: str) -> Optional[models.Notification]:
     db_notification = get_notification(db, notification_id)
     if db_notification:
-        db_notification.read = True
+        # Only the transition from unread counts, even if two requests race.
+        marked = db.execute(
+            models.Notification.__table__.update()
+            .where(models.Notification.id == notification_id, models.Notification.read.is_(False))
+            .values(read=True)
+        ).rowcount
+        if marked:
+            _add_unread(db, db_notification.user_id, -marked)
         db.commit()
         db.refresh(db_notification)
-    return db_notification 
\ No newline at end of file
+    return db_notification
+
+def mark_notifications_read(db: Session, user_id: str, up_to: Optional[Tuple[str, str]] = None) -> int:
+    """
+    Mark all of a user's unread notifications read, or only those at or
+    before the feed key ``up_to``, in one statement; returns how many.
+    """
+    statement = (
+        models.Notification.__table__.update()
+        .where(models.Notification.user_id == user_id, models.Notification.read.is_(False))
+        .values(read=True)
+    )
+    if up_to is not None:
+        up_to_date, up_to_id = up_to
+        statement = statement.where(
+            notification_sort_date <= up_to_date,
+            or_(notification_sort_date < up_to_date, models.Notification.id <= up_to_id),
+        )
+    marked = db.execute(statement).rowcount
+    if marked:
+        _add_unread(db, user_id, -marked)
+    db.commit()
+    return marked
+
+# Email outbox
+def queue_email(db: Session, to_email: str, subject: str, body: str) -> models.OutboxEmail:
+    """
+    Add a message to the outbox without committing: it is sent only if the
+    caller's transaction commits, and the request never waits on SMTP.
+    """
+    db_email = models.OutboxEmail(to_email=to_email, subject=subject, body=body, status="pending",
+                                  attempts=0, next_attempt_at=datetime.utcnow())
+    db.add(db_email)
+    db.info["queued_email"] = True
+    return db_email
+
+def claim_outbox_emails(db: Session, now: datetime, claim_until: datetime, token: str,
+                        limit: int) -> List[models.OutboxEmail]:
+    """
+    Claim up to ``limit`` due messages for one worker by pushing their due
+    time to ``claim_until`` under ``token``. The conditional UPDATE lets
+    several workers share the outbox without sending a message twice.
+    """
+    ids = db.execute(
+        select(models.OutboxEmail.id)
+        .where(models.OutboxEmail.status == "pending", models.OutboxEmail.next_attempt_at <= now)
+        .order_by(models.OutboxEmail.next_attempt_at)
+        .limit(limit)
+    ).scalars().all()
+    if not ids:
+        return []
+    db.execute(
+        models.OutboxEmail.__table__.update()
+        .where(models.OutboxEmail.id.in_(ids), models.OutboxEmail.status == "pending",
+               models.OutboxEmail.next_attempt_at <= now)
+        .values(next_attempt_at=claim_until, claim_token=token)
+    )
+    db.commit()
+    return (
+        db.query(models.OutboxEmail)
+        .filter(models.OutboxEmail.id.in_(ids), models.OutboxEmail.claim_token == token)
+        .order_by(models.OutboxEmail.next_attempt_at, models.OutboxEmail.id)
+        .all()
+    )
+
+def mark_email_sent(db: Session, db_email: models.OutboxEmail) -> None:
+    """Drop a delivered message; committed with the rest of the worker's batch."""
+    db.delete(db_email)
+
+def mark_email_failed(db: Session, db_email: models.OutboxEmail, error: str,
+                      retry_at: Optional[datetime]) -> None:
+    """Record a failed attempt: due again at ``retry_at``, or dead-lettered when it is None."""
+    db_email.attempts += 1
+    db_email.last_error = error
+    db_email.claim_token = None
+    if retry_at is None:
+        db_email.status = "dead"
+    else:
+        db_email.next_attempt_at = retry_at
+
+def get_outbox_stats(db: Session) -> dict:
+    """Message counts by status, and when the oldest pending message was due."""
+    rows = db.execute(
+        select(models.OutboxEmail.status, func.count(), func.min(models.OutboxEmail.next_attempt_at))
+        .group_by(models.OutboxEmail.status)
+    ).all()
+    counts = {status: count for status, count, _ in rows}
+    oldest_due = next((due for status, _, due in rows if status == "pending"), None)
+    return {"pending": counts.get("pending", 0), "dead": counts.get("dead", 0), "oldest_due": oldest_due}
+
+def requeue_dead_emails(db: Session) -> int:
+    """Give every dead-lettered message a fresh set of attempts, due now."""
+    requeued = db.execute(
+        models.OutboxEmail.__table__.update()
+        .where(models.OutboxEmail.status == "dead")
+        .values(status="pending", attempts=0, claim_token=None, next_attempt_at=datetime.utcnow())
+    ).rowcount
+    db.commit()
+    return requeued
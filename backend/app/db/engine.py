@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from ..core.config import settings
+
+class TimedPoolMixin:
+    """Counts checkouts, checkout wait time and pool timeouts for pool_stats()."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.timeouts += timed_out
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+def _is_memory(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """Per-connection pragmas of the tuned profile."""
+    return {
+        # WAL lets readers run while a writer commits; NORMAL sync is
+        # durable across application crashes in WAL mode, only a power loss
+        # can drop the last commits.
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        # Negative cache_size is in KiB rather than pages.
+        "cache_size": -settings.sqlite_cache_size_kb,
+        "mmap_size": settings.sqlite_mmap_size_mb * 1024 * 1024,
+        "temp_store": "MEMORY",
+    }
+
+def _install_sqlite_pragmas(engine: Engine, url: str) -> None:
+    pragmas = sqlite_pragmas()
+    if _is_memory(url):
+        pragmas.pop("journal_mode")
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def engine_options(url: str, profile: str, is_async: bool = False) -> Dict[str, Any]:
+    """create_engine keyword arguments for ``url`` under ``profile`` ("tuned" or "default")."""
+    options: Dict[str, Any] = {}
+    if _is_sqlite(url) and not is_async:
+        options["connect_args"] = {"check_same_thread": False}
+    if profile != "tuned" or _is_memory(url):
+        return options
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    if not _is_sqlite(url):
+        # Only server connections go stale behind proxies and failovers.
+        options.update(pool_pre_ping=settings.db_pool_pre_ping, pool_recycle=settings.db_pool_recycle)
+    return options
+
+def create_db_engine(url: str, profile: Optional[str] = None) -> Engine:
+    """Build the sync engine for ``url`` with the configured (or given) engine profile."""
+    profile = profile or settings.db_engine_profile
+    engine = create_engine(url, **engine_options(url, profile))
+    if profile == "tuned" and _is_sqlite(url):
+        _install_sqlite_pragmas(engine, url)
+    return engine
+
+def create_async_db_engine(url: str, profile: Optional[str] = None) -> AsyncEngine:
+    """Async counterpart of create_db_engine."""
+    profile = profile or settings.db_engine_profile
+    engine = create_async_engine(url, **engine_options(url, profile, is_async=True))
+    if profile == "tuned" and _is_sqlite(url):
+        _install_sqlite_pragmas(engine.sync_engine, url)
+    return engine
+
+def pool_stats(engine) -> Dict[str, Any]:
+    """Live pool figures for an Engine or AsyncEngine."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # overflow() counts up from -size; only connections beyond the
+            # pool size are overflow.
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, TimedPoolMixin):
+        with pool._stats_lock:
+            stats.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                wait_ms_total=round(pool.wait_seconds_total * 1000, 3),
+                wait_ms_max=round(pool.wait_seconds_max * 1000, 3),
+                wait_ms_avg=round(pool.wait_seconds_total * 1000 / pool.checkouts, 3) if pool.checkouts else 0.0,
+            )
+    return stats
@@ -0,0 +1,62 @@
+"""
+Schema migrations. The chain lives in alembic/; the app checks at startup
+that the database is at its head revision instead of calling create_all.
+"""
+
+from pathlib import Path
+from typing import Optional
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# The schema create_all produced before the chain existed; databases from
+# that time have tables but no alembic_version and are stamped here first.
+BASELINE_REVISION = "0001"
+
+# Tables managed by migrations but not by the models (FTS5 and its shadow
+# tables); autogenerate must leave them alone.
+UNMODELLED_TABLE_PREFIXES = ("skills_fts",)
+
+def include_name(name: Optional[str], type_: str, parent_names) -> bool:
+    """Alembic ``include_name`` hook that skips UNMODELLED_TABLE_PREFIXES."""
+    return not (type_ == "table" and name and name.startswith(UNMODELLED_TABLE_PREFIXES))
+
+class SchemaOutOfDate(RuntimeError):
+    """The database is not at the revision the code expects."""
+
+def alembic_config() -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    # Leave the application's logging alone when migrating from code.
+    config.attributes["configure_logger"] = False
+    return config
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+def current_revision(engine: Engine) -> Optional[str]:
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+def upgrade(engine: Engine, revision: str = "head") -> None:
+    """Migrate the database behind ``engine`` to ``revision``."""
+    config = alembic_config()
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        if MigrationContext.configure(conn).get_current_revision() is None and inspect(conn).has_table("users"):
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+def check_schema(engine: Engine) -> None:
+    """Raise SchemaOutOfDate unless the database is at the head revision."""
+    current, head = current_revision(engine), head_revision()
+    if current != head:
+        raise SchemaOutOfDate(
+            f"Database schema is at revision {current or 'none'} but the code expects {head}; "
+            "run `python3 migrate.py` (or set DB_AUTO_MIGRATE=true)"
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import Base
@@ -18,22 +18,31 @@ class User(Base):
     avatar = Column(String, nullable=True)
     department = Column(String, nullable=True)
     experience = Column(Integer, nullable=True)
+    # Kept in step by the notification writes in crud (see migration 0007).
+    unread_notifications = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    scores = relationship("Score", foreign_keys="Score.employee_id", back_populates="employee")
+    scores = relationship("Score", foreign_keys="Score.employee_id", back_populates="employee",
+                          order_by=lambda: (Score.date.desc(), Score.id.desc()))
     trainer_scores = relationship("Score", foreign_keys="Score.trainer_id", back_populates="trainer")
     notifications = relationship("Notification", back_populates="user")
     learning_paths = relationship("LearningPath", foreign_keys="LearningPath.employee_id", back_populates="employee")
     assigned_learning_paths = relationship("LearningPath", foreign_keys="LearningPath.assigned_by", back_populates="assigned_by_user")
+    
+    __table_args__ = (
+        # Role listings page by id within a role; the composite index serves
+        # both the filter and the keyset order without a sort.
+        Index("ix_users_role_id", "role", "id"),
+    )
 
 class Skill(Base):
     __tablename__ = "skills"
     
     id = Column(String, primary_key=True, default=generate_uuid)
     name = Column(String, nullable=False, unique=True)
-    category = Column(String, nullable=False)
+    category = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -58,6 +67,38 @@ class Score(Base):
     employee = relationship("User", foreign_keys=[employee_id], back_populates="scores")
     skill = relationship("Skill", back_populates="scores")
     trainer = relationship("User", foreign_keys=[trainer_id], back_populates="trainer_scores")
+    
+    __table_args__ = (
+        # The score feed pages newest first by (date, id); the filtered feeds
+        # put their equality column first so every page is one index range.
+        Index("ix_scores_date_id", "date", "id"),
+        Index("ix_scores_skill_date_id", "skill_id", "date", "id"),
+        Index("ix_scores_trainer_date_id", "trainer_id", "date", "id"),
+        Index("ix_scores_employee_date_id", "employee_id", "date", "id"),
+        # Serves skill matrix recomputes of a single (employee, skill) cell.
+        Index("ix_scores_employee_skill_date_id", "employee_id", "skill_id", "date", "id"),
+    )
+
+class SkillMatrixEntry(Base):
+    """
+    Latest and best score per employee and skill, kept in step with the
+    scores table by the score CRUD functions in the same transaction.
+    """
+    __tablename__ = "skill_matrix"
+    
+    employee_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    skill_id = Column(String, ForeignKey("skills.id"), primary_key=True)
+    latest_score_id = Column(String, nullable=False)
+    latest_score = Column(Float, nullable=False)
+    latest_date = Column(DateTime(timezone=True), nullable=True)
+    best_score = Column(Float, nullable=False)
+    attempt_count = Column(Integer, nullable=False)
+    score_sum = Column(Float, nullable=False)
+    score_sum_squares = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_skill_matrix_skill_employee", "skill_id", "employee_id"),
+    )
 
 class LearningPath(Base):
     __tablename__ = "learning_paths"
@@ -74,12 +115,20 @@ class LearningPath(Base):
     employee = relationship("User", foreign_keys=[employee_id], back_populates="learning_paths")
     assigned_by_user = relationship("User", foreign_keys=[assigned_by], back_populates="assigned_learning_paths")
     steps = relationship("LearningStep", back_populates="learning_path")
+    
+    __table_args__ = (
+        # An employee's paths and a manager's assigned paths page by id.
+        Index("ix_learning_paths_employee_id_id", "employee_id", "id"),
+        Index("ix_learning_paths_assigned_by_id", "assigned_by", "id"),
+    )
 
 class LearningStep(Base):
     __tablename__ = "learning_steps"
     
     id = Column(String, primary_key=True, default=generate_uuid)
     learning_path_id = Column(String, ForeignKey("learning_paths.id"), nullable=False)
+    # Order within the path, from 0.
+    position = Column(Integer, nullable=False, default=0, server_default="0")
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     skill_type = Column(String, nullable=False)
@@ -90,6 +139,11 @@ class LearningStep(Base):
     
     # Relationships
     learning_path = relationship("LearningPath", back_populates="steps")
+    
+    __table_args__ = (
+        # A path's steps in order; also serves the per-path progress join.
+        Index("ix_learning_steps_path_position", "learning_path_id", "position"),
+    )
 
 class Notification(Base):
     __tablename__ = "notifications"
@@ -105,4 +159,32 @@ class Notification(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="notifications") 
\ No newline at end of file
+    user = relationship("User", back_populates="notifications")
+    
+    __table_args__ = (
+        # The per-user feed, newest first, paged by (date, id).
+        Index("ix_notifications_user_date_id", "user_id", "date", "id"),
+    )
+
+class OutboxEmail(Base):
+    __tablename__ = "email_outbox"
+    
+    # Written in the same transaction as the change that causes the mail and
+    # sent afterwards by the outbox worker (app/services/email_outbox.py).
+    # Sent rows are deleted; rows that ran out of attempts stay as "dead".
+    id = Column(String, primary_key=True, default=generate_uuid)
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String, nullable=False, default="pending")  # pending, dead
+    attempts = Column(Integer, nullable=False, default=0)
+    # Naive UTC. Due time for pending rows; pushed ahead while a worker holds the row.
+    next_attempt_at = Column(DateTime, nullable=False)
+    claim_token = Column(String, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # The worker's claim query: due pending rows, oldest due first.
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
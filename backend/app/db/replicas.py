@@ -0,0 +1,134 @@
+import itertools
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from .engine import create_async_db_engine, create_db_engine, pool_stats
+
+class Replica:
+    """A read replica: sync and async engines for one URL plus its last health check."""
+
+    def __init__(self, url: str, engine: Engine, async_engine: AsyncEngine):
+        self.url = url
+        self.engine = engine
+        self.async_engine = async_engine
+        self.healthy = True
+        self.checked_at = 0.0
+        self.error: Optional[str] = None
+
+    def check(self) -> bool:
+        """Run a trivial query on the replica and record whether it answered."""
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            self.healthy, self.error = True, None
+        except exc.DBAPIError as error:
+            self.healthy, self.error = False, str(error.orig)
+        self.checked_at = time.monotonic()
+        return self.healthy
+
+class ReplicaSet:
+    """
+    Round-robin choice among read replicas. Each replica is re-checked at most
+    every ``check_interval`` seconds; unhealthy ones are skipped until a check
+    succeeds again. With no healthy replica, callers fall back to the primary.
+    """
+
+    def __init__(self, replicas: Sequence[Replica], check_interval: float = 5.0):
+        self.replicas = list(replicas)
+        self.check_interval = check_interval
+        self._counter = itertools.count()
+        self._check_lock = threading.Lock()
+
+    @classmethod
+    def from_urls(cls, urls: Sequence[str], async_urls: Sequence[str],
+                  check_interval: float = 5.0) -> "ReplicaSet":
+        return cls(
+            [Replica(url, create_db_engine(url), create_async_db_engine(async_url))
+             for url, async_url in zip(urls, async_urls)],
+            check_interval,
+        )
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def checks_due(self) -> bool:
+        deadline = time.monotonic() - self.check_interval
+        return any(replica.checked_at <= deadline for replica in self.replicas)
+
+    def run_checks(self) -> None:
+        """Check every replica whose last check is older than check_interval (blocking)."""
+        # One thread checks at a time; the others keep routing on the last result.
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            deadline = time.monotonic() - self.check_interval
+            for replica in self.replicas:
+                if replica.checked_at <= deadline:
+                    replica.check()
+        finally:
+            self._check_lock.release()
+
+    def choose(self) -> Optional[Replica]:
+        """The next healthy replica, or None when all are down."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if replica.healthy:
+                return replica
+        return None
+
+    def stats(self) -> List[Dict]:
+        return [
+            {"url": make_url(replica.url).render_as_string(hide_password=True),
+             "healthy": replica.healthy, "error": replica.error,
+             "sync": pool_stats(replica.engine), "async": pool_stats(replica.async_engine)}
+            for replica in self.replicas
+        ]
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.async_engine.dispose()
+            replica.engine.dispose()
+
+class RecentWriters:
+    """
+    Callers that committed a write in the last ``window`` seconds. Their reads
+    go to the primary so they see their own writes despite replica lag. The
+    registry is per process.
+    """
+
+    # Expired entries are only swept once the registry grows past this size.
+    SWEEP_SIZE = 10000
+
+    def __init__(self, window: float):
+        self.window = window
+        self._until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, key: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._until[key] = now + self.window
+            if len(self._until) > self.SWEEP_SIZE:
+                self._until = {k: until for k, until in self._until.items() if until > now}
+
+    def is_recent(self, key: Optional[str]) -> bool:
+        until = self._until.get(key) if key else None
+        return until is not None and until > time.monotonic()
+
+def copy_sqlite_database(source_path: str, target_path: str, pages: int = 1024) -> None:
+    """
+    Copy a live SQLite database into ``target_path`` with the online backup
+    API. Writers on the source are not blocked for the whole copy, and
+    readers of the target see either the old or the new snapshot.
+    """
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target, pages=pages)
+    finally:
+        target.close()
+        source.close()
@@ -1,9 +1,86 @@
-from .base import SessionLocal
+from typing import Optional
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from jose import JWTError, jwt
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from .base import SessionLocal, AsyncSessionLocal, replicas
+from .replicas import RecentWriters
 
-def get_db():
-    """Get database session."""
+recent_writers = RecentWriters(settings.read_your_writes_seconds)
+
+@event.listens_for(Session, "after_commit")
+def remember_writer(session):
+    # Marked at commit, before the response goes out, so the caller's next
+    # request already reads from the primary.
+    key = session.info.get("writer")
+    if key:
+        recent_writers.mark(key)
+
+def caller_key(request: Request) -> Optional[str]:
+    """
+    Who is asking, for read-your-writes: the token subject, or the client
+    address for anonymous calls. The token is not verified here; routing is
+    all it decides.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return jwt.get_unverified_claims(token).get("sub")
+        except JWTError:
+            return None
+    return request.client.host if request.client else None
+
+def _read_replica(request: Request):
+    if recent_writers.is_recent(caller_key(request)):
+        return None
+    return replicas.choose()
+
+def get_db(request: Request = None):
+    """Get database session on the primary."""
     db = SessionLocal()
+    if replicas and request is not None:
+        db.info["writer"] = caller_key(request)
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+def read_session(request: Request) -> Session:
+    """
+    A new read-only session: on a healthy replica when any are configured
+    and the caller has not written recently, else on the primary. The
+    caller closes it; routes use get_read_db instead.
+    """
+    replica = None
+    if replicas:
+        if replicas.checks_due():
+            replicas.run_checks()
+        replica = _read_replica(request)
+    return SessionLocal(bind=replica.engine) if replica else SessionLocal()
+
+def get_read_db(request: Request):
+    """Get a read-only database session (see read_session)."""
+    db = read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db(request: Request = None):
+    """Get async database session on the primary."""
+    async with AsyncSessionLocal() as db:
+        if replicas and request is not None:
+            db.info["writer"] = caller_key(request)
+        yield db
+
+async def get_async_read_db(request: Request):
+    """Async counterpart of get_read_db."""
+    replica = None
+    if replicas:
+        if replicas.checks_due():
+            await run_in_threadpool(replicas.run_checks)
+        replica = _read_replica(request)
+    async with (AsyncSessionLocal(bind=replica.async_engine) if replica else AsyncSessionLocal()) as db:
+        yield db
@@ -1,12 +1,18 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
-from .db.base import engine
-from .db import models
-from .api.routes import auth, employees, trainers, skills, scores, managers
-
-# Create database tables
-models.Base.metadata.create_all(bind=engine)
+from .core.cache import user_cache
+from .core.metrics import MetricsMiddleware, metrics
+from .db.base import async_engine, engine, replicas
+from .db import migrations
+from .utils.password import password_hasher
+from .utils.pagination import NEXT_CURSOR_HEADER
+from .services.email_outbox import email_outbox_worker
+from .services.notification_broker import notification_broker
+from .api.routes import (
+    auth, employees, trainers, skills, scores, managers, users, admin, exports, notifications, learning_paths,
+)
 
 app = FastAPI(
     title="Employee Skills Tracking API",
@@ -22,8 +28,28 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Outermost, so the timings include every other middleware.
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+metrics.add_stats("password_hash", password_hasher.stats, {
+    "workers": ("gauge", "Worker processes hashing passwords (0 hashes in the calling thread)."),
+    "queue_depth": ("gauge", "Hash and verify calls submitted and not yet finished."),
+    "max_queue_depth": ("gauge", "Highest queue_depth since the process started."),
+    "submitted": ("counter", "Hash and verify calls submitted."),
+    "completed": ("counter", "Hash and verify calls finished."),
+})
+metrics.add_stats("user_cache", user_cache.stats, {
+    "hits": ("counter", "Authenticated-user lookups served from the cache."),
+    "misses": ("counter", "Authenticated-user lookups that went to the database."),
+    "evictions": ("counter", "Users dropped to keep the cache within maxsize."),
+    "size": ("gauge", "Users cached now."),
+    "maxsize": ("gauge", "Most users the cache holds."),
+})
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(employees.router, prefix="/api/v1")
@@ -31,6 +57,45 @@ app.include_router(trainers.router, prefix="/api/v1")
 app.include_router(skills.router, prefix="/api/v1")
 app.include_router(scores.router, prefix="/api/v1")
 app.include_router(managers.router, prefix="/api/v1")
+app.include_router(users.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
+app.include_router(exports.router, prefix="/api/v1")
+app.include_router(notifications.router, prefix="/api/v1")
+app.include_router(learning_paths.router, prefix="/api/v1")
+
+@app.on_event("startup")
+def check_database_schema():
+    # Schema changes go through the migration chain (migrate.py / alembic);
+    # refuse to serve from a database the code does not match.
+    if settings.db_auto_migrate:
+        migrations.upgrade(engine)
+    else:
+        migrations.check_schema(engine)
+
+@app.on_event("startup")
+def start_email_outbox_worker():
+    if settings.email_outbox_worker:
+        email_outbox_worker.start()
+
+@app.on_event("shutdown")
+def stop_email_outbox_worker():
+    email_outbox_worker.stop()
+
+@app.on_event("shutdown")
+def close_notification_streams():
+    notification_broker.close()
+
+@app.on_event("shutdown")
+def shutdown_password_hasher():
+    password_hasher.shutdown()
+
+@app.on_event("shutdown")
+async def dispose_engines():
+    # Pooled aiosqlite connections each own a worker thread that keeps the
+    # interpreter alive until the connection is closed.
+    await async_engine.dispose()
+    engine.dispose()
+    await replicas.dispose()
 
 @app.get("/")
 def read_root():
@@ -42,4 +107,9 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Request, latency and SQL figures in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4") 
\ No newline at end of file
@@ -0,0 +1,65 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+class LearningPathResponse(BaseModel):
+    id: str
+    title: str
+    employee_id: str
+    assigned_by: str
+    assigned_date: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class LearningPathExportRow(LearningPathResponse):
+    employee_name: Optional[str] = None
+    assigned_by_name: Optional[str] = None
+
+class LearningStepCreate(BaseModel):
+    title: str
+    skill_type: str
+    description: Optional[str] = None
+
+class LearningPathCreate(BaseModel):
+    title: str
+    employee_id: str
+    steps: List[LearningStepCreate] = []
+
+class LearningStepUpdate(BaseModel):
+    completed: bool
+
+class LearningStepResponse(BaseModel):
+    id: str
+    learning_path_id: str
+    position: int
+    title: str
+    description: Optional[str] = None
+    skill_type: str
+    completed: bool = False
+    completed_date: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class LearningPathProgress(LearningPathResponse):
+    step_count: int
+    completed_steps: int
+    percent_complete: float
+    last_completed_date: Optional[datetime] = None
+    employee_name: Optional[str] = None
+
+class LearningPathDetail(LearningPathProgress):
+    steps: List[LearningStepResponse] = []
+
+class TeamMemberProgress(BaseModel):
+    """One employee's progress over the paths a manager assigned them."""
+    employee_id: str
+    employee_name: Optional[str] = None
+    path_count: int
+    completed_paths: int
+    step_count: int
+    completed_steps: int
+    percent_complete: float
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class NotificationResponse(BaseModel):
+    id: str
+    user_id: str
+    type: str
+    title: str
+    message: str
+    date: Optional[datetime] = None
+    read: bool
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class NotificationMarkRead(BaseModel):
+    # Mark only this notification and older ones; all when omitted.
+    up_to_id: Optional[str] = None
+
+class NotificationReadResult(BaseModel):
+    marked: int
+    unread: int
+
+class UnreadCount(BaseModel):
+    unread: int
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 class ScoreBase(BaseModel):
@@ -33,4 +33,40 @@ class ScoreWithDetails(ScoreResponse):
     employee_name: Optional[str] = None
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class ScoreBulkError(BaseModel):
+    row: int
+    error: str
+
+class ScoreBulkResult(BaseModel):
+    created: int
+    failed: int
+    ids: List[str]
+    errors: List[ScoreBulkError]
+
+ScoreGroupBy = Literal["employee", "skill", "trainer", "department", "category"]
+
+class ScoreAggregate(BaseModel):
+    employee_id: Optional[str] = None
+    skill_id: Optional[str] = None
+    trainer_id: Optional[str] = None
+    department: Optional[str] = None
+    category: Optional[str] = None
+    count: int
+    average: float
+    min: float
+    max: float
+    stddev: float
+    latest_score: Optional[float] = None
+    latest_date: Optional[datetime] = None
+
+class SkillMatrixEntryResponse(BaseModel):
+    employee_id: str
+    skill_id: str
+    latest_score: float
+    latest_date: Optional[datetime] = None
+    best_score: float
+    attempt_count: int
+    average_score: float
+    stddev: float
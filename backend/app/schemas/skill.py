@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 class SkillBase(BaseModel):
@@ -21,4 +21,13 @@ class SkillResponse(SkillBase):
     updated_at: Optional[datetime] = None
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class SkillCategoryFacet(BaseModel):
+    category: str
+    count: int
+
+class SkillSearchResult(BaseModel):
+    total: int
+    skills: List[SkillResponse]
+    categories: List[SkillCategoryFacet]
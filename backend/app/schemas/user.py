@@ -0,0 +1,35 @@
+from pydantic import BaseModel, EmailStr
+from datetime import datetime
+from typing import List, Literal, Optional
+
+UserRole = Literal["employee", "trainer", "manager", "super-user"]
+
+class UserImportRow(BaseModel):
+    email: EmailStr
+    name: str
+    password: str
+    role: UserRole
+    avatar: Optional[str] = None
+    department: Optional[str] = None
+    experience: Optional[int] = None
+
+class UserImportError(BaseModel):
+    row: int
+    error: str
+
+class UserImportResult(BaseModel):
+    created: int
+    skipped: int
+    failed: int
+    errors: List[UserImportError]
+
+class UserExportRow(BaseModel):
+    id: str
+    email: str
+    name: str
+    role: str
+    department: Optional[str] = None
+    experience: Optional[int] = None
+    avatar: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,21 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable
+
+class AsyncService:
+    """
+    Base for the async service classes. Each call runs a method of the sync
+    ``service_class`` through ``AsyncSession.run_sync``: the queries go over
+    the async driver and the event loop is free while they wait, while crud
+    and the sync services stay the single implementation of every query.
+
+    The Python side of those methods (building and validating responses)
+    does run on the event loop, so nothing that blocks on I/O other than the
+    database may be called inside ``_run``.
+    """
+    service_class: type
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        return await self.db.run_sync(lambda session: method(self.service_class(session), *args, **kwargs))
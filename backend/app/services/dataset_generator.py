@@ -0,0 +1,325 @@
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Table, func, inspect, select, text, update
+from sqlalchemy.orm import Session
+from ..db import crud, models
+from ..utils.password import get_password_hash
+
+PASSWORD = "password123"
+EMAIL_DOMAIN = "generated.example.com"
+
+# (department, relative headcount)
+DEPARTMENTS = [
+    ("Engineering", 30), ("Sales", 12), ("Support", 10), ("Operations", 8), ("Marketing", 7),
+    ("Product", 6), ("Data", 6), ("Finance", 6), ("Design", 5), ("Security", 4), ("HR", 4), ("Legal", 2),
+]
+CATEGORIES = {
+    "Programming": ["Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C#", "Kotlin"],
+    "Frontend": ["React", "Vue", "Angular", "CSS", "Accessibility", "Web Performance"],
+    "Backend": ["FastAPI", "Django", "Spring", "Node.js", "GraphQL", "REST API Design"],
+    "Database": ["SQL", "PostgreSQL", "Query Tuning", "Data Modelling", "Redis", "MongoDB"],
+    "DevOps": ["Docker", "Kubernetes", "Terraform", "CI/CD", "Observability", "Linux"],
+    "Cloud": ["AWS", "Azure", "GCP", "Serverless", "Cloud Networking", "Cost Management"],
+    "Data": ["Statistics", "Machine Learning", "Data Visualisation", "Spark", "Airflow", "Experimentation"],
+    "Security": ["Threat Modelling", "Secure Coding", "Identity Management", "Incident Response"],
+    "Design": ["UX Research", "Interaction Design", "Prototyping", "Design Systems"],
+    "Management": ["Coaching", "Hiring", "Planning", "Stakeholder Management", "Budgeting"],
+    "Communication": ["Technical Writing", "Presenting", "Negotiation", "Facilitation"],
+    "Sales": ["Prospecting", "Account Management", "Product Demos", "Forecasting"],
+}
+LEVELS = ["Fundamentals", "Intermediate", "Advanced", "Expert", "Architecture", "Testing",
+          "Performance", "Tooling", "Operations", "Mentoring"]
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Karen",
+    "Wei", "Priya", "Ahmed", "Fatima", "Hiroshi", "Yuki", "Olga", "Ivan", "Chloe", "Lucas",
+    "Amara", "Kofi", "Sofia", "Mateo", "Aisha", "Omar", "Ingrid", "Lars", "Mei", "Arjun",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Wilson", "Anderson", "Taylor", "Thomas", "Moore", "Jackson", "Martin", "Lee",
+    "Chen", "Wang", "Patel", "Khan", "Tanaka", "Sato", "Kowalski", "Novak", "Dubois", "Rossi",
+    "Okafor", "Mensah", "Silva", "Santos", "Haddad", "Nielsen", "Berg", "Kim", "Nguyen", "Singh",
+]
+STEP_TYPES = ["course", "workshop", "project", "assessment", "reading", "mentoring"]
+NOTIFICATION_TYPES = [("feedback", "New feedback", "Your trainer left feedback on a recent assessment."),
+                      ("assessment", "New score recorded", "A new skill score has been recorded for you."),
+                      ("learning_path", "Learning path assigned", "Your manager assigned you a learning path."),
+                      ("status_change", "Step completed", "A step of your learning path was marked complete.")]
+# Scores are recorded during working hours.
+WORKDAY_START, WORKDAY_SECONDS = 8 * 3600, 10 * 3600
+
+class DatasetGenerator:
+    """
+    Fills a database with a synthetic organisation for load testing:
+    users across departments and roles, skills in categories, scores with
+    per-employee ability, per-skill difficulty and skewed activity, learning
+    paths with steps, and notifications.
+
+    Every draw comes from one seeded generator, so the same seed and
+    ``end`` give the same rows. Draws are made a batch at a time
+    (``random.choices(k=...)`` and list comprehensions over them) and rows
+    are written with DBAPI ``executemany`` in batches, with the secondary
+    indexes of the big tables dropped during the load and rebuilt once at
+    the end. The skill matrix and unread counters are rebuilt from the
+    generated rows.
+    """
+
+    def __init__(self, db: Session, seed: int = 1, end: Optional[datetime] = None, days: int = 730,
+                 batch_size: int = 100000, progress: Callable[[str], None] = lambda message: None):
+        self.db = db
+        self.rng = random.Random(seed)
+        end = end or datetime.utcnow()
+        self.start = datetime(end.year, end.month, end.day) - timedelta(days=days)
+        self.days = days
+        self.batch_size = batch_size
+        self.progress = progress
+        self.day_strings = [(self.start + timedelta(days=d)).strftime("%Y-%m-%d ") for d in range(days + 1)]
+        self.time_strings = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)]
+
+    def generate(self, users: int, skills: int, scores: int, learning_paths: int, notifications: int) -> Dict[str, int]:
+        """Generate everything; returns the number of rows written per table."""
+        if self.db.execute(select(models.User.id).where(models.User.email.like(f"%@{EMAIL_DOMAIN}")).limit(1)).first():
+            raise ValueError(f"The database already holds generated users (@{EMAIL_DOMAIN}); use an empty database")
+        tables = [models.Score.__table__, models.Notification.__table__,
+                  models.LearningPath.__table__, models.LearningStep.__table__]
+        dropped = self._drop_indexes(tables)
+        try:
+            people = self.generate_users(users)
+            skill_rows = self.generate_skills(skills)
+            counts = {"users": users, "skills": skills}
+            counts["scores"] = self.generate_scores(scores, people, skill_rows)
+            counts["learning_paths"], counts["learning_steps"] = self.generate_learning_paths(
+                learning_paths, people, skill_rows)
+            counts["notifications"] = self.generate_notifications(notifications, people["employee"])
+        finally:
+            self.progress("Rebuilding indexes")
+            self._create_indexes(dropped)
+        self.progress("Rebuilding the skill matrix")
+        counts["skill_matrix"] = crud.rebuild_skill_matrix(self.db)
+        self.progress("Counting unread notifications")
+        self._update_unread_counts()
+        return counts
+
+    def generate_users(self, count: int) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Insert ``count`` users: about 1% managers and 2% trainers spread over
+        every department, the rest employees weighted by department size.
+        Returns ``(id, department)`` pairs per role.
+        """
+        rng = self.rng
+        managers = max(1, count // 100)
+        trainers = max(1, count // 50)
+        names, weights = zip(*DEPARTMENTS)
+        departments = ([names[i % len(names)] for i in range(managers + trainers)]
+                       + rng.choices(names, weights, k=max(0, count - managers - trainers)))
+        roles = ["manager"] * managers + ["trainer"] * trainers + ["employee"] * (count - managers - trainers)
+        firsts, lasts = rng.choices(FIRST_NAMES, k=count), rng.choices(LAST_NAMES, k=count)
+        hashed = get_password_hash(PASSWORD)
+        rows = [(self._uuid(), f"{first.lower()}.{last.lower()}.{i}@{EMAIL_DOMAIN}", f"{first} {last}", hashed,
+                 role, department, min(40, int(rng.expovariate(1 / 6))))
+                for i, (first, last, role, department) in enumerate(zip(firsts, lasts, roles, departments))]
+        self._insert(models.User.__table__,
+                     ["id", "email", "name", "hashed_password", "role", "department", "experience"], rows)
+        people: Dict[str, List[Tuple[str, str]]] = {"employee": [], "trainer": [], "manager": []}
+        for row in rows:
+            people[row[4]].append((row[0], row[5]))
+        self.progress(f"Users: {count}")
+        return people
+
+    def generate_skills(self, count: int) -> List[Tuple[str, str]]:
+        """Insert ``count`` skills spread over the categories; returns ``(id, category)`` pairs."""
+        categories = list(CATEGORIES)
+        rows = []
+        for i in range(count):
+            category = categories[i % len(categories)]
+            topics = CATEGORIES[category]
+            n = i // len(categories)
+            topic = topics[n % len(topics)]
+            round_, level = divmod(n // len(topics), len(LEVELS))
+            name = f"{topic} {LEVELS[level]}" + (f" {round_ + 1}" if round_ else "")
+            rows.append((self._uuid(), name, category, f"{LEVELS[level]} {topic} ({category})"))
+        self._insert(models.Skill.__table__, ["id", "name", "category", "description"], rows)
+        self.progress(f"Skills: {count}")
+        return [(row[0], row[2]) for row in rows]
+
+    def generate_scores(self, count: int, people: Dict[str, List[Tuple[str, str]]],
+                        skills: Sequence[Tuple[str, str]]) -> int:
+        """
+        Insert ``count`` scores. A few employees and skills account for most
+        scores (Pareto and Zipf weights); each score is the employee's
+        ability less the skill's difficulty plus noise, recorded by a trainer
+        of the skill's category during working hours, with more scores in
+        recent months.
+        """
+        rng = self.rng
+        employees = people["employee"] or people["trainer"]
+        if not count or not employees or not skills:
+            return 0
+        employee_ids = [e for e, _ in employees]
+        employee_weights = _cumulative(rng.paretovariate(1.5) for _ in employees)
+        ability = [rng.gauss(65, 12) for _ in employees]
+        skill_ids = [s for s, _ in skills]
+        skill_weights = _cumulative(1 / (rank + 1) ** 0.8 for rank in range(len(skills)))
+        difficulty = [rng.gauss(0, 8) for _ in skills]
+        categories = sorted({category for _, category in skills})
+        trainers = [t for t, _ in people["trainer"]] or employee_ids
+        by_category = {category: trainers[i::len(categories)] or trainers for i, category in enumerate(categories)}
+        skill_trainers = [by_category[category] for _, category in skills]
+        employee_range, skill_range = range(len(employees)), range(len(skills))
+        day_strings, time_strings, days = self.day_strings, self.time_strings, self.days
+        gauss, rand, randrange, choice = rng.gauss, rng.random, rng.randrange, rng.choice
+
+        written = 0
+        while written < count:
+            n = min(self.batch_size, count - written)
+            es = rng.choices(employee_range, cum_weights=employee_weights, k=n)
+            ss = rng.choices(skill_range, cum_weights=skill_weights, k=n)
+            rows = []
+            for e, s in zip(es, ss):
+                # sqrt skews the day towards the end of the window.
+                date = day_strings[int(days * math.sqrt(rand()))] + time_strings[WORKDAY_START + randrange(WORKDAY_SECONDS)]
+                score = ability[e] - difficulty[s] + gauss(0, 10)
+                rows.append((self._uuid(), employee_ids[e], skill_ids[s],
+                             float(round(min(100.0, max(0.0, score)))), date,
+                             choice(skill_trainers[s]), date))
+            self._insert(models.Score.__table__,
+                         ["id", "employee_id", "skill_id", "score", "date", "trainer_id", "created_at"], rows)
+            written += n
+            self.progress(f"Scores: {written}/{count}")
+        return written
+
+    def generate_learning_paths(self, count: int, people: Dict[str, List[Tuple[str, str]]],
+                                skills: Sequence[Tuple[str, str]]) -> Tuple[int, int]:
+        """
+        Insert ``count`` learning paths of 3-8 steps on one skill category,
+        each assigned to an employee by a manager of their department. The
+        steps completed so far are a prefix of the path.
+        """
+        rng = self.rng
+        employees = people["employee"]
+        if not count or not employees or not people["manager"] or not skills:
+            return 0, 0
+        managers: Dict[str, List[str]] = {}
+        for manager_id, department in people["manager"]:
+            managers.setdefault(department, []).append(manager_id)
+        all_managers = [m for m, _ in people["manager"]]
+        category_skills: Dict[str, List[str]] = {}
+        for skill_id, category in skills:
+            category_skills.setdefault(category, []).append(skill_id)
+        categories = sorted(category_skills)
+        names = dict(self.db.execute(select(models.Skill.id, models.Skill.name)).all())
+
+        paths, steps = [], []
+        for employee_id, department in rng.choices(employees, k=count):
+            path_id = self._uuid()
+            category = rng.choice(categories)
+            assigned = rng.randrange(self.days)
+            paths.append((path_id, f"{category} path", employee_id,
+                          rng.choice(managers.get(department) or all_managers),
+                          self.day_strings[assigned] + "09:00:00"))
+            length = rng.randint(3, 8)
+            done = int(length * rng.random() ** 0.7) if assigned < self.days - 7 else 0
+            for i, skill_id in enumerate(rng.sample(category_skills[category], min(length, len(category_skills[category])))):
+                completed = i < done
+                completed_day = min(self.days, assigned + 7 * (i + 1))
+                steps.append((self._uuid(), path_id, i, names[skill_id], rng.choice(STEP_TYPES), completed,
+                              self.day_strings[completed_day] + "17:00:00" if completed else None))
+        self._insert(models.LearningPath.__table__,
+                     ["id", "title", "employee_id", "assigned_by", "assigned_date"], paths)
+        self._insert(models.LearningStep.__table__,
+                     ["id", "learning_path_id", "position", "title", "skill_type", "completed", "completed_date"], steps)
+        self.progress(f"Learning paths: {len(paths)}, steps: {len(steps)}")
+        return len(paths), len(steps)
+
+    def generate_notifications(self, count: int, employees: Sequence[Tuple[str, str]]) -> int:
+        """Insert ``count`` notifications for employees; older ones are more likely to be read."""
+        rng = self.rng
+        if not count or not employees:
+            return 0
+        written = 0
+        while written < count:
+            n = min(self.batch_size, count - written)
+            rows = []
+            for (user_id, _), (type_, title, message) in zip(rng.choices(employees, k=n),
+                                                             rng.choices(NOTIFICATION_TYPES, k=n)):
+                day = int(self.days * math.sqrt(rng.random()))
+                rows.append((self._uuid(), user_id, type_, title, message,
+                             self.day_strings[day] + self.time_strings[rng.randrange(86400)],
+                             rng.random() < 0.5 + 0.5 * (1 - day / self.days) ** 0.3))
+            self._insert(models.Notification.__table__,
+                         ["id", "user_id", "type", "title", "message", "date", "read"], rows)
+            written += n
+        self.progress(f"Notifications: {written}")
+        return written
+
+    def _uuid(self) -> str:
+        # The string form of a version 4 UUID, built from the hex digits
+        # directly: half the cost of going through uuid.UUID.
+        h = "%032x" % self.rng.getrandbits(128)
+        return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+    def _insert(self, table: Table, columns: List[str], rows: list) -> None:
+        """executemany ``rows`` (tuples in ``columns`` order) through the DBAPI cursor, then commit."""
+        if not rows:
+            return
+        # Written out rather than compiled from the table, which would add
+        # parameters for every column with a Python-side default.
+        dialect = self.db.get_bind().dialect
+        quote = dialect.identifier_preparer.quote
+        if dialect.paramstyle in ("named", "pyformat"):
+            marker = ":{}" if dialect.paramstyle == "named" else "%({})s"
+            placeholders = [marker.format(name) for name in columns]
+            rows = [dict(zip(columns, row)) for row in rows]
+        else:
+            placeholders = ["?" if dialect.paramstyle == "qmark" else "%s"] * len(columns)
+        sql = (f"INSERT INTO {quote(table.name)} ({', '.join(quote(name) for name in columns)}) "
+               f"VALUES ({', '.join(placeholders)})")
+        cursor = self.db.connection().connection.cursor()
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                cursor.executemany(sql, rows[start:start + self.batch_size])
+        finally:
+            cursor.close()
+        self.db.commit()
+
+    def _drop_indexes(self, tables: Sequence[Table]) -> List[str]:
+        """
+        Drop the non-unique indexes of ``tables``, since building them once
+        after the load is far cheaper; returns the statements that recreate them.
+        """
+        quote = self.db.get_bind().dialect.identifier_preparer.quote
+        inspector = inspect(self.db.get_bind())
+        recreate = []
+        for table in tables:
+            for index in inspector.get_indexes(table.name):
+                if index["unique"] or None in index["column_names"]:
+                    continue
+                self.db.execute(text(f"DROP INDEX {quote(index['name'])}"))
+                recreate.append(f"CREATE INDEX {quote(index['name'])} ON {quote(table.name)} "
+                                f"({', '.join(quote(name) for name in index['column_names'])})")
+        self.db.commit()
+        return recreate
+
+    def _create_indexes(self, statements: Sequence[str]) -> None:
+        self.db.rollback()
+        for statement in statements:
+            self.db.execute(text(statement))
+        self.db.commit()
+
+    def _update_unread_counts(self) -> None:
+        unread = (select(func.count()).select_from(models.Notification)
+                  .where(models.Notification.user_id == models.User.id, models.Notification.read.is_(False))
+                  .scalar_subquery())
+        self.db.execute(update(models.User).where(models.User.email.like(f"%@{EMAIL_DOMAIN}"))
+                        .values(unread_notifications=unread))
+        self.db.commit()
+
+def _cumulative(weights) -> List[float]:
+    total, cumulative = 0.0, []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
@@ -0,0 +1,149 @@
+import logging
+import smtplib
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..db import crud, models
+from ..db.base import SessionLocal
+from ..utils.email import Mailer, build_message, create_mailer
+
+logger = logging.getLogger(__name__)
+
+def is_permanent(error: Exception) -> bool:
+    """A 5xx answer: the server will refuse the message however often it is retried."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+def is_server_answer(error: Exception) -> bool:
+    """The server rejected this message, as opposed to not being reachable at all."""
+    return isinstance(error, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused))
+
+class EmailOutboxWorker:
+    """
+    Sends the messages queued in the email outbox from a background thread.
+
+    Each pass claims a batch of due messages and sends them over one SMTP
+    connection, which is kept open while batches keep coming and closed
+    when the outbox runs dry. A failed message is retried after a delay that
+    doubles with every attempt (capped), and dead-lettered after
+    ``max_attempts`` or straight away when the server rejects it
+    permanently. Claims are conditional updates, so any number of processes
+    can run a worker against the same database.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 mailer_factory: Callable[[], Mailer] = create_mailer, batch_size: int = 50,
+                 poll_seconds: float = 5.0, max_attempts: int = 8, retry_base_seconds: float = 30.0,
+                 retry_max_seconds: float = 3600.0, claim_seconds: float = 300.0):
+        self.session_factory = session_factory
+        self.mailer_factory = mailer_factory
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.claim_seconds = claim_seconds
+        self.token = uuid.uuid4().hex
+        self._mailer: Optional[Mailer] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds to wait after the ``attempts``-th failed attempt."""
+        return min(self.retry_base_seconds * 2 ** (attempts - 1), self.retry_max_seconds)
+
+    def drain_once(self, now: Optional[datetime] = None) -> int:
+        """Send one batch of due messages; returns how many were claimed."""
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            batch = crud.claim_outbox_emails(db, now, now + timedelta(seconds=self.claim_seconds),
+                                             self.token, self.batch_size)
+            if not batch:
+                return 0
+            if self._mailer is None:
+                self._mailer = self.mailer_factory()
+            unreachable: Optional[Exception] = None
+            for db_email in batch:
+                error = unreachable
+                if error is None:
+                    try:
+                        self._mailer.send(build_message(db_email.to_email, db_email.subject, db_email.body))
+                    except (smtplib.SMTPException, OSError) as exc:
+                        error = exc
+                        if not is_server_answer(exc):
+                            # No point trying the rest of the batch now.
+                            unreachable = exc
+                if error is None:
+                    crud.mark_email_sent(db, db_email)
+                else:
+                    crud.mark_email_failed(db, db_email, f"{type(error).__name__}: {error}",
+                                           self._retry_at(db_email, error))
+            db.commit()
+            return len(batch)
+        finally:
+            db.close()
+
+    def _retry_at(self, db_email: models.OutboxEmail, error: Exception) -> Optional[datetime]:
+        attempts = db_email.attempts + 1
+        if attempts >= self.max_attempts or is_permanent(error):
+            return None
+        return datetime.utcnow() + timedelta(seconds=self.retry_delay(attempts))
+
+    def wake(self) -> None:
+        """Start the next pass now rather than after the poll interval."""
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop after the current batch; unsent messages stay in the outbox."""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                claimed = self.drain_once()
+            except Exception:
+                logger.exception("Email outbox pass failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                self._close_mailer()
+                self._wake.wait(self.poll_seconds)
+        self._close_mailer()
+
+    def _close_mailer(self) -> None:
+        if self._mailer is not None:
+            self._mailer.close()
+            self._mailer = None
+
+email_outbox_worker = EmailOutboxWorker(
+    batch_size=settings.email_batch_size,
+    poll_seconds=settings.email_poll_seconds,
+    max_attempts=settings.email_max_attempts,
+    retry_base_seconds=settings.email_retry_base_seconds,
+    retry_max_seconds=settings.email_retry_max_seconds,
+    claim_seconds=settings.email_claim_seconds,
+)
+
+@event.listens_for(Session, "after_commit")
+def wake_outbox_worker(session):
+    # Mail queued by crud.queue_email goes out right after its commit instead
+    # of at the next poll.
+    if session.info.pop("queued_email", False):
+        email_outbox_worker.wake()
@@ -1,15 +1,21 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..db import crud
+from ..utils.pagination import decode_cursor, paginate
 from ..db.models import User
 from ..schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse, EmployeeWithScores
-from ..utils.email import send_welcome_email
+from ..utils.password import password_hasher
+from ..utils.serialization import RowListEncoder
+from .async_service import AsyncService
+
+_employee_list = RowListEncoder(EmployeeResponse)
 
 class EmployeeService:
     def __init__(self, db: Session):
         self.db = db
     
-    def create_employee(self, employee_data: EmployeeCreate) -> EmployeeResponse:
+    def create_employee(self, employee_data: EmployeeCreate, hashed_password: Optional[str] = None,
+                        send_welcome: bool = True) -> EmployeeResponse:
         """Create a new employee."""
         db_employee = crud.create_user(
             db=self.db,
@@ -19,12 +25,10 @@ class EmployeeService:
             role="employee",
             avatar=employee_data.avatar,
             department=employee_data.department,
-            experience=employee_data.experience
+            experience=employee_data.experience,
+            hashed_password=hashed_password,
+            send_welcome=send_welcome
         )
-        
-        # Send welcome email
-        send_welcome_email(employee_data.email, employee_data.name)
-        
         return EmployeeResponse.model_validate(db_employee)
     
     def get_employee(self, employee_id: str) -> Optional[EmployeeResponse]:
@@ -34,14 +38,14 @@ class EmployeeService:
             return EmployeeResponse.model_validate(db_employee)
         return None
     
-    def get_employees(self, skip: int = 0, limit: int = 100) -> List[EmployeeResponse]:
-        """Get all employees."""
-        db_employees = crud.get_users(self.db, skip, limit)
-        return [
-            EmployeeResponse.model_validate(emp) 
-            for emp in db_employees 
-            if emp.role == "employee"
-        ]
+    def get_employees(self, skip: int = 0, limit: int = 100,
+                      cursor: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        """Get a page of employees ordered by id as JSON, plus the cursor for the next page."""
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        rows = crud.get_users_by_role(self.db, "employee", after_id, skip, limit + 1,
+                                      _employee_list.columns(User))
+        page, next_cursor = paginate(rows, limit, lambda row: (row.id,))
+        return _employee_list.encode(page), next_cursor
     
     def update_employee(self, employee_id: str, employee_data: EmployeeUpdate) -> Optional[EmployeeResponse]:
         """Update employee."""
@@ -59,7 +63,52 @@ class EmployeeService:
     
     def get_employee_with_scores(self, employee_id: str) -> Optional[EmployeeWithScores]:
         """Get employee with their scores."""
-        db_employee = crud.get_user(self.db, employee_id)
+        db_employee = crud.get_user_with_scores(self.db, employee_id)
         if db_employee and db_employee.role == "employee":
             return EmployeeWithScores.model_validate(db_employee)
-        return None 
\ No newline at end of file
+        return None
+    
+    def get_employees_with_scores(self, employee_ids: Optional[List[str]] = None,
+                                  department: Optional[str] = None, latest: Optional[int] = None,
+                                  cursor: Optional[str] = None,
+                                  limit: int = 100) -> Tuple[List[EmployeeWithScores], Optional[str]]:
+        """Get a page of employees with their scores in a fixed number of queries."""
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        db_employees = crud.get_employees_with_scores(
+            self.db, employee_ids, department, after_id, limit + 1, latest
+        )
+        page, next_cursor = paginate(db_employees, limit, lambda emp: (emp.id,))
+        return [EmployeeWithScores.model_validate(emp) for emp in page], next_cursor
+
+class AsyncEmployeeService(AsyncService):
+    """EmployeeService for async routes."""
+    service_class = EmployeeService
+    
+    async def create_employee(self, employee_data: EmployeeCreate) -> EmployeeResponse:
+        # Hash before entering run_sync so bcrypt never blocks the event loop.
+        hashed_password = await password_hasher.ahash(employee_data.password)
+        return await self._run(EmployeeService.create_employee, employee_data, hashed_password)
+    
+    async def get_employee(self, employee_id: str) -> Optional[EmployeeResponse]:
+        return await self._run(EmployeeService.get_employee, employee_id)
+    
+    async def get_employees(self, skip: int = 0, limit: int = 100,
+                            cursor: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        return await self._run(EmployeeService.get_employees, skip, limit, cursor)
+    
+    async def update_employee(self, employee_id: str, employee_data: EmployeeUpdate) -> Optional[EmployeeResponse]:
+        return await self._run(EmployeeService.update_employee, employee_id, employee_data)
+    
+    async def delete_employee(self, employee_id: str) -> bool:
+        return await self._run(EmployeeService.delete_employee, employee_id)
+    
+    async def get_employee_with_scores(self, employee_id: str) -> Optional[EmployeeWithScores]:
+        return await self._run(EmployeeService.get_employee_with_scores, employee_id)
+    
+    async def get_employees_with_scores(self, employee_ids: Optional[List[str]] = None,
+                                        department: Optional[str] = None, latest: Optional[int] = None,
+                                        cursor: Optional[str] = None,
+                                        limit: int = 100) -> Tuple[List[EmployeeWithScores], Optional[str]]:
+        return await self._run(EmployeeService.get_employees_with_scores, employee_ids, department,
+                               latest, cursor, limit)
+
@@ -0,0 +1,47 @@
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterator, Optional, Sequence
+from ..core.config import settings
+from ..db import crud, models
+from ..schemas.learning_path import LearningPathExportRow, LearningPathResponse
+from ..schemas.score import ScoreResponse, ScoreWithDetails
+from ..schemas.user import UserExportRow
+from ..utils.serialization import RowListEncoder
+
+score_export = RowListEncoder(ScoreWithDetails)
+user_export = RowListEncoder(UserExportRow)
+learning_path_export = RowListEncoder(LearningPathExportRow)
+
+class ExportService:
+    """
+    Batches of rows for the streaming exports, each batch read from the
+    database as the previous one is sent. The session has to stay open until
+    the batches are exhausted.
+    """
+
+    def __init__(self, db: Session, batch_size: int = settings.export_batch_size):
+        self.db = db
+        self.batch_size = batch_size
+    
+    def score_batches(self, employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                      trainer_id: Optional[str] = None, date_from: Optional[datetime] = None,
+                      date_to: Optional[datetime] = None) -> Iterator[Sequence]:
+        """Scores newest first with skill, trainer and employee names, rows as score_export expects."""
+        return crud.stream_score_details(
+            self.db, score_export.columns(models.Score, ScoreResponse.model_fields),
+            employee_id, skill_id, trainer_id,
+            crud.score_date_bound(date_from) if date_from else None,
+            crud.score_date_bound(date_to) if date_to else None,
+            self.batch_size,
+        )
+    
+    def user_batches(self, role: Optional[str] = None) -> Iterator[Sequence]:
+        """Users by id, without password hashes."""
+        return crud.stream_users(self.db, user_export.columns(models.User), role, self.batch_size)
+    
+    def learning_path_batches(self, employee_id: Optional[str] = None) -> Iterator[Sequence]:
+        """Learning paths by id with employee and assigner names."""
+        return crud.stream_learning_paths(
+            self.db, learning_path_export.columns(models.LearningPath, LearningPathResponse.model_fields),
+            employee_id, self.batch_size,
+        )
@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Session
+from typing import Optional, Tuple
+from ..db import crud, models
+from ..schemas.learning_path import (
+    LearningPathCreate, LearningPathDetail, LearningPathProgress, LearningPathResponse,
+    LearningStepResponse, TeamMemberProgress,
+)
+from ..utils.pagination import decode_cursor, paginate
+from ..utils.serialization import RowListEncoder
+from .notification_service import NotificationService
+
+_path_list = RowListEncoder(LearningPathProgress)
+_team_list = RowListEncoder(TeamMemberProgress)
+_step_list = RowListEncoder(LearningStepResponse)
+# The path's own columns; crud appends the progress columns in schema order.
+_path_columns = _path_list.columns(models.LearningPath, tuple(LearningPathResponse.model_fields))
+
+class LearningPathService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_paths(self, employee_id: Optional[str] = None, assigned_by: Optional[str] = None,
+                  cursor: Optional[str] = None, limit: int = 100) -> Tuple[bytes, Optional[str]]:
+        """Get a page of learning paths with their progress as JSON, by id, plus the next cursor."""
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        rows = crud.get_learning_paths_progress(self.db, _path_columns, employee_id=employee_id,
+                                                assigned_by=assigned_by, after_id=after_id, limit=limit + 1)
+        page, next_cursor = paginate(rows, limit, lambda row: (row.id,))
+        return _path_list.encode(page), next_cursor
+
+    def get_path(self, path_id: str) -> Optional[LearningPathDetail]:
+        """A path with its progress and its steps in order."""
+        rows = crud.get_learning_paths_progress(self.db, _path_columns, path_id=path_id)
+        if not rows:
+            return None
+        steps = crud.get_learning_steps_by_path(self.db, path_id, _step_list.columns(models.LearningStep))
+        path = _path_list.validate(rows)[0]
+        return LearningPathDetail(**dict(path), steps=_step_list.validate(steps))
+
+    def get_team_progress(self, manager_id: str, cursor: Optional[str] = None,
+                          limit: int = 100) -> Tuple[bytes, Optional[str]]:
+        """Get a page of per-employee progress over the paths ``manager_id`` assigned, by employee id."""
+        after = decode_cursor(cursor, 1)[0] if cursor else None
+        rows = crud.get_team_learning_progress(self.db, manager_id, after, limit + 1)
+        page, next_cursor = paginate(rows, limit, lambda row: (row.employee_id,))
+        return _team_list.encode(page), next_cursor
+
+    def create_path(self, path_in: LearningPathCreate, assigned_by: str) -> Optional[LearningPathDetail]:
+        """Assign a new path to an employee and notify them; None if there is no such employee."""
+        employee = crud.get_user(self.db, path_in.employee_id)
+        if not employee or employee.role != "employee":
+            return None
+        db_path = crud.create_learning_path_with_steps(
+            self.db, path_in.title, path_in.employee_id, assigned_by,
+            [step.model_dump() for step in path_in.steps],
+        )
+        path_id = db_path.id
+        NotificationService(self.db).create_notification(
+            path_in.employee_id, "learning_path", "New learning path",
+            f'You have been assigned the learning path "{path_in.title}".',
+        )
+        return self.get_path(path_id)
+
+    def set_step_completed(self, path_id: str, step_id: str, completed: bool) -> Optional[LearningPathDetail]:
+        """
+        Mark a step done or not done and return the path with its new
+        progress; None if the path has no such step. The assigning manager
+        is notified when the path's last step is completed.
+        """
+        changed = crud.set_learning_step_completed(self.db, path_id, step_id, completed)
+        if changed is None:
+            return None
+        path = self.get_path(path_id)
+        if changed and completed and path.completed_steps == path.step_count:
+            NotificationService(self.db).create_notification(
+                path.assigned_by, "learning_path", "Learning path completed",
+                f'{path.employee_name or "An employee"} completed the learning path "{path.title}".',
+            )
+        return path
@@ -1,16 +1,25 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional, Tuple
 from ..db import crud
+from ..utils.pagination import decode_cursor, paginate
 from ..schemas.manager import ManagerCreate, ManagerUpdate, ManagerOut
-from ..utils.email import send_welcome_email
+from ..db.models import User
+from ..utils.serialization import RowListEncoder
+
+_manager_list = RowListEncoder(ManagerOut)
 
 class ManagerService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all_managers(self, skip: int = 0, limit: int = 100) -> List[ManagerOut]:
-        users = crud.get_users(self.db, skip, limit)
-        return [ManagerOut.model_validate(u) for u in users if u.role == "manager"]
+    def get_all_managers(self, skip: int = 0, limit: int = 100,
+                         cursor: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        """Get a page of managers ordered by id as JSON, plus the cursor for the next page."""
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        rows = crud.get_users_by_role(self.db, "manager", after_id, skip, limit + 1,
+                                      _manager_list.columns(User))
+        page, next_cursor = paginate(rows, limit, lambda row: (row.id,))
+        return _manager_list.encode(page), next_cursor
 
     def get_manager_by_id(self, manager_id: str) -> Optional[ManagerOut]:
         user = crud.get_user(self.db, manager_id)
@@ -28,8 +37,8 @@ class ManagerService:
             avatar=manager_in.avatar,
             department=manager_in.department,
             experience=manager_in.experience,
+            send_welcome=True,
         )
-        send_welcome_email(manager_in.email, manager_in.name)
         return ManagerOut.model_validate(user)
 
     def update_manager(self, manager_id: str, manager_in: ManagerUpdate) -> Optional[ManagerOut]:
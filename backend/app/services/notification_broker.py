@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+from ..core.config import settings
+
+Event = Tuple[str, str]  # (event name, JSON data)
+
+# Sent in place of whatever a subscriber missed when its queue overflowed:
+# the client refetches the feed and count instead.
+RESYNC: Event = ("resync", "{}")
+
+class Subscription:
+    """One stream's queue of events, read on the event loop it was opened on."""
+
+    def __init__(self, user_id: str, loop: asyncio.AbstractEventLoop, max_queued: int):
+        self.user_id = user_id
+        self.loop = loop
+        self._queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue(max_queued)
+
+    def _put(self, event: Optional[Event]) -> None:
+        if self._queue.full():
+            # A client this far behind gets one resync rather than a partial history.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            event = RESYNC if event is not None else None
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """
+        The next event; None after ``timeout`` seconds without one. Raises
+        EOFError once the broker has closed the subscription.
+        """
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is None:
+            raise EOFError
+        return event
+
+class NotificationBroker:
+    """
+    In-process pub/sub from notification writes to open event streams.
+
+    Publishing is safe from any thread: events are handed to each
+    subscriber's loop with call_soon_threadsafe. An idle subscriber costs a
+    small queue and a waiting task, no thread. Only streams served by this
+    process are reached; with several workers each serves its own clients'
+    streams, and a client whose stream landed on another worker sees the
+    change on its next feed or count request.
+    """
+
+    def __init__(self, max_queued: int = 100):
+        self.max_queued = max_queued
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: str) -> Subscription:
+        """Open a subscription; call from the coroutine that will read it."""
+        subscription = Subscription(user_id, asyncio.get_running_loop(), self.max_queued)
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def publish(self, user_id: str, event: str, data: str) -> int:
+        """Queue an event for every stream the user has open here; returns how many."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            self._deliver(subscription, (event, data))
+        return len(subscribers)
+
+    def subscribed(self, user_ids: Iterable[str]) -> Set[str]:
+        """Those of ``user_ids`` with a stream open here, so bulk writes only load what they will publish."""
+        with self._lock:
+            return {user_id for user_id in user_ids if user_id in self._subscribers}
+
+    def close(self) -> None:
+        """End every open stream (at shutdown, so idle streams do not hold it up)."""
+        with self._lock:
+            subscribers = [s for group in self._subscribers.values() for s in group]
+            self._subscribers.clear()
+        for subscription in subscribers:
+            self._deliver(subscription, None)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(group) for group in self._subscribers.values())
+
+    @staticmethod
+    def _deliver(subscription: Subscription, event: Optional[Event]) -> None:
+        try:
+            subscription.loop.call_soon_threadsafe(subscription._put, event)
+        except RuntimeError:  # its loop has already closed
+            pass
+
+notification_broker = NotificationBroker(max_queued=settings.notification_stream_max_queued)
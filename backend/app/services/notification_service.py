@@ -0,0 +1,87 @@
+from sqlalchemy.orm import Session
+from typing import Iterable, Optional, Tuple
+from ..db import crud, models
+from ..schemas.notification import NotificationReadResult, NotificationResponse, UnreadCount
+from ..utils.pagination import decode_cursor, paginate
+from ..utils.serialization import RowListEncoder
+from .async_service import AsyncService
+from .notification_broker import notification_broker
+
+_notification_list = RowListEncoder(NotificationResponse)
+
+class NotificationService:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_notifications(self, user_id: str, cursor: Optional[str] = None, limit: int = 50,
+                          unread_only: bool = False) -> Tuple[bytes, Optional[str]]:
+        """Get a page of the user's notifications as JSON, newest first, plus the next cursor."""
+        after = tuple(decode_cursor(cursor, 2)) if cursor else None
+        rows = crud.get_notifications_page(self.db, user_id, after, unread_only, limit + 1,
+                                           _notification_list.columns(models.Notification))
+        page, next_cursor = paginate(rows, limit, lambda row: (row[-1], row.id))
+        return _notification_list.encode(page), next_cursor
+    
+    def get_unread_count(self, user_id: str) -> UnreadCount:
+        return UnreadCount(unread=crud.get_unread_count(self.db, user_id))
+    
+    def create_notification(self, user_id: str, type: str, title: str, message: str) -> NotificationResponse:
+        """Store a notification and push it to the user's open streams."""
+        db_notification = crud.create_notification(self.db, user_id, type, title, message)
+        notification = NotificationResponse.model_validate(db_notification)
+        notification_broker.publish(user_id, "notification", notification.model_dump_json())
+        self._publish_unread(user_id)
+        return notification
+    
+    def publish_stored(self, notifications: Iterable[Tuple[str, str]]) -> None:
+        """
+        Push notifications a bulk write committed, given as (user_id,
+        notification_id) pairs, and their users' unread counts to the streams
+        open here. Only the rows of users with a stream are loaded.
+        """
+        ids = dict(notifications)
+        watched = notification_broker.subscribed(ids)
+        if not watched:
+            return
+        rows = crud.get_notifications_by_ids(self.db, [ids[user_id] for user_id in watched],
+                                             _notification_list.columns(models.Notification))
+        for notification in _notification_list.validate(rows):
+            notification_broker.publish(notification.user_id, "notification", notification.model_dump_json())
+            self._publish_unread(notification.user_id)
+    
+    def mark_read(self, user_id: str, notification_id: str) -> Optional[NotificationResponse]:
+        """Mark one of the user's notifications read; None if it is not theirs."""
+        db_notification = crud.get_notification(self.db, notification_id)
+        if not db_notification or db_notification.user_id != user_id:
+            return None
+        was_unread = not db_notification.read
+        db_notification = crud.mark_notification_read(self.db, notification_id)
+        if was_unread:
+            self._publish_unread(user_id)
+        return NotificationResponse.model_validate(db_notification)
+    
+    def mark_all_read(self, user_id: str, up_to_id: Optional[str] = None) -> Optional[NotificationReadResult]:
+        """
+        Mark the user's notifications read: all of them, or ``up_to_id`` and
+        everything older. None if ``up_to_id`` is not one of theirs.
+        """
+        up_to = None
+        if up_to_id is not None:
+            up_to = crud.get_notification_key(self.db, user_id, up_to_id)
+            if up_to is None:
+                return None
+        marked = crud.mark_notifications_read(self.db, user_id, up_to)
+        unread = self._publish_unread(user_id) if marked else crud.get_unread_count(self.db, user_id)
+        return NotificationReadResult(marked=marked, unread=unread)
+    
+    def _publish_unread(self, user_id: str) -> int:
+        count = self.get_unread_count(user_id)
+        notification_broker.publish(user_id, "unread", count.model_dump_json())
+        return count.unread
+
+class AsyncNotificationService(AsyncService):
+    """NotificationService for async routes."""
+    service_class = NotificationService
+    
+    async def get_unread_count(self, user_id: str) -> UnreadCount:
+        return await self._run(NotificationService.get_unread_count, user_id)
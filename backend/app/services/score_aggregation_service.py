@@ -0,0 +1,69 @@
+import math
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional, Sequence
+from ..db import crud
+from ..schemas.score import ScoreAggregate
+from .async_service import AsyncService
+
+# Aggregate fields named after the group key they carry.
+GROUP_FIELDS = {
+    "employee": "employee_id",
+    "skill": "skill_id",
+    "trainer": "trainer_id",
+    "department": "department",
+    "category": "category",
+}
+
+class ScoreAggregationService:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def aggregate(self, group_by: Sequence[str] = (), employee_id: Optional[str] = None,
+                  skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                  department: Optional[str] = None, category: Optional[str] = None,
+                  date_from: Optional[datetime] = None,
+                  date_to: Optional[datetime] = None) -> List[ScoreAggregate]:
+        """Score statistics per combination of ``group_by`` keys, computed in one query."""
+        group_by = list(dict.fromkeys(group_by))
+        rows = crud.aggregate_scores(
+            self.db, group_by, employee_id, skill_id, trainer_id, department, category,
+            crud.score_date_bound(date_from) if date_from else None,
+            crud.score_date_bound(date_to) if date_to else None,
+        )
+        aggregates = []
+        for row in rows:
+            if not row.count:
+                continue
+            # Population standard deviation from the sum of squares; clamp the
+            # tiny negatives floating point can produce for constant scores.
+            variance = max(row.sum_squares / row.count - row.average ** 2, 0.0)
+            aggregates.append(ScoreAggregate(
+                **{GROUP_FIELDS[name]: getattr(row, name) for name in group_by},
+                count=row.count,
+                average=row.average,
+                min=row.min,
+                max=row.max,
+                stddev=math.sqrt(variance),
+                latest_score=row.latest_score,
+                latest_date=row.latest_date,
+            ))
+        return aggregates
+    
+    def get_employee_average_score(self, employee_id: str) -> Optional[float]:
+        """Get average score for an employee."""
+        aggregates = self.aggregate(employee_id=employee_id)
+        return aggregates[0].average if aggregates else None
+
+class AsyncScoreAggregationService(AsyncService):
+    """ScoreAggregationService for async routes."""
+    service_class = ScoreAggregationService
+    
+    async def aggregate(self, group_by: Sequence[str] = (), employee_id: Optional[str] = None,
+                        skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                        department: Optional[str] = None, category: Optional[str] = None,
+                        date_from: Optional[datetime] = None,
+                        date_to: Optional[datetime] = None) -> List[ScoreAggregate]:
+        return await self._run(ScoreAggregationService.aggregate, group_by, employee_id, skill_id,
+                               trainer_id, department, category, date_from, date_to)
+
@@ -1,7 +1,22 @@
+from collections import Counter
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from ..db import crud
-from ..schemas.score import ScoreCreate, ScoreUpdate, ScoreResponse, ScoreWithDetails
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from pydantic import ValidationError
+from ..db import crud, models
+from ..core.config import settings
+from ..utils.pagination import decode_cursor, paginate
+from ..utils.ingest import Record, RecordError
+from ..utils.serialization import RowListEncoder
+from .async_service import AsyncService
+from .notification_service import NotificationService
+from .score_aggregation_service import ScoreAggregationService
+from ..schemas.score import (
+    ScoreCreate, ScoreUpdate, ScoreResponse, ScoreWithDetails, ScoreBulkError, ScoreBulkResult,
+)
+
+_score_list = RowListEncoder(ScoreResponse)
+_score_details_list = RowListEncoder(ScoreWithDetails)
 
 class ScoreService:
     def __init__(self, db: Session):
@@ -17,7 +32,66 @@ class ScoreService:
             trainer_id=score_data.trainer_id,
             feedback=score_data.feedback
         )
-        return ScoreResponse.model_validate(db_score)
+        score = ScoreResponse.model_validate(db_score)
+        NotificationService(self.db).create_notification(
+            user_id=score.employee_id,
+            type="assessment",
+            title="New score",
+            message=f"You were scored {score.score:g} by your trainer."
+        )
+        return score
+    
+    def bulk_create_scores(self, records: Sequence[Tuple[int, Record]],
+                           default_trainer_id: Optional[str] = None) -> ScoreBulkResult:
+        """
+        Validate ``(row_number, record)`` pairs and store the valid ones in a
+        single transaction. Invalid rows are reported, not fatal.
+        """
+        errors: List[ScoreBulkError] = []
+        valid: List[Tuple[int, ScoreCreate]] = []
+        for row, record in records:
+            if isinstance(record, RecordError):
+                errors.append(ScoreBulkError(row=row, error=str(record)))
+                continue
+            if default_trainer_id and not record.get("trainer_id"):
+                record = dict(record, trainer_id=default_trainer_id)
+            try:
+                valid.append((row, ScoreCreate.model_validate(record)))
+            except ValidationError as exc:
+                detail = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+                errors.append(ScoreBulkError(row=row, error=detail))
+        
+        # One IN lookup per kind of reference instead of one per row.
+        employees = crud.get_existing_ids(self.db, models.User.id, (s.employee_id for _, s in valid),
+                                          models.User.role == "employee")
+        trainers = crud.get_existing_ids(self.db, models.User.id, (s.trainer_id for _, s in valid),
+                                         models.User.role == "trainer")
+        skills = crud.get_existing_ids(self.db, models.Skill.id, (s.skill_id for _, s in valid))
+        rows = []
+        for row, score in valid:
+            problems = [f"unknown {name} {value}" for name, value, known in (
+                ("employee_id", score.employee_id, employees),
+                ("skill_id", score.skill_id, skills),
+                ("trainer_id", score.trainer_id, trainers),
+            ) if value not in known]
+            if problems:
+                errors.append(ScoreBulkError(row=row, error="; ".join(problems)))
+            else:
+                rows.append(score.model_dump())
+        
+        ids: List[str] = []
+        if rows:
+            # One notification per employee, however many of their scores the upload holds.
+            counts = Counter(row["employee_id"] for row in rows)
+            notifications = [{"user_id": employee_id, "type": "assessment", "title": "New scores",
+                              "message": f"{count} new scores were recorded for you." if count > 1
+                                         else "A new score was recorded for you."}
+                             for employee_id, count in counts.items()]
+            ids, notification_ids = crud.bulk_create_scores(self.db, rows, settings.score_bulk_chunk_size,
+                                                            notifications)
+            NotificationService(self.db).publish_stored(zip(counts, notification_ids))
+        errors.sort(key=lambda error: error.row)
+        return ScoreBulkResult(created=len(ids), failed=len(errors), ids=ids, errors=errors)
     
     def get_score(self, score_id: str) -> Optional[ScoreResponse]:
         """Get score by ID."""
@@ -26,33 +100,64 @@ class ScoreService:
             return ScoreResponse.model_validate(db_score)
         return None
     
-    def get_scores(self, skip: int = 0, limit: int = 100) -> List[ScoreResponse]:
-        """Get all scores."""
-        db_scores = crud.get_scores(self.db, skip, limit)
-        return [ScoreResponse.model_validate(score) for score in db_scores]
+    def get_scores(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                   skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                   date_from: Optional[datetime] = None,
+                   date_to: Optional[datetime] = None) -> Tuple[bytes, Optional[str]]:
+        """Get a page of scores as JSON, newest first, plus the cursor for the next page."""
+        after = tuple(decode_cursor(cursor, 2)) if cursor else None
+        rows = crud.get_scores_page(
+            self.db, after, skill_id, trainer_id,
+            crud.score_date_bound(date_from) if date_from else None,
+            crud.score_date_bound(date_to) if date_to else None,
+            skip, limit + 1, columns=_score_list.columns(models.Score),
+        )
+        page, next_cursor = paginate(rows, limit, lambda row: (row[-1], row.id))
+        return _score_list.encode(page), next_cursor
     
-    def get_scores_by_employee(self, employee_id: str) -> List[ScoreResponse]:
-        """Get scores for a specific employee."""
-        db_scores = crud.get_scores_by_employee(self.db, employee_id)
-        return [ScoreResponse.model_validate(score) for score in db_scores]
+    def get_scores_by_employee(self, employee_id: str) -> bytes:
+        """Get scores for a specific employee as JSON."""
+        rows = crud.get_scores_by_employee(self.db, employee_id, _score_list.columns(models.Score))
+        return _score_list.encode(rows)
     
     def get_score_with_details(self, score_id: str) -> Optional[ScoreWithDetails]:
         """Get score with additional details."""
-        db_score = crud.get_score(self.db, score_id)
-        if db_score:
-            # Get related data
-            skill = crud.get_skill(self.db, db_score.skill_id)
-            trainer = crud.get_user(self.db, db_score.trainer_id)
-            employee = crud.get_user(self.db, db_score.employee_id)
-            
-            score_data = ScoreResponse.model_validate(db_score)
-            return ScoreWithDetails(
-                **score_data.model_dump(),
-                skill_name=skill.name if skill else None,
-                trainer_name=trainer.name if trainer else None,
-                employee_name=employee.name if employee else None
-            )
-        return None
+        row = crud.get_score_with_details(self.db, score_id)
+        return self._to_details(row) if row else None
+    
+    def get_scores_with_details(self, limit: int = 100, cursor: Optional[str] = None,
+                                employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                                trainer_id: Optional[str] = None,
+                                date_from: Optional[datetime] = None,
+                                date_to: Optional[datetime] = None) -> Tuple[bytes, Optional[str]]:
+        """Get a page of scores with skill, trainer and employee names as JSON, newest first."""
+        after = tuple(decode_cursor(cursor, 2)) if cursor else None
+        rows = crud.get_score_details_page(
+            self.db, after, employee_id, skill_id, trainer_id,
+            crud.score_date_bound(date_from) if date_from else None,
+            crud.score_date_bound(date_to) if date_to else None,
+            limit=limit + 1, columns=_score_list.columns(models.Score),
+        )
+        page, next_cursor = paginate(rows, limit, lambda row: (row.sort_date, row.id))
+        return _score_details_list.encode(page), next_cursor
+    
+    @staticmethod
+    def _to_details(row) -> ScoreWithDetails:
+        score = row.Score
+        return ScoreWithDetails(
+            id=score.id,
+            employee_id=score.employee_id,
+            skill_id=score.skill_id,
+            trainer_id=score.trainer_id,
+            score=score.score,
+            feedback=score.feedback,
+            date=score.date,
+            created_at=score.created_at,
+            updated_at=score.updated_at,
+            skill_name=row.skill_name,
+            trainer_name=row.trainer_name,
+            employee_name=row.employee_name,
+        )
     
     def update_score(self, score_id: str, score_data: ScoreUpdate) -> Optional[ScoreResponse]:
         """Update score."""
@@ -67,7 +172,45 @@ class ScoreService:
     
     def get_employee_average_score(self, employee_id: str) -> Optional[float]:
         """Get average score for an employee."""
-        scores = self.get_scores_by_employee(employee_id)
-        if scores:
-            return sum(score.score for score in scores) / len(scores)
-        return None 
\ No newline at end of file
+        return ScoreAggregationService(self.db).get_employee_average_score(employee_id)
+
+class AsyncScoreService(AsyncService):
+    """ScoreService for async routes."""
+    service_class = ScoreService
+    
+    async def create_score(self, score_data: ScoreCreate) -> ScoreResponse:
+        return await self._run(ScoreService.create_score, score_data)
+    
+    async def get_score(self, score_id: str) -> Optional[ScoreResponse]:
+        return await self._run(ScoreService.get_score, score_id)
+    
+    async def get_scores(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None,
+                         skill_id: Optional[str] = None, trainer_id: Optional[str] = None,
+                         date_from: Optional[datetime] = None,
+                         date_to: Optional[datetime] = None) -> Tuple[bytes, Optional[str]]:
+        return await self._run(ScoreService.get_scores, skip, limit, cursor, skill_id, trainer_id,
+                               date_from, date_to)
+    
+    async def get_scores_by_employee(self, employee_id: str) -> bytes:
+        return await self._run(ScoreService.get_scores_by_employee, employee_id)
+    
+    async def get_score_with_details(self, score_id: str) -> Optional[ScoreWithDetails]:
+        return await self._run(ScoreService.get_score_with_details, score_id)
+    
+    async def get_scores_with_details(self, limit: int = 100, cursor: Optional[str] = None,
+                                      employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                                      trainer_id: Optional[str] = None,
+                                      date_from: Optional[datetime] = None,
+                                      date_to: Optional[datetime] = None) -> Tuple[bytes, Optional[str]]:
+        return await self._run(ScoreService.get_scores_with_details, limit, cursor, employee_id,
+                               skill_id, trainer_id, date_from, date_to)
+    
+    async def update_score(self, score_id: str, score_data: ScoreUpdate) -> Optional[ScoreResponse]:
+        return await self._run(ScoreService.update_score, score_id, score_data)
+    
+    async def delete_score(self, score_id: str) -> bool:
+        return await self._run(ScoreService.delete_score, score_id)
+    
+    async def get_employee_average_score(self, employee_id: str) -> Optional[float]:
+        return await self._run(ScoreService.get_employee_average_score, employee_id)
+
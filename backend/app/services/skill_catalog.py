@@ -0,0 +1,107 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..db import crud, models
+from ..db.base import SessionLocal
+from ..schemas.skill import SkillResponse
+from ..utils.serialization import RowListEncoder
+
+_encode_skill = TypeAdapter(SkillResponse).dump_json
+_skill_list = RowListEncoder(SkillResponse)
+
+def _json_array(items: Sequence[bytes]) -> bytes:
+    return b"[" + b",".join(items) + b"]"
+
+class SkillCatalog:
+    """
+    Immutable snapshot of the skills table: the validated responses, by-id
+    and by-category maps, and their JSON encodings built once. ``etag`` is a
+    hash of the content, so every worker holding the same catalog agrees.
+    """
+
+    def __init__(self, skills: Sequence[SkillResponse], loaded_at: float):
+        self.skills: Tuple[SkillResponse, ...] = tuple(skills)
+        self.loaded_at = loaded_at
+        self.by_id: Mapping[str, SkillResponse] = MappingProxyType({skill.id: skill for skill in self.skills})
+        grouped: Dict[str, List[SkillResponse]] = defaultdict(list)
+        for skill in self.skills:
+            grouped[skill.category].append(skill)
+        self.by_category: Mapping[str, Tuple[SkillResponse, ...]] = MappingProxyType(
+            {category: tuple(members) for category, members in grouped.items()})
+
+        self._item_json = tuple(_encode_skill(skill) for skill in self.skills)
+        self._json_by_id = dict(zip((skill.id for skill in self.skills), self._item_json))
+        json_by_category: Dict[str, List[bytes]] = defaultdict(list)
+        for skill, encoded in zip(self.skills, self._item_json):
+            json_by_category[skill.category].append(encoded)
+        self._json_by_category = {category: _json_array(items) for category, items in json_by_category.items()}
+        self.json = _json_array(self._item_json)
+        self.etag = '"' + hashlib.sha256(self.json).hexdigest()[:32] + '"'
+
+    @classmethod
+    def load(cls, db: Session, loaded_at: float = 0.0) -> "SkillCatalog":
+        return cls(_skill_list.validate(crud.get_all_skills(db, _skill_list.columns(models.Skill))), loaded_at)
+
+    def page_json(self, skip: int = 0, limit: Optional[int] = None) -> bytes:
+        if skip <= 0 and (limit is None or limit >= len(self._item_json)):
+            return self.json
+        end = None if limit is None else max(skip, 0) + max(limit, 0)
+        return _json_array(self._item_json[max(skip, 0):end])
+
+    def category_json(self, category: str) -> bytes:
+        return self._json_by_category.get(category, b"[]")
+
+    def skill_json(self, skill_id: str) -> Optional[bytes]:
+        return self._json_by_id.get(skill_id)
+
+class SkillCatalogCache:
+    """
+    Holds the current SkillCatalog. SkillService swaps in a new snapshot
+    after each skill write; readers never see a half-built one. The cache is
+    per process, so writes made by other workers are picked up once the
+    snapshot is ``max_age`` seconds old (0: only on this process's writes).
+    """
+
+    def __init__(self, max_age: float, session_factory: Callable[[], Session] = SessionLocal,
+                 timer: Callable[[], float] = time.monotonic):
+        self.max_age = max_age
+        self._session_factory = session_factory
+        self._timer = timer
+        self._snapshot: Optional[SkillCatalog] = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self) -> SkillCatalog:
+        snapshot = self._snapshot
+        if snapshot is None or (self.max_age > 0 and self._timer() - snapshot.loaded_at >= self.max_age):
+            with self._lock:
+                # Another thread may have reloaded while this one waited.
+                if self._snapshot is snapshot:
+                    self._load()
+                snapshot = self._snapshot
+        return snapshot
+
+    def refresh(self) -> SkillCatalog:
+        """Load a new snapshot from the primary and publish it; call after a skill write commits."""
+        # Loads are serialized, so a slow load can never publish data older
+        # than the snapshot before it.
+        with self._lock:
+            return self._load()
+
+    def _load(self) -> SkillCatalog:
+        db = self._session_factory()
+        try:
+            snapshot = SkillCatalog.load(db, self._timer())
+        finally:
+            db.close()
+        self._snapshot = snapshot
+        self.loads += 1
+        return snapshot
+
+skill_catalog = SkillCatalogCache(max_age=settings.skill_catalog_max_age_seconds)
@@ -0,0 +1,54 @@
+import math
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from ..db import crud
+from ..db.models import SkillMatrixEntry
+from ..schemas.score import SkillMatrixEntryResponse
+from ..utils.pagination import decode_cursor, paginate
+from .async_service import AsyncService
+
+class SkillMatrixService:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_matrix(self, employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                   department: Optional[str] = None, cursor: Optional[str] = None,
+                   limit: int = 100) -> Tuple[List[SkillMatrixEntryResponse], Optional[str]]:
+        """Get a page of employee x skill cells, plus the cursor for the next page."""
+        after = tuple(decode_cursor(cursor, 2)) if cursor else None
+        entries = crud.get_matrix_entries(self.db, employee_id, skill_id, department, after, limit + 1)
+        page, next_cursor = paginate(entries, limit, lambda e: (e.employee_id, e.skill_id))
+        return [self._to_response(entry) for entry in page], next_cursor
+    
+    def rebuild(self) -> int:
+        """Recompute the matrix from the scores table; returns the number of cells."""
+        return crud.rebuild_skill_matrix(self.db)
+    
+    def check(self) -> List[dict]:
+        """List cells that disagree with the scores table."""
+        return crud.check_skill_matrix(self.db)
+    
+    @staticmethod
+    def _to_response(entry: SkillMatrixEntry) -> SkillMatrixEntryResponse:
+        average = entry.score_sum / entry.attempt_count
+        variance = max(entry.score_sum_squares / entry.attempt_count - average ** 2, 0.0)
+        return SkillMatrixEntryResponse(
+            employee_id=entry.employee_id,
+            skill_id=entry.skill_id,
+            latest_score=entry.latest_score,
+            latest_date=entry.latest_date,
+            best_score=entry.best_score,
+            attempt_count=entry.attempt_count,
+            average_score=average,
+            stddev=math.sqrt(variance),
+        )
+
+class AsyncSkillMatrixService(AsyncService):
+    """SkillMatrixService for async routes."""
+    service_class = SkillMatrixService
+    
+    async def get_matrix(self, employee_id: Optional[str] = None, skill_id: Optional[str] = None,
+                         department: Optional[str] = None, cursor: Optional[str] = None,
+                         limit: int = 100) -> Tuple[List[SkillMatrixEntryResponse], Optional[str]]:
+        return await self._run(SkillMatrixService.get_matrix, employee_id, skill_id, department, cursor, limit)
+
@@ -1,7 +1,8 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..db import crud
-from ..schemas.skill import SkillCreate, SkillUpdate, SkillResponse
+from ..schemas.skill import SkillCategoryFacet, SkillCreate, SkillSearchResult, SkillUpdate, SkillResponse
+from .skill_catalog import skill_catalog
 
 class SkillService:
     def __init__(self, db: Session):
@@ -15,6 +16,7 @@ class SkillService:
             category=skill_data.category,
             description=skill_data.description
         )
+        skill_catalog.refresh()
         return SkillResponse.model_validate(db_skill)
     
     def get_skill(self, skill_id: str) -> Optional[SkillResponse]:
@@ -31,20 +33,35 @@ class SkillService:
     
     def get_skills_by_category(self, category: str) -> List[SkillResponse]:
         """Get skills by category."""
-        db_skills = crud.get_skills(self.db)
-        return [
-            SkillResponse.model_validate(skill) 
-            for skill in db_skills 
-            if skill.category == category
-        ]
+        db_skills = crud.get_skills_by_category(self.db, category)
+        return [SkillResponse.model_validate(skill) for skill in db_skills]
+    
+    def search_skills(self, query: str, category: Optional[str] = None,
+                      skip: int = 0, limit: int = 20) -> SkillSearchResult:
+        """Search skill names and descriptions, with match counts per category."""
+        db_skills, counts = crud.search_skills(self.db, query, category, skip, limit)
+        facets = [SkillCategoryFacet(category=name, count=count) for name, count in counts]
+        if category is None:
+            total = sum(facet.count for facet in facets)
+        else:
+            total = next((facet.count for facet in facets if facet.category == category), 0)
+        return SkillSearchResult(
+            total=total,
+            skills=[SkillResponse.model_validate(skill) for skill in db_skills],
+            categories=facets
+        )
     
     def update_skill(self, skill_id: str, skill_data: SkillUpdate) -> Optional[SkillResponse]:
         """Update skill."""
         db_skill = crud.update_skill(self.db, skill_id, **skill_data.model_dump(exclude_unset=True))
         if db_skill:
+            skill_catalog.refresh()
             return SkillResponse.model_validate(db_skill)
         return None
     
     def delete_skill(self, skill_id: str) -> bool:
         """Delete skill."""
-        return crud.delete_skill(self.db, skill_id) 
\ No newline at end of file
+        deleted = crud.delete_skill(self.db, skill_id)
+        if deleted:
+            skill_catalog.refresh()
+        return deleted 
\ No newline at end of file
@@ -1,9 +1,12 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional, Tuple
 from ..db import crud
+from ..utils.pagination import decode_cursor, paginate
 from ..db.models import User
 from ..schemas.trainer import TrainerCreate, TrainerUpdate, TrainerResponse
-from ..utils.email import send_welcome_email
+from ..utils.serialization import RowListEncoder
+
+_trainer_list = RowListEncoder(TrainerResponse)
 
 class TrainerService:
     def __init__(self, db: Session):
@@ -19,12 +22,9 @@ class TrainerService:
             role="trainer",
             avatar=trainer_data.avatar,
             department=trainer_data.department,
-            experience=trainer_data.experience
+            experience=trainer_data.experience,
+            send_welcome=True
         )
-        
-        # Send welcome email
-        send_welcome_email(trainer_data.email, trainer_data.name)
-        
         return TrainerResponse.model_validate(db_trainer)
     
     def get_trainer(self, trainer_id: str) -> Optional[TrainerResponse]:
@@ -34,14 +34,14 @@ class TrainerService:
             return TrainerResponse.model_validate(db_trainer)
         return None
     
-    def get_trainers(self, skip: int = 0, limit: int = 100) -> List[TrainerResponse]:
-        """Get all trainers."""
-        db_trainers = crud.get_users(self.db, skip, limit)
-        return [
-            TrainerResponse.model_validate(trainer) 
-            for trainer in db_trainers 
-            if trainer.role == "trainer"
-        ]
+    def get_trainers(self, skip: int = 0, limit: int = 100,
+                     cursor: Optional[str] = None) -> Tuple[bytes, Optional[str]]:
+        """Get a page of trainers ordered by id as JSON, plus the cursor for the next page."""
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        rows = crud.get_users_by_role(self.db, "trainer", after_id, skip, limit + 1,
+                                      _trainer_list.columns(User))
+        page, next_cursor = paginate(rows, limit, lambda row: (row.id,))
+        return _trainer_list.encode(page), next_cursor
     
     def update_trainer(self, trainer_id: str, trainer_data: TrainerUpdate) -> Optional[TrainerResponse]:
         """Update trainer."""
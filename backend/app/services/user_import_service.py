@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session
+from typing import List, Sequence, Tuple
+from pydantic import ValidationError
+from ..db import crud, models
+from ..utils.ingest import Record, RecordError
+from ..utils.password import password_hasher
+from ..schemas.user import UserImportRow, UserImportError, UserImportResult
+
+class UserImportService:
+    def __init__(self, db: Session, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    def import_users(self, records: Sequence[Tuple[int, Record]]) -> UserImportResult:
+        """
+        Create users from ``(row_number, record)`` pairs in one transaction.
+        Emails that are already registered are skipped, so re-running an
+        import is harmless; invalid rows are reported and do not stop the rest.
+        """
+        errors: List[UserImportError] = []
+        valid: List[Tuple[int, UserImportRow]] = []
+        for row, record in records:
+            if isinstance(record, RecordError):
+                errors.append(UserImportError(row=row, error=str(record)))
+                continue
+            try:
+                valid.append((row, UserImportRow.model_validate(record)))
+            except ValidationError as exc:
+                detail = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+                errors.append(UserImportError(row=row, error=detail))
+
+        existing = crud.get_existing_ids(self.db, models.User.email, (user.email for _, user in valid))
+        new_users, seen, skipped = [], set(), 0
+        for row, user in valid:
+            if user.email in existing:
+                skipped += 1
+            elif user.email in seen:
+                errors.append(UserImportError(row=row, error=f"duplicate email {user.email} in upload"))
+            else:
+                seen.add(user.email)
+                new_users.append(user)
+
+        # bcrypt dominates the import; hash_many fans it out over the pool.
+        hashes = password_hasher.hash_many(user.password for user in new_users)
+        rows = [dict(user.model_dump(exclude={"password"}), hashed_password=hashed)
+                for user, hashed in zip(new_users, hashes)]
+        created = crud.bulk_create_users(self.db, rows, self.chunk_size) if rows else []
+        errors.sort(key=lambda error: error.row)
+        return UserImportResult(created=len(created), skipped=skipped, failed=len(errors), errors=errors)
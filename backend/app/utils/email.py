@@ -1,27 +1,100 @@
-from typing import Optional
+import logging
+import smtplib
+from email.message import EmailMessage
+from typing import Optional, Tuple, Union
 from ..core.config import settings
 
-def send_email(to_email: str, subject: str, body: str) -> bool:
+logger = logging.getLogger(__name__)
+
+# Messages are not sent from here: crud.queue_email writes them to the outbox
+# in the caller's transaction and the outbox worker delivers them through
+# one of the mailers below.
+
+def welcome_email(name: str) -> Tuple[str, str]:
+    """Subject and body of the welcome email for new users."""
+    return "Welcome to Skills Tracking Portal", f"Welcome {name}! Your account has been created successfully."
+
+def build_message(to_email: str, subject: str, body: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = settings.email_from
+    message["To"] = to_email
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+class LogMailer:
+    """Stands in for SMTP when none is configured: logs the message instead."""
+
+    def send(self, message: EmailMessage) -> None:
+        logger.info("No SMTP server configured; not sending email to %s: %s", message["To"], message["Subject"])
+
+    def close(self) -> None:
+        pass
+
+class SMTPMailer:
     """
-    Mock email sending function.
-    In production, this would integrate with a real email service.
+    One SMTP connection reused for every message, opened on first use.
+    A connection the server has dropped (idle timeout, restart) is reopened
+    once per message before the failure counts against it. Not thread-safe:
+    it belongs to the outbox worker's thread.
     """
-    if settings.smtp_host and settings.smtp_user and settings.smtp_password:
-        # TODO: Implement real email sending logic
-        print(f"Mock email sent to {to_email}: {subject}")
-        return True
-    else:
-        print(f"Email configuration not set. Mock email to {to_email}: {subject}")
-        return True
-
-def send_password_reset_email(email: str, reset_token: str) -> bool:
-    """Send password reset email."""
-    subject = "Password Reset Request"
-    body = f"Your password reset token is: {reset_token}"
-    return send_email(email, subject, body)
-
-def send_welcome_email(email: str, name: str) -> bool:
-    """Send welcome email to new users."""
-    subject = "Welcome to Skills Tracking Portal"
-    body = f"Welcome {name}! Your account has been created successfully."
-    return send_email(email, subject, body) 
\ No newline at end of file
+
+    def __init__(self, host: str, port: int = 25, username: Optional[str] = None,
+                 password: Optional[str] = None, starttls: bool = False, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    def send(self, message: EmailMessage) -> None:
+        """
+        Send one message. Raises smtplib.SMTPResponseException (or
+        SMTPRecipientsRefused) when the server rejects it, OSError when the
+        server cannot be reached.
+        """
+        for retry in (False, True):
+            reused = self._smtp is not None
+            if self._smtp is None:
+                self._smtp = self._connect()
+            try:
+                self._smtp.send_message(message)
+                return
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+                # The server answered; the connection is still good.
+                raise
+            except OSError:
+                self.close()
+                if retry or not reused:
+                    raise
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                self._smtp.close()
+            self._smtp = None
+
+Mailer = Union[LogMailer, SMTPMailer]
+
+def create_mailer() -> Mailer:
+    """The mailer for the configured SMTP server, or LogMailer when there is none."""
+    if not settings.smtp_host:
+        return LogMailer()
+    return SMTPMailer(settings.smtp_host, settings.smtp_port or 25, settings.smtp_user,
+                      settings.smtp_password, settings.smtp_starttls, settings.smtp_timeout_seconds)
@@ -0,0 +1,68 @@
+import csv
+import io
+import zlib
+from typing import Iterable, Iterator, Literal, Sequence
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from .serialization import RowListEncoder
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def ndjson_chunks(batches: Iterable[Sequence], encoder: RowListEncoder) -> Iterator[bytes]:
+    """One chunk of NDJSON per batch of rows."""
+    for rows in batches:
+        yield encoder.encode_lines(rows)
+
+def csv_chunks(batches: Iterable[Sequence], encoder: RowListEncoder) -> Iterator[bytes]:
+    """A header line of the schema's field names, then one chunk of CSV per batch of rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(encoder.fields)
+    for rows in batches:
+        for row in encoder.jsonable(rows):
+            writer.writerow(row.values())
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # no batches at all: just the header
+        yield buffer.getvalue().encode()
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a stream chunk by chunk into a single gzip member."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def accepts_gzip(request: Request) -> bool:
+    """Whether Accept-Encoding lists gzip with a non-zero quality."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        key, _, value = params.partition("=")
+        try:
+            return key.strip() != "q" or float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+def export_response(request: Request, batches: Iterable[Sequence], encoder: RowListEncoder,
+                    format: ExportFormat, filename: str, gzip_level: int = 6) -> StreamingResponse:
+    """
+    Stream ``batches`` of rows as an NDJSON or CSV attachment, gzip-encoded
+    on the fly when the client accepts it. Only one batch is held at a time.
+    """
+    chunks = ndjson_chunks(batches, encoder) if format == "ndjson" else csv_chunks(batches, encoder)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if accepts_gzip(request):
+        chunks = gzip_chunks(chunks, gzip_level)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from typing import Iterator, List, Tuple, Union
+from starlette.requests import Request
+
+JSON_TYPES = ("application/json",)
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+CSV_TYPES = ("text/csv", "application/csv")
+
+class RecordError(ValueError):
+    """A single record that could not be parsed; the rest of the upload still is."""
+
+class UploadTooLarge(ValueError):
+    """The upload is bigger than the endpoint accepts."""
+
+Record = Union[dict, RecordError]
+
+async def read_upload(request: Request, max_bytes: int) -> bytes:
+    """
+    Read the request body, refusing it as soon as it is known to exceed
+    ``max_bytes``: up front from Content-Length, otherwise while streaming.
+    """
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+    return bytes(body)
+
+def parse_records(content_type: str, body: bytes) -> List[Tuple[int, Record]]:
+    """
+    Split an upload into ``(row_number, record)`` pairs. Records are dicts, or
+    a RecordError for a row that is not valid in its format. Row numbers are
+    1-based data rows (the CSV header is not counted).
+
+    Raises ValueError when the payload as a whole is unreadable or the
+    content type is not JSON, NDJSON or CSV.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("Body is not valid UTF-8")
+    if media_type in JSON_TYPES:
+        return list(enumerate(_json_records(text), start=1))
+    if media_type in NDJSON_TYPES:
+        return list(enumerate(_ndjson_records(text), start=1))
+    if media_type in CSV_TYPES:
+        return list(enumerate(_csv_records(text), start=1))
+    raise ValueError(f"Unsupported content type {media_type or 'none'!r}; "
+                     "send application/json, application/x-ndjson or text/csv")
+
+def _json_records(text: str) -> Iterator[Record]:
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON: {exc}")
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array")
+    for item in items:
+        yield item if isinstance(item, dict) else RecordError("Expected an object")
+
+def _ndjson_records(text: str) -> Iterator[Record]:
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield RecordError(f"Invalid JSON: {exc}")
+            continue
+        yield item if isinstance(item, dict) else RecordError("Expected an object")
+
+def _csv_records(text: str) -> Iterator[Record]:
+    reader = csv.DictReader(io.StringIO(text, newline=""))
+    for row in reader:
+        if None in row:
+            yield RecordError("Too many columns")
+            continue
+        # Empty cells mean "not given", as a missing key would in JSON.
+        yield {key: value for key, value in row.items() if value not in ("", None)}
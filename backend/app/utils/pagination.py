@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor made by encode_cursor, raising ValueError if it is
+    malformed. Every sort key we page by is a string (ids and stored dates),
+    so anything else is rejected before it reaches a query.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+def paginate(rows: Sequence[T], limit: int, key: Callable[[T], tuple]) -> Tuple[List[T], Optional[str]]:
+    """
+    Trim a ``limit + 1`` row fetch to one page. The extra row only tells us
+    another page exists; the cursor is the key of the last row returned.
+    """
+    page = list(rows[:limit])
+    next_cursor = encode_cursor(*key(page[-1])) if len(rows) > limit and page else None
+    return page, next_cursor
+
+# List endpoints keep returning a plain JSON array and hand the cursor for
+# the next page back in this header.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def cursor_headers(next_cursor: Optional[str]) -> Optional[Dict[str, str]]:
+    """Response headers carrying ``next_cursor``, for routes that build their own Response."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
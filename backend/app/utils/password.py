@@ -1,11 +1,135 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from passlib.context import CryptContext
+from ..core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def _make_context(rounds: int) -> CryptContext:
+    # Pinning the rounds makes needs_update() flag hashes made with any other
+    # cost, which is what drives rehash-on-login.
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+# Worker-side helpers. They live at module level so the process pool can
+# pickle them by reference, and they take the cost explicitly so workers
+# never depend on the parent's settings.
+_worker_contexts: Dict[int, CryptContext] = {}
+
+def _context_for(rounds: int) -> CryptContext:
+    context = _worker_contexts.get(rounds)
+    if context is None:
+        context = _worker_contexts[rounds] = _make_context(rounds)
+    return context
+
+def _hash(password: str, rounds: int) -> str:
+    return _context_for(rounds).hash(password)
+
+def _verify(password: str, hashed_password: str, rounds: int) -> bool:
+    return _context_for(rounds).verify(password, hashed_password)
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return _context_for(rounds).verify_and_update(password, hashed_password)
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded process pool so that a burst of logins or user
+    creations competes for ``workers`` processes instead of request threads.
+
+    ``workers=None`` uses one process per CPU; ``workers=0`` hashes inline in
+    the calling thread, which is what the tests use.
+    """
+
+    def __init__(self, workers: Optional[int] = None, rounds: int = 12):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.rounds = rounds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.submitted = 0
+        self.completed = 0
+
+    def hash(self, password: str) -> str:
+        """Hash ``password`` with the configured cost."""
+        return self._submit(_hash, password, self.rounds).result()
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Check ``password`` against ``hashed_password``."""
+        return self._submit(_verify, password, hashed_password, self.rounds).result()
+
+    def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify ``password``; also return a new hash if the stored cost is outdated."""
+        return self._submit(_verify_and_update, password, hashed_password, self.rounds).result()
+
+    def hash_many(self, passwords: Iterable[str]) -> List[str]:
+        """Hash every password, spread across the worker processes, in input order."""
+        futures = [self._submit(_hash, password, self.rounds) for password in passwords]
+        return [future.result() for future in futures]
+
+    async def ahash(self, password: str) -> str:
+        """Awaitable hash() that does not hold a request thread while bcrypt runs."""
+        return await asyncio.wrap_future(self._submit(_hash, password, self.rounds))
+
+    async def averify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Awaitable verify_and_update()."""
+        return await asyncio.wrap_future(
+            self._submit(_verify_and_update, password, hashed_password, self.rounds)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool size and queue-depth counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "rounds": self.rounds,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "submitted": self.submitted,
+                "completed": self.completed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the pool is recreated on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            self.submitted += 1
+            if self.workers > 0 and self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            executor = self._executor
+        if executor is None:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+        else:
+            future = executor.submit(fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self.queue_depth -= 1
+            self.completed += 1
+
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.bcrypt_rounds)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Generate a password hash."""
-    return pwd_context.hash(password) 
\ No newline at end of file
+    return password_hasher.hash(password)
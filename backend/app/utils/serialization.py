@@ -0,0 +1,72 @@
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar
+from typing_extensions import TypedDict
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+M = TypeVar("M", bound=BaseModel)
+
+class RowListEncoder(Generic[M]):
+    """
+    JSON-encodes whole lists of query rows as ``schema`` objects in one call
+    into pydantic-core, instead of a ``model_validate`` per ORM object
+    followed by FastAPI validating and encoding the list again.
+
+    Rows are SQLAlchemy rows whose column labels are ``schema``'s field names
+    (see ``columns``), matched by name, so selecting them in another order is
+    fine; a field with no column raises ValueError instead of shifting every
+    value. Other columns, such as a sort key kept for the next cursor, are
+    ignored. ``encode`` serializes with the field types but
+    does not validate: the rows come from our own tables, whose values were
+    validated on the way in (re-checking every EmailStr costs more than the
+    query). Schemas using aliases or custom serializers need the model path.
+    """
+
+    def __init__(self, schema: Type[M]):
+        self.schema = schema
+        self.fields = tuple(schema.model_fields)
+        self._models = TypeAdapter(List[schema])
+        row_type = TypedDict(f"{schema.__name__}Row",
+                             {name: field.annotation for name, field in schema.model_fields.items()})
+        self._row = TypeAdapter(row_type)
+        self._rows = TypeAdapter(List[row_type])
+
+    def columns(self, entity: Any, fields: Optional[Sequence[str]] = None) -> List[Any]:
+        """The mapped attributes of ``entity`` to select for ``fields`` (default: all of them)."""
+        return [getattr(entity, name) for name in (fields or self.fields)]
+
+    def _dicts(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        if not rows:
+            return []
+        # Every row of a result has the labels of the first.
+        fields, labels = self.fields, tuple(rows[0]._fields)
+        if labels[:len(fields)] == fields:
+            return [dict(zip(fields, row)) for row in rows]
+        missing = [name for name in fields if name not in labels]
+        if missing:
+            raise ValueError(f"{self.schema.__name__} rows have no column for {', '.join(missing)}")
+        positions = [(name, labels.index(name)) for name in fields]
+        return [{name: row[i] for name, i in positions} for row in rows]
+
+    def validate(self, rows: Sequence[Sequence[Any]]) -> List[M]:
+        """The rows as validated ``schema`` instances, for callers that keep the objects."""
+        return self._models.validate_python(self._dicts(rows))
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """The rows as a JSON array of ``schema`` objects."""
+        return self._rows.dump_json(self._dicts(rows))
+
+    def encode_lines(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """The rows as NDJSON, one ``schema`` object per line."""
+        dump = self._row.dump_json
+        return b"".join([dump(row) + b"\n" for row in self._dicts(rows)])
+
+    def jsonable(self, rows: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """The rows as dicts of JSON types (datetimes as ISO strings), as CSV cells want them."""
+        return self._rows.dump_python(self._dicts(rows), mode="json")
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Send already-encoded JSON. Routes keep their ``response_model`` for the
+    OpenAPI schema; FastAPI does not re-validate a returned Response.
+    """
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,12 @@
+from typing import Optional
+
+# A comment line: keeps proxies from timing out an idle stream.
+KEEP_ALIVE = b": keep-alive\n\n"
+
+def format_event(event: str, data: str, id: Optional[str] = None) -> bytes:
+    """One server-sent event. ``data`` must be a single line (JSON is)."""
+    lines = [f"event: {event}"]
+    if id is not None:
+        lines.append(f"id: {id}")
+    lines.append(f"data: {data}")
+    return ("\n".join(lines) + "\n\n").encode()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+p50/p99 latency of the score feed with 500 concurrent clients, served by the
+async route (AsyncSession) and by the same handler as a sync ``def`` route on
+the threadpool.
+
+    python -m benchmarks.bench_async_routes --requests 5000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import statistics
+from typing import List, Optional
+from .common import (
+    use_temp_database, seed_users, seed_skills, seed_scores, run_concurrently, asgi_client, percentile,
+)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--scores", type=int, default=100000)
+    args = parser.parse_args()
+
+    use_temp_database("async-routes")
+    from fastapi import Depends, Response
+    from sqlalchemy.orm import Session
+    from app.main import app
+    from app.db.base import engine
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import NullPool
+    from app.core.security import create_access_token
+    from app.api.dependencies import get_current_manager
+    from app.schemas.score import ScoreResponse
+    from app.services.score_service import ScoreService
+
+    employees = seed_users(engine, 500, ["employee"], "employee")
+    trainers = seed_users(engine, 10, ["trainer"], "trainer")
+    manager = seed_users(engine, 1, ["manager"], "manager")[0]
+    skills = seed_skills(engine, 50)
+    seed_scores(engine, args.scores, employees, skills, trainers)
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager})}"}
+
+    # The pre-async handler, mounted next to the async one for comparison.
+    # Both use NullPool, as the aiosqlite engine does: with a bounded pool,
+    # sessions waiting for a free thread to run get_db's close() hold every
+    # connection while the threads block on checkout, and requests stall
+    # until the 30s pool timeout.
+    sync_engine = create_engine(engine.url, poolclass=NullPool,
+                                connect_args={"check_same_thread": False})
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/sync/scores", response_model=List[ScoreResponse])
+    def get_scores_sync(response: Response, cursor: Optional[str] = None, limit: int = 50,
+                        db: Session = Depends(get_sync_db), current_user=Depends(get_current_manager)):
+        body, _ = ScoreService(db).get_scores(limit=limit, cursor=cursor)
+        return Response(content=body, media_type="application/json")
+
+    async def measure(path):
+        errors = 0
+        async with asgi_client(app) as client:
+            async def request(i):
+                nonlocal errors
+                # A starved connection pool surfaces as an exception after
+                # the pool timeout; count it rather than abort the run.
+                try:
+                    resp = await client.get(path, params={"limit": 50}, headers=headers)
+                    resp.raise_for_status()
+                except Exception:
+                    errors += 1
+            await request(0)  # warm the user cache
+            latencies = await run_concurrently(request, args.requests, args.concurrency)
+        return [latency * 1000 for latency in latencies], errors
+
+    print(f"{args.requests} requests, {args.concurrency} concurrent clients")
+    print(f"{'route':<12} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10} {'errors':>8}")
+    for name, path in (("sync def", "/sync/scores"), ("async def", "/api/v1/scores/")):
+        latencies, errors = asyncio.run(measure(path))
+        print(f"{name:<12} {percentile(latencies, 50):>10.1f} {percentile(latencies, 99):>10.1f} "
+              f"{statistics.mean(latencies):>10.1f} {errors:>8}")
+
+if __name__ == "__main__":
+    main()
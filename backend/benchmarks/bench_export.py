@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Memory and throughput of the streaming score export: resident set size is
+sampled while the whole table streams, as NDJSON, CSV and gzipped NDJSON.
+
+    python -m benchmarks.bench_export --scores 10000000
+"""
+
+import argparse
+import asyncio
+import time
+from .common import use_temp_database, seed_users, seed_skills, seed_scores, create_user, login
+
+def anon_rss_mb() -> float:
+    # Anonymous memory only: SQLite's mmap'd database pages are file-backed
+    # and would otherwise count the table itself.
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+async def stream_to_sink(app, path: str, query: str, headers: dict) -> dict:
+    """
+    Call the ASGI app directly and discard the body as it arrives (the test
+    clients buffer whole responses), sampling memory between chunks.
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+        "root_path": "", "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    result = {"status": None, "bytes": 0, "chunks": 0, "peak": anon_rss_mb()}
+
+    requested = asyncio.Event()
+
+    async def receive():
+        # The request body once; after that the client just stays connected.
+        if requested.is_set():
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            result["bytes"] += len(message.get("body", b""))
+            result["chunks"] += 1
+            if result["chunks"] % 20 == 0:
+                result["peak"] = max(result["peak"], anon_rss_mb())
+
+    await app(scope, receive, send)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scores", type=int, default=1000000)
+    args = parser.parse_args()
+
+    use_temp_database("export")
+    from fastapi.testclient import TestClient
+    from app.db.base import SessionLocal, engine
+    from app.main import app
+
+    employees = seed_users(engine, 1000, ["employee"], "employee")
+    trainers = seed_users(engine, 20, ["trainer"], "trainer")
+    skills = seed_skills(engine, 200)
+    seed_scores(engine, args.scores, employees, skills, trainers)
+    db = SessionLocal()
+    create_user(db, "export.bench@example.com", "manager")
+    db.close()
+    client = TestClient(app)
+    headers = login(client, "export.bench@example.com")
+
+    print(f"{args.scores} scores, anonymous RSS in MB")
+    print(f"{'format':>12} {'rows/s':>9} {'MB sent':>8} {'RSS start':>10} {'RSS peak':>9}")
+    for label, fmt, encoding in (("ndjson", "ndjson", "identity"), ("csv", "csv", "identity"),
+                                 ("ndjson+gzip", "ndjson", "gzip")):
+        start_rss = anon_rss_mb()
+        start = time.perf_counter()
+        result = asyncio.run(stream_to_sink(app, "/api/v1/exports/scores", f"format={fmt}",
+                                            {**headers, "Accept-Encoding": encoding}))
+        elapsed = time.perf_counter() - start
+        assert result["status"] == 200, result
+        print(f"{label:>12} {args.scores / elapsed:>9.0f} {result['bytes'] / 2 ** 20:>8.1f} "
+              f"{start_rss:>10.1f} {result['peak']:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Login throughput as the password hashing pool grows from one process to one
+per CPU.
+
+    python -m benchmarks.bench_login --logins 200 --rounds 10
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from .common import use_temp_database, create_user, PASSWORD, run_concurrently, asgi_client
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    use_temp_database("login")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    from app.main import app
+    from app.db.base import SessionLocal
+    from app.utils.password import password_hasher
+
+    db = SessionLocal()
+    emails = [f"user{i}@example.com" for i in range(args.concurrency)]
+    for email in emails:
+        create_user(db, email, "employee")
+    db.close()
+
+    cpus = os.cpu_count() or 1
+    sizes = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+    async def measure(workers):
+        password_hasher.shutdown()
+        password_hasher.workers = workers
+        async with asgi_client(app) as client:
+            async def login(i):
+                resp = await client.post("/api/v1/auth/login",
+                                         json={"email": emails[i % len(emails)], "password": PASSWORD})
+                assert resp.status_code == 200, resp.text
+
+            await run_concurrently(login, workers, workers)  # start the processes
+            start = time.perf_counter()
+            latencies = await run_concurrently(login, args.logins, args.concurrency)
+            elapsed = time.perf_counter() - start
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        stats = password_hasher.stats()
+        print(f"workers={workers:<3} {args.logins / elapsed:8.1f} logins/s   "
+              f"p95={p95 * 1000:7.1f} ms   max_queue_depth={stats['max_queue_depth']}")
+
+    for workers in sizes:
+        asyncio.run(measure(workers))
+    password_hasher.shutdown()
+
+if __name__ == "__main__":
+    main()
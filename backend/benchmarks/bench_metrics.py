@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Per-request cost of MetricsMiddleware and per-statement cost of the SQL
+accounting hooks, against a bare ASGI app that answers immediately.
+
+    python -m benchmarks.bench_metrics --requests 200000
+"""
+
+import argparse
+import asyncio
+import time
+from .common import use_temp_database
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+async def per_call_us(app, n: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/bench", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(n):
+            await app(scope, receive, send)
+        best = min(best, (time.perf_counter() - start) / n * 1e6)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200000)
+    args = parser.parse_args()
+
+    use_temp_database("metrics")
+    from app.core.metrics import Metrics, MetricsMiddleware, RequestStats, current_request
+    from app.core import metrics as metrics_module
+
+    bare = asyncio.run(per_call_us(bare_app, args.requests))
+    timed = asyncio.run(per_call_us(MetricsMiddleware(bare_app, Metrics(slow_query_seconds=1.0)), args.requests))
+    print(f"request: bare {bare:.2f} us, with MetricsMiddleware {timed:.2f} us, "
+          f"overhead {timed - bare:.2f} us")
+
+    class Conn:
+        info: dict = {}
+
+    conn = Conn()
+    current_request.set(RequestStats({}))
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        metrics_module._start_statement(conn, None, "SELECT 1", (), None, False)
+        metrics_module._finish_statement(conn, None, "SELECT 1", (), None, False)
+    hooks = (time.perf_counter() - start) / args.requests * 1e6
+    print(f"statement: accounting hooks {hooks:.2f} us")
+
+if __name__ == "__main__":
+    main()
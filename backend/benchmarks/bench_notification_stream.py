@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Cost of idle notification event streams and of fanning one event out to
+all of them: memory per open stream, then the time from publishing an
+unread count for every user (from a worker thread, as a write would) until
+every stream has sent it.
+
+    python -m benchmarks.bench_notification_stream --streams 5000
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from .bench_export import anon_rss_mb
+from .common import use_temp_database, seed_users
+
+async def open_stream(app, token: str, received: asyncio.Queue, closed: asyncio.Event) -> None:
+    """Hold one /notifications/stream open, putting each event frame's arrival time on ``received``."""
+    path = "/api/v1/notifications/stream"
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    }
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            await closed.wait()
+            return {"type": "http.disconnect"}
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body", b"").startswith(b"event:"):
+            received.put_nowait(time.perf_counter())
+
+    await app(scope, receive, send)
+
+async def run(app, tokens, user_ids) -> None:
+    from app.services.notification_broker import notification_broker
+    from app.db.base import async_engine
+    received: asyncio.Queue = asyncio.Queue()
+    closed = asyncio.Event()
+    # The first stream pays for pools, caches and lazy imports; count from after it.
+    tasks = [asyncio.create_task(open_stream(app, tokens[0], received, closed))]
+    await received.get()
+    base_rss = anon_rss_mb()
+    tasks += [asyncio.create_task(open_stream(app, token, received, closed)) for token in tokens[1:]]
+    for _ in tasks[1:]:  # each stream's initial unread event
+        await received.get()
+    open_rss = anon_rss_mb()
+    print(f"{len(tasks)} open streams, {notification_broker.subscriber_count()} subscribed")
+    print(f"  anonymous RSS {base_rss:.1f} -> {open_rss:.1f} MB, "
+          f"{(open_rss - base_rss) * 1024 / (len(tasks) - 1):.1f} KB per stream")
+
+    for round in range(3):
+        start = time.perf_counter()
+        publisher = threading.Thread(target=lambda: [
+            notification_broker.publish(user_id, "unread", '{"unread":1}') for user_id in user_ids])
+        publisher.start()
+        arrivals = [await received.get() for _ in tasks]
+        publisher.join()
+        latencies = sorted((arrival - start) * 1000 for arrival in arrivals)
+        print(f"  fan-out {round + 1}: all {len(tasks)} delivered in {latencies[-1]:.1f} ms "
+              f"(median {statistics.median(latencies):.1f} ms)")
+
+    closed.set()
+    await asyncio.gather(*tasks)
+    assert notification_broker.subscriber_count() == 0
+    await async_engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--streams", type=int, default=5000)
+    args = parser.parse_args()
+
+    use_temp_database("notification-stream")
+    from app.db.base import engine
+    from app.core.security import create_access_token
+    from app.main import app
+
+    user_ids = seed_users(engine, args.streams, ["employee"], "streamer")
+    tokens = [create_access_token(data={"sub": user_id}) for user_id in user_ids]
+    asyncio.run(run(app, tokens, user_ids))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Read throughput of the score feed while other threads keep creating scores,
+with the tuned engine profile (WAL, busy timeout, pragmas, sized pool) and
+with SQLAlchemy's defaults.
+
+    python -m benchmarks.bench_pool_profile --readers 8 --writers 2 --seconds 10
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from .common import use_temp_database, seed_users, seed_skills, seed_scores
+
+def run_profile(profile: str, args) -> dict:
+    from sqlalchemy import exc
+    from sqlalchemy.orm import sessionmaker
+    from app.db import crud, migrations
+    from app.db.engine import create_db_engine, pool_stats
+
+    path = os.path.join(tempfile.mkdtemp(prefix=f"pool-{profile}-"), "bench.db")
+    engine = create_db_engine(f"sqlite:///{path}", profile=profile)
+    migrations.upgrade(engine)
+    employees = seed_users(engine, 200, ["employee"], "employee")
+    trainers = seed_users(engine, 10, ["trainer"], "trainer")
+    skills = seed_skills(engine, 50)
+    seed_scores(engine, args.scores, employees, skills, trainers)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def loop(work, key, seed):
+        rng = random.Random(seed)
+        db = Session()
+        while not stop.is_set():
+            try:
+                work(db, rng)
+                done = key
+            except exc.OperationalError:  # "database is locked"
+                db.rollback()
+                done = "errors"
+            with lock:
+                counts[done] += 1
+        db.close()
+
+    def read(db, rng):
+        crud.get_scores_page(db, employee_id=rng.choice(employees), limit=50)
+        db.rollback()  # end the read transaction, as get_db's close() does
+
+    def write(db, rng):
+        crud.create_score(db, employee_id=rng.choice(employees), skill_id=rng.choice(skills),
+                          score=float(rng.randint(0, 100)), trainer_id=rng.choice(trainers))
+
+    threads = [threading.Thread(target=loop, args=(read, "reads", i)) for i in range(args.readers)]
+    threads += [threading.Thread(target=loop, args=(write, "writes", -i - 1)) for i in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    stats = pool_stats(engine)
+    engine.dispose()
+    return {
+        "reads/s": counts["reads"] / args.seconds,
+        "writes/s": counts["writes"] / args.seconds,
+        "errors": counts["errors"],
+        "wait ms max": stats.get("wait_ms_max", 0.0),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scores", type=int, default=200000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    use_temp_database("pool-profile")
+    print(f"{'profile':>8} {'reads/s':>9} {'writes/s':>9} {'errors':>7} {'wait ms max':>12}")
+    for profile in ("default", "tuned"):
+        result = run_profile(profile, args)
+        print(f"{profile:>8} {result['reads/s']:>9.0f} {result['writes/s']:>9.0f} "
+              f"{result['errors']:>7} {result['wait ms max']:>12.1f}")
+
+if __name__ == "__main__":
+    main()
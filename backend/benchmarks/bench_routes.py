@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Throughput, latency percentiles and SQL statements per request for every
+API route, against a seeded throwaway database, with JSON baselines.
+
+    python -m benchmarks.bench_routes run --scale 1 --concurrency 1 20 --output current.json
+    python -m benchmarks.bench_routes run --save-baseline default
+    python -m benchmarks.bench_routes compare benchmarks/baselines/default.json current.json
+
+Every GET route under /api/v1 is found from the app itself, so new routes
+are measured without touching this file; the caller's role comes from the
+route's auth dependency and path parameters from the seeded ids. A route
+whose parameters cannot be filled is reported as skipped. ``compare`` exits
+non-zero when a route got slower or lost throughput by more than
+``--threshold`` percent, or issues more statements per request.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from .common import (
+    use_temp_database, seed_users, seed_skills, seed_scores, run_concurrently, asgi_client, percentile,
+)
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+# Query parameters a route needs to do real work.
+QUERY_PARAMS = {
+    "/api/v1/skills/search": {"q": "skill"},
+    "/api/v1/scores/aggregate": {"group_by": ["skill"]},
+    "/api/v1/employees/with-scores": {"department": "Engineering", "latest": 5},
+}
+# Long-lived streams have no latency to measure.
+SKIPPED = {"/api/v1/notifications/stream"}
+# Writes that can be repeated any number of times: (method, path, json body).
+WRITES = [
+    ("POST", "/api/v1/scores/", "trainer"),
+    ("POST", "/api/v1/notifications/read", "employee"),
+]
+
+ROLE_DEPENDENCIES = {
+    "get_current_super_user": "super-user",
+    "get_current_manager": "manager",
+    "get_current_trainer": "trainer",
+    "get_current_employee": "employee",
+    "get_current_user_dependency": "employee",
+}
+
+def route_role(dependant) -> Optional[str]:
+    """The role to call a route as, from the first auth dependency found in its tree."""
+    for dependency in dependant.dependencies:
+        role = ROLE_DEPENDENCIES.get(getattr(dependency.call, "__name__", ""))
+        if role or (role := route_role(dependency)):
+            return role
+    return None
+
+def seed(scale: float) -> Dict[str, str]:
+    """Seed an organisation of roughly ``scale`` x 1000 employees; returns the ids routes are called with."""
+    from app.db.base import SessionLocal, engine
+    from app.db import crud
+    employees = seed_users(engine, max(10, int(1000 * scale)), ["employee"], "employee")
+    trainers = seed_users(engine, max(2, int(20 * scale)), ["trainer"], "trainer")
+    managers = seed_users(engine, 5, ["manager"], "manager")
+    skills = seed_skills(engine, max(10, int(200 * scale)))
+    seed_scores(engine, max(100, int(100000 * scale)), employees, skills, trainers)
+    db = SessionLocal()
+    super_user = seed_users(engine, 1, ["super-user"], "admin")[0]
+    for employee_id in employees[:50]:
+        crud.update_user(db, employee_id, department="Engineering")
+    for i in range(200):
+        crud.create_notification(db, employees[0], "info", f"Notification {i}", "Benchmark")
+    path_ids = []
+    for i in range(20):
+        path_ids.append(crud.create_learning_path(db, f"Path {i}", employees[i % len(employees)], managers[0]).id)
+        for step in range(5):
+            crud.create_learning_step(db, path_ids[-1], f"Step {step}", "course")
+    score_id = crud.get_scores_by_employee(db, employees[0])[0].id
+    category = crud.get_skill(db, skills[0]).category
+    db.close()
+    return {"employee_id": employees[0], "trainer_id": trainers[0], "manager_id": managers[0],
+            "skill_id": skills[0], "score_id": score_id, "category": category, "path_id": path_ids[0],
+            "super_user_id": super_user}
+
+def discover(app, ids: Dict[str, str]) -> Tuple[List[dict], List[str]]:
+    """The GET routes to measure, with URL, params and role; and the ones that cannot be called."""
+    from fastapi.routing import APIRoute
+    cases, skipped = [], []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods or not route.path.startswith("/api/"):
+            continue
+        if route.path in SKIPPED:
+            skipped.append(f"GET {route.path} (stream)")
+            continue
+        try:
+            url = route.path.format(**ids)
+        except KeyError as missing:
+            skipped.append(f"GET {route.path} (no id for {missing})")
+            continue
+        cases.append({"name": f"GET {route.path}", "method": "GET", "url": url,
+                      "params": QUERY_PARAMS.get(route.path, {}), "json": None,
+                      "role": route_role(route.dependant)})
+    for method, path, role in WRITES:
+        body = {"employee_id": ids["employee_id"], "skill_id": ids["skill_id"], "score": 80,
+                "trainer_id": ids["trainer_id"]} if path == "/api/v1/scores/" else {}
+        cases.append({"name": f"{method} {path}", "method": method, "url": path, "params": {},
+                      "json": body, "role": role})
+    return cases, skipped
+
+def count_statements():
+    """Start counting SQL statements on every engine; returns (read count, stop)."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    count = [0]
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        count[0] += 1
+
+    event.listen(Engine, "before_cursor_execute", record)
+    return (lambda: count[0]), (lambda: event.remove(Engine, "before_cursor_execute", record))
+
+async def measure(app, case: dict, headers: Dict[str, dict], requests: int, concurrency: int) -> dict:
+    errors = 0
+    async with asgi_client(app) as client:
+        async def request(i):
+            nonlocal errors
+            resp = await client.request(case["method"], case["url"], params=case["params"],
+                                        json=case["json"], headers=headers.get(case["role"], {}))
+            if resp.status_code >= 400:
+                errors += 1
+
+        await request(0)  # warm the user cache and any lazily built state
+        errors = 0
+        statements, stop = count_statements()
+        start = time.perf_counter()
+        try:
+            latencies = await run_concurrently(request, requests, concurrency)
+        finally:
+            stop()
+        elapsed = time.perf_counter() - start
+    latencies = [latency * 1000 for latency in latencies]
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "queries_per_request": round(statements() / requests, 2),
+        "errors": errors,
+    }
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args) -> int:
+    use_temp_database("routes")
+    import re
+    # Every request of a slow route would otherwise log its statement.
+    logging.getLogger("app.sql").setLevel(logging.ERROR)
+    from app.core.security import create_access_token
+    from app.db.base import async_engine
+    from app.main import app
+
+    ids = seed(args.scale)
+    users = {"employee": ids["employee_id"], "trainer": ids["trainer_id"], "manager": ids["manager_id"],
+             "super-user": ids["super_user_id"]}
+    headers = {role: {"Authorization": f"Bearer {create_access_token(data={'sub': user_id})}"}
+               for role, user_id in users.items()}
+    cases, skipped = discover(app, ids)
+    if args.routes:
+        cases = [case for case in cases if re.search(args.routes, case["name"])]
+
+    results = {}
+
+    async def measure_all():
+        for case in cases:
+            for concurrency in args.concurrency:
+                result = await measure(app, case, headers, args.requests, concurrency)
+                results[f"{case['name']} c={concurrency}"] = result
+                print(f"{case['name']:<56} {concurrency:>5} {result['throughput']:>8.0f} "
+                      f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+                      f"{result['queries_per_request']:>6.2f} {result['errors']:>6}", flush=True)
+        # aiosqlite's connection threads would keep the process alive.
+        await async_engine.dispose()
+
+    print(f"{'route':<56} {'conc':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'q/req':>6} {'errors':>6}")
+    asyncio.run(measure_all())
+    for name in skipped:
+        print(f"skipped: {name}")
+
+    report = {
+        "meta": {
+            "created": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": f"{platform.machine()}, {os.cpu_count()} CPU",
+            "scale": args.scale,
+            "requests": args.requests,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    output = args.output
+    if args.save_baseline:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        output = os.path.join(BASELINE_DIR, f"{args.save_baseline}.json")
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"wrote {output}")
+    return 0
+
+def compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    for key in ("scale", "requests"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: {key} differs ({baseline['meta'].get(key)} vs {current['meta'].get(key)})")
+
+    threshold = args.threshold / 100
+    regressions = 0
+    print(f"{'route':<64} {'p95 ms':>17} {'req/s':>15} {'q/req':>11}")
+    for name in sorted(set(baseline["results"]) | set(current["results"])):
+        old, new = baseline["results"].get(name), current["results"].get(name)
+        if old is None or new is None:
+            print(f"{name:<64} {'only in ' + ('current' if old is None else 'baseline'):>17}")
+            continue
+        problems = []
+        # Latency must also have grown by a millisecond, so that jitter on
+        # sub-millisecond routes does not fail the comparison.
+        if new["p95_ms"] > old["p95_ms"] * (1 + threshold) and new["p95_ms"] - old["p95_ms"] >= 1:
+            problems.append("p95")
+        if new["throughput"] < old["throughput"] * (1 - threshold):
+            problems.append("throughput")
+        if new["queries_per_request"] > old["queries_per_request"]:
+            problems.append("queries")
+        if new["errors"] > old["errors"]:
+            problems.append("errors")
+        regressions += bool(problems)
+        print(f"{name:<64} {old['p95_ms']:>7.2f} -> {new['p95_ms']:>6.2f} "
+              f"{old['throughput']:>6.0f} -> {new['throughput']:>5.0f} "
+              f"{old['queries_per_request']:>4.1f} -> {new['queries_per_request']:>3.1f}"
+              f"{'  REGRESSION: ' + ', '.join(problems) if problems else ''}")
+    print(f"{regressions} regression(s) beyond {args.threshold:g}%")
+    return 1 if regressions else 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="measure every route")
+    run_parser.add_argument("--scale", type=float, default=0.1,
+                            help="dataset size: 1 is 1000 employees, 200 skills and 100k scores")
+    run_parser.add_argument("--requests", type=int, default=200, help="requests per route and concurrency")
+    run_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10])
+    run_parser.add_argument("--routes", help="only routes whose 'METHOD /path' matches this regex")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--save-baseline", metavar="NAME", help=f"write to {BASELINE_DIR}/NAME.json")
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    args = parser.parse_args()
+    sys.exit(run(args) if args.command == "run" else compare(args))
+
+if __name__ == "__main__":
+    main()
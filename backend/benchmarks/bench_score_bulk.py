@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Score ingestion throughput in rows per second: one crud.create_score call
+per row against a single POST /scores/bulk upload.
+
+    python -m benchmarks.bench_score_bulk --rows 5000
+"""
+
+import argparse
+import json
+import random
+import time
+from .common import use_temp_database, seed_users, seed_skills
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--skills", type=int, default=50)
+    args = parser.parse_args()
+
+    use_temp_database("score-bulk")
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db.base import SessionLocal, engine
+    from app.db import crud
+    from app.core.security import create_access_token
+
+    employees = seed_users(engine, args.employees, ["employee"], "employee")
+    trainer = seed_users(engine, 1, ["trainer"], "trainer")[0]
+    skills = seed_skills(engine, args.skills)
+    rng = random.Random(1)
+    rows = [{"employee_id": rng.choice(employees), "skill_id": rng.choice(skills),
+             "trainer_id": trainer, "score": float(rng.randint(0, 100))}
+            for _ in range(args.rows)]
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    for row in rows:
+        crud.create_score(db, row["employee_id"], row["skill_id"], row["score"], row["trainer_id"])
+    single = args.rows / (time.perf_counter() - start)
+    db.close()
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': trainer})}",
+               "Content-Type": "application/json"}
+    with TestClient(app) as client:
+        start = time.perf_counter()
+        resp = client.post("/api/v1/scores/bulk", content=json.dumps(rows), headers=headers)
+        bulk = args.rows / (time.perf_counter() - start)
+    resp.raise_for_status()
+    assert resp.json()["created"] == args.rows
+
+    db = SessionLocal()
+    assert crud.check_skill_matrix(db) == []
+    db.close()
+
+    print(f"{'path':<22} {'rows/s':>10}")
+    print(f"{'create_score per row':<22} {single:>10.0f}")
+    print(f"{'POST /scores/bulk':<22} {bulk:>10.0f}")
+    print(f"speedup: {bulk / single:.1f}x")
+
+if __name__ == "__main__":
+    main()
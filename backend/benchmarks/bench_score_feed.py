@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Score feed latency at page 1 and page 10,000 on a large scores table:
+keyset cursor pages against the old OFFSET query.
+
+    python -m benchmarks.bench_score_feed --scores 10000000
+"""
+
+import argparse
+import time
+from .common import use_temp_database, seed_users, seed_skills, seed_scores, timed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scores", type=int, default=10000000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--page", type=int, default=10000)
+    args = parser.parse_args()
+
+    use_temp_database("score-feed")
+    from app.db.base import SessionLocal, engine
+    from app.db import crud
+    from app.utils.pagination import encode_cursor, decode_cursor
+
+    employees = seed_users(engine, 2000, ["employee"], "employee")
+    trainers = seed_users(engine, 50, ["trainer"], "trainer")
+    skills = seed_skills(engine, 200)
+    start = time.perf_counter()
+    seed_scores(engine, args.scores, employees, skills, trainers)
+    print(f"seeded {args.scores} scores in {time.perf_counter() - start:.1f}s")
+
+    # One-off OFFSET lookup of the key that ends page N - 1, i.e. the cursor a
+    # client would hold after paging that deep.
+    offset = (args.page - 1) * args.limit - 1
+    with engine.connect() as conn:
+        key = conn.exec_driver_sql(
+            "SELECT date, id FROM scores ORDER BY date DESC, id DESC LIMIT 1 OFFSET ?", (offset,)
+        ).one()
+    cursor = encode_cursor(*key)
+
+    db = SessionLocal()
+    print(f"{'page':>7} {'keyset ms':>10} {'offset ms':>10}")
+    for page, page_cursor in ((1, None), (args.page, cursor)):
+        after = tuple(decode_cursor(page_cursor, 2)) if page_cursor else None
+        keyset = timed(lambda: crud.get_scores_page(db, after, limit=args.limit + 1))
+        offset_ms = timed(lambda: crud.get_scores(db, (page - 1) * args.limit, args.limit), repeat=3)
+        print(f"{page:>7} {keyset:>10.2f} {offset_ms:>10.2f}")
+    db.close()
+
+if __name__ == "__main__":
+    main()
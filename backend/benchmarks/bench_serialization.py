@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Cost of turning a list of employees, scores or skills into a JSON response
+body: ORM objects, a model_validate per row and FastAPI's response_model
+pass, against column tuples encoded by RowListEncoder.
+
+    python -m benchmarks.bench_serialization --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+from .common import use_temp_database, seed_users, seed_skills, seed_scores
+
+def best_of(fn, repeat: int) -> float:
+    """Fastest of ``repeat`` calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    use_temp_database("serialization")
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+    from app.db.base import SessionLocal, engine
+    from app.db import models
+    from app.schemas.employee import EmployeeResponse
+    from app.schemas.score import ScoreResponse
+    from app.schemas.skill import SkillResponse
+    from app.utils.serialization import RowListEncoder
+
+    largest = max(args.sizes)
+    employees = seed_users(engine, largest, ["employee"], "employee")
+    trainers = seed_users(engine, 10, ["trainer"], "trainer")
+    skills = seed_skills(engine, largest)
+    seed_scores(engine, largest, employees, skills, trainers)
+    db = SessionLocal()
+
+    def model_path(entity, schema, n):
+        # The old route: ORM objects, model_validate per row, then FastAPI
+        # validates the list against response_model and json.dumps it.
+        field = create_response_field(name="response", type_=List[schema])
+        objects = db.query(entity).limit(n).all()
+        content = [schema.model_validate(obj) for obj in objects]
+        jsonable = asyncio.run(serialize_response(field=field, response_content=content))
+        body = JSONResponse(jsonable).body
+        db.expunge_all()
+        return body
+
+    def row_path(entity, schema, n):
+        encoder = RowListEncoder(schema)
+        return encoder.encode(db.query(*encoder.columns(entity)).limit(n).all())
+
+    print(f"{'list':>10} {'rows':>7} {'models ms':>10} {'rows ms':>9} {'speedup':>8}")
+    for name, entity, schema in (("employees", models.User, EmployeeResponse),
+                                 ("scores", models.Score, ScoreResponse),
+                                 ("skills", models.Skill, SkillResponse)):
+        for n in args.sizes:
+            old = best_of(lambda: model_path(entity, schema, n), args.repeat)
+            new = best_of(lambda: row_path(entity, schema, n), args.repeat)
+            print(f"{name:>10} {n:>7} {old:>10.1f} {new:>9.1f} {old / new:>7.1f}x")
+    db.close()
+
+if __name__ == "__main__":
+    main()
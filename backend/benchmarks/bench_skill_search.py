@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Latency of GET /skills/search (FTS5 prefix match, bm25 ranking and category
+facets) over a large skills table.
+
+    python -m benchmarks.bench_skill_search --skills 50000 --requests 500
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from .common import use_temp_database
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "ta", "vo", "shi", "dra", "pel", "quin", "ster",
+             "ox", "ly", "ben", "cor", "fa", "gu", "hep", "jin", "wal", "zet", "ay", "dun"]
+
+def vocabulary(size: int, rng: random.Random) -> list:
+    """Made-up words of 2-4 syllables, so prefixes are about as selective as a real catalog's."""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+def seed_searchable_skills(engine, count: int, seed: int = 1) -> list:
+    from sqlalchemy import insert
+    from app.db.models import Skill
+    rng = random.Random(seed)
+    words = vocabulary(5000, rng)
+    rows = [{"id": str(uuid.uuid4()),
+             "name": f"{rng.choice(words).title()} {rng.choice(words)} {i}",
+             "description": " ".join(rng.choice(words) for _ in range(12)),
+             "category": f"Category {i % 25}"}
+            for i in range(count)]
+    with engine.begin() as conn:
+        conn.execute(insert(Skill), rows)
+    return words
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--skills", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    use_temp_database("skill-search")
+    from fastapi.testclient import TestClient
+    from app.db.base import engine
+    from app.main import app
+
+    words = seed_searchable_skills(engine, args.skills)
+    client = TestClient(app)
+    rng = random.Random(2)
+    # One or two words, each typed 4 to 8 letters in, as a search-as-you-type box sends them.
+    queries = [" ".join(rng.choice(words)[:rng.randint(4, 8)] for _ in range(rng.randint(1, 2)))
+               for _ in range(args.requests)]
+    timings = []
+    for q in queries:
+        start = time.perf_counter()
+        client.get("/api/v1/skills/search", params={"q": q}).raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"{args.skills} skills, {args.requests} searches")
+    print(f"p50 {statistics.median(timings):.2f} ms  p99 {timings[int(len(timings) * 0.99) - 1]:.2f} ms")
+
+if __name__ == "__main__":
+    main()
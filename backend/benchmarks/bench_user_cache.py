@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Requests per second on GET /api/v1/scores/ with and without the
+authenticated-user cache.
+
+    python -m benchmarks.bench_user_cache --requests 2000
+"""
+
+import argparse
+from .common import use_temp_database, create_user, login, rate
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--scores", type=int, default=50)
+    args = parser.parse_args()
+
+    use_temp_database("user-cache")
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.core.cache import user_cache
+    from app.db import crud
+    from app.db.base import SessionLocal
+
+    db = SessionLocal()
+    create_user(db, "manager@example.com", "manager")
+    trainer = create_user(db, "trainer@example.com", "trainer")
+    employee = create_user(db, "employee@example.com", "employee")
+    skill = crud.create_skill(db, name="Python", category="Programming")
+    for i in range(args.scores):
+        crud.create_score(db, employee.id, skill.id, float(i % 100), trainer.id)
+    db.close()
+
+    with TestClient(app) as client:
+        headers = login(client, "manager@example.com")
+
+        def request():
+            resp = client.get("/api/v1/scores/", headers=headers)
+            assert resp.status_code == 200, resp.text
+
+        maxsize = user_cache.maxsize
+        for label, size in (("cache off", 0), ("cache on", maxsize)):
+            user_cache.clear()
+            user_cache.maxsize = size
+            rate(request, 100)
+            rps = rate(request, args.requests)
+            stats = user_cache.stats()
+            print(f"{label:<10} {rps:9.1f} req/s   hits={stats['hits']} misses={stats['misses']}")
+
+if __name__ == "__main__":
+    main()
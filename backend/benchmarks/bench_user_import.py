@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+User onboarding throughput: crud.create_user per user (one hash and one
+commit each) against the bulk CSV import with pooled hashing.
+
+    python -m benchmarks.bench_user_import --users 2000 --rounds 10
+"""
+
+import argparse
+import os
+import time
+from .common import use_temp_database, PASSWORD
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    use_temp_database("user-import")
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    from app.db.base import SessionLocal
+    from app.db import crud
+    from app.utils.ingest import parse_records
+    from app.utils.password import password_hasher
+    from app.services.user_import_service import UserImportService
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    for i in range(args.users):
+        crud.create_user(db, email=f"single{i}@example.com", name=f"Single {i}",
+                         password=PASSWORD, role="employee")
+    single = args.users / (time.perf_counter() - start)
+
+    csv_body = "email,name,password,role\n" + "".join(
+        f"bulk{i}@example.com,Bulk {i},{PASSWORD},employee\n" for i in range(args.users))
+    start = time.perf_counter()
+    result = UserImportService(db).import_users(parse_records("text/csv", csv_body.encode()))
+    bulk = args.users / (time.perf_counter() - start)
+    assert result.created == args.users
+    db.close()
+    password_hasher.shutdown()
+
+    print(f"hash workers: {password_hasher.workers}, bcrypt rounds: {args.rounds}")
+    print(f"{'path':<22} {'users/s':>10}")
+    print(f"{'create_user per user':<22} {single:>10.0f}")
+    print(f"{'bulk import':<22} {bulk:>10.0f}")
+    print(f"speedup: {bulk / single:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Fill the database with a synthetic organisation for load testing.
+
+    python3 generate_dataset.py                          # 100k users, 5k skills, 10M scores
+    python3 generate_dataset.py --users 2000 --skills 300 --scores 200000 --seed 7
+
+Users get @generated.example.com addresses and the password "password123".
+The same --seed and --end-date always produce the same rows. Point
+DATABASE_URL at a fresh database: a database that already holds generated
+users is refused.
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from app.db.base import SessionLocal, engine
+from app.db import migrations
+from app.services.dataset_generator import DatasetGenerator
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic organisation.")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--scores", type=int, default=10000000)
+    parser.add_argument("--learning-paths", type=int, default=None, help="default: one per two users")
+    parser.add_argument("--notifications", type=int, default=None, help="default: five per user")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--days", type=int, default=730, help="history covered by scores and notifications")
+    parser.add_argument("--end-date", type=datetime.fromisoformat, default=None,
+                        help="last day of the history (default: today)")
+    parser.add_argument("--batch-size", type=int, default=100000, help="rows per executemany")
+    args = parser.parse_args()
+
+    migrations.upgrade(engine)
+    db = SessionLocal()
+    start = time.perf_counter()
+
+    def progress(message: str) -> None:
+        print(f"[{time.perf_counter() - start:7.1f}s] {message}", flush=True)
+
+    try:
+        generator = DatasetGenerator(db, args.seed, args.end_date, args.days, args.batch_size, progress)
+        counts = generator.generate(
+            args.users, args.skills, args.scores,
+            args.users // 2 if args.learning_paths is None else args.learning_paths,
+            args.users * 5 if args.notifications is None else args.notifications,
+        )
+    except ValueError as exc:
+        print(exc)
+        return 1
+    finally:
+        db.close()
+    progress(", ".join(f"{count} {table}" for table, count in counts.items()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Bulk import users from a CSV file with email, name, password, role and
+optional department, experience and avatar columns.
+
+    python3 import_users.py people.csv
+    python3 import_users.py people.csv --workers 8
+"""
+
+import argparse
+import sys
+import time
+from app.db.base import SessionLocal, engine
+from app.db import migrations
+from app.utils.ingest import parse_records
+from app.utils.password import password_hasher
+from app.services.user_import_service import UserImportService
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV.")
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="password hashing processes (default: PASSWORD_HASH_WORKERS or one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="rows per INSERT batch")
+    args = parser.parse_args()
+
+    if args.workers is not None:
+        password_hasher.workers = args.workers
+    with open(args.path, "rb") as f:
+        records = parse_records("text/csv", f.read())
+
+    migrations.upgrade(engine)
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        result = UserImportService(db, args.chunk_size).import_users(records)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+        password_hasher.shutdown()
+
+    for error in result.errors[:50]:
+        print(f"Row {error.row}: {error.error}")
+    print(f"Created {result.created} users, skipped {result.skipped} existing, "
+          f"{result.failed} failed in {elapsed:.1f}s")
+    return 1 if result.failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
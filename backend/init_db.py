@@ -4,14 +4,13 @@ Database initialization script with sample data
 """
 
 from app.db.base import engine
-from app.db import models
-from app.db import crud
-from app.utils.password import get_password_hash
+from app.db import crud, migrations, models
+from app.services.user_import_service import UserImportService
 
 def init_db():
     """Initialize database with sample data."""
-    # Create tables
-    models.Base.metadata.create_all(bind=engine)
+    # Create or upgrade the tables
+    migrations.upgrade(engine)
     
     # Get database session
     from app.db.session import get_db
@@ -28,16 +27,12 @@ def init_db():
             {"name": "Docker", "category": "DevOps", "description": "Containerization platform"},
         ]
         
-        for skill_data in skills_data:
-            existing_skill = crud.get_skills(db)
-            skill_names = [skill.name for skill in existing_skill]
-            if skill_data["name"] not in skill_names:
-                crud.create_skill(
-                    db=db,
-                    name=skill_data["name"],
-                    category=skill_data["category"],
-                    description=skill_data["description"]
-                )
+        existing_skills = crud.get_existing_ids(
+            db, models.Skill.name, (skill["name"] for skill in skills_data)
+        )
+        crud.bulk_create_skills(
+            db, [skill for skill in skills_data if skill["name"] not in existing_skills]
+        )
         
         # Create sample users
         users_data = [
@@ -79,19 +74,11 @@ def init_db():
             }
         ]
         
-        for user_data in users_data:
-            existing_user = crud.get_user_by_email(db, user_data["email"])
-            if not existing_user:
-                crud.create_user(
-                    db=db,
-                    email=user_data["email"],
-                    name=user_data["name"],
-                    password=user_data["password"],
-                    role=user_data["role"],
-                    avatar=user_data["avatar"],
-                    department=user_data["department"],
-                    experience=user_data["experience"]
-                )
+        # Same path as import_users.py: one email lookup, parallel hashing,
+        # one transaction. Users that already exist are left alone.
+        result = UserImportService(db).import_users(list(enumerate(users_data, start=1)))
+        for error in result.errors:
+            print(f"Could not create user {error.row}: {error.error}")
         
         print("Database initialized successfully!")
         print("Sample users created:")
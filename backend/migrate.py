@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Create or upgrade the database schema to the latest migration.
+
+    python3 migrate.py            # upgrade to head
+    python3 migrate.py --check    # only report whether an upgrade is needed
+
+Databases created before migrations existed are recognised and upgraded in
+place. ``alembic`` can be used directly for anything else (history,
+downgrade, new revisions).
+"""
+
+import argparse
+import sys
+from app.db.base import engine
+from app.db import migrations
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Upgrade the database schema.")
+    parser.add_argument("--check", action="store_true", help="only check, do not upgrade")
+    args = parser.parse_args()
+
+    if args.check:
+        try:
+            migrations.check_schema(engine)
+        except migrations.SchemaOutOfDate as exc:
+            print(exc)
+            return 1
+    else:
+        migrations.upgrade(engine)
+    print(f"Database schema is at revision {migrations.current_revision(engine)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Rebuild the employee x skill matrix from the scores table, or check it.
+
+    python3 rebuild_skill_matrix.py           # rebuild, then verify
+    python3 rebuild_skill_matrix.py --check   # only report inconsistencies
+"""
+
+import argparse
+import sys
+from app.db.base import SessionLocal, engine
+from app.db import migrations
+from app.services.skill_matrix_service import SkillMatrixService
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or check the skill matrix.")
+    parser.add_argument("--check", action="store_true", help="only check, do not rebuild")
+    args = parser.parse_args()
+
+    migrations.upgrade(engine)
+    db = SessionLocal()
+    try:
+        service = SkillMatrixService(db)
+        if not args.check:
+            cells = service.rebuild()
+            print(f"Rebuilt skill matrix: {cells} cells")
+        problems = service.check()
+        for problem in problems[:50]:
+            print(f"Inconsistent: {problem}")
+        if problems:
+            print(f"{len(problems)} inconsistent cells")
+            return 1
+        print("Skill matrix is consistent with scores")
+        return 0
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
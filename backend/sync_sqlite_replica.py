@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Keep a local SQLite read replica in sync with DATABASE_URL, for trying out
+replica routing without a server database.
+
+    python3 sync_sqlite_replica.py ./replica.db                # copy once
+    python3 sync_sqlite_replica.py ./replica.db --interval 2   # copy every 2s
+
+Then point the app at it read-only:
+
+    DATABASE_REPLICA_URLS=sqlite:///file:./replica.db?mode=ro&uri=true
+"""
+
+import argparse
+import sys
+import time
+from sqlalchemy.engine import make_url
+from app.core.config import settings
+from app.db.replicas import copy_sqlite_database
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Copy the SQLite database to a replica file.")
+    parser.add_argument("target", help="replica database file")
+    parser.add_argument("--interval", type=float, help="keep copying every INTERVAL seconds")
+    args = parser.parse_args()
+
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "sqlite" or not url.database:
+        print("DATABASE_URL is not an SQLite file", file=sys.stderr)
+        return 1
+    while True:
+        start = time.perf_counter()
+        copy_sqlite_database(url.database, args.target)
+        print(f"Copied {url.database} to {args.target} in {time.perf_counter() - start:.2f}s")
+        if not args.interval:
+            return 0
+        time.sleep(args.interval)
+
+if __name__ == "__main__":
+    sys.exit(main())
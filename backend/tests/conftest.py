@@ -0,0 +1,78 @@
+import os
+import tempfile
+
+# Run the suite against a throwaway database; this has to happen before any
+# test module imports the app and the engine is created.
+_tmpdir = tempfile.mkdtemp(prefix="skills-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmpdir, 'test.db')}")
+# Cheap, inline bcrypt keeps the suite fast; the pool has its own tests.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+
+from contextlib import contextmanager  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from app.db.base import engine  # noqa: E402
+from app.db import migrations  # noqa: E402
+
+migrations.upgrade(engine)
+
+
+class QueryLog(list):
+    """The SQL statements recorded by count_queries, in order."""
+
+    def format(self) -> str:
+        return "\n".join(f"{number:>3}. {' '.join(statement.split())}"
+                         for number, statement in enumerate(self, 1))
+
+    def check(self, limit: int, label: str = "block") -> None:
+        """Fail the test, listing the statements, if there are more than ``limit``."""
+        if len(self) > limit:
+            pytest.fail(f"{label} issued {len(self)} SQL statements, budget {limit}:\n{self.format()}",
+                        pytrace=False)
+
+
+@pytest.fixture(scope="session")
+def count_queries():
+    """
+    ``with count_queries() as statements:`` records every SQL statement
+    issued inside the block on any engine: the sync engine, the async
+    engine and the replicas.
+    """
+    @contextmanager
+    def counting():
+        statements = QueryLog()
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+    return counting
+
+
+@pytest.fixture(scope="session")
+def query_budget(count_queries):
+    """
+    ``with query_budget(n, "GET /route"):`` fails the test when the block
+    issues more than ``n`` statements, listing every one of them.
+    """
+    @contextmanager
+    def budget(limit: int, label: str = "block"):
+        with count_queries() as statements:
+            yield statements
+        statements.check(limit, label)
+    return budget
+
+def pytest_sessionfinish(session, exitstatus):
+    # Module-level TestClients never run the app's shutdown handlers, so close
+    # the pooled connections here or their aiosqlite threads block exit.
+    import asyncio
+    from app.db.base import async_engine, engine, replicas
+    asyncio.run(async_engine.dispose())
+    engine.dispose()
+    asyncio.run(replicas.dispose())
@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal, async_database_url
+from app.db import crud, models
+from app.core.security import create_access_token
+from app.utils.password import verify_password
+
+client = TestClient(app)
+
+
+def test_async_database_url_swaps_driver():
+    assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert async_database_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert async_database_url("mysql://u@db/app") == "mysql://u@db/app"
+
+
+def test_async_routes_write_and_read_back():
+    db = SessionLocal()
+    manager = crud.create_user(db, email="async.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    db.close()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+
+    resp = client.post("/api/v1/employees/", headers=headers, json={
+        "email": "async.employee@example.com", "name": "Async", "password": "secret",
+    })
+    assert resp.status_code == 200, resp.text
+    employee_id = resp.json()["id"]
+
+    resp = client.put(f"/api/v1/employees/{employee_id}", headers=headers, json={"department": "Async"})
+    assert resp.json()["department"] == "Async"
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=headers).json()["department"] == "Async"
+
+    db = SessionLocal()
+    assert verify_password("secret", crud.get_user(db, employee_id).hashed_password)
+    db.close()
+
+    assert client.delete(f"/api/v1/employees/{employee_id}", headers=headers).status_code == 200
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=headers).status_code == 404
+
+
+def test_welcome_email_is_queued_in_the_same_commit_as_the_employee():
+    db = SessionLocal()
+    manager = crud.create_user(db, email="async.mailer@example.com", name="Manager",
+                               password="pass", role="manager")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    resp = client.post("/api/v1/employees/", headers=headers, json={
+        "email": "async.welcome@example.com", "name": "Welcome", "password": "secret",
+    })
+    assert resp.status_code == 200, resp.text
+    (queued,) = db.query(models.OutboxEmail).filter(models.OutboxEmail.to_email == "async.welcome@example.com").all()
+    assert queued.status == "pending" and "Welcome" in queued.body
+    db.close()
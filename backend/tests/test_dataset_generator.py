@@ -0,0 +1,75 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.db import crud, migrations
+from app.services.dataset_generator import DatasetGenerator
+
+END = datetime(2026, 6, 30)
+
+
+def generate(path, seed=7):
+    engine = create_engine(f"sqlite:///{path}")
+    migrations.upgrade(engine)
+    db = Session(engine)
+    counts = DatasetGenerator(db, seed=seed, end=END, batch_size=700).generate(
+        users=300, skills=120, scores=5000, learning_paths=60, notifications=900)
+    return engine, db, counts
+
+
+def dump(engine, table, columns):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"SELECT {columns} FROM {table} ORDER BY id").all()
+
+
+def test_generated_dataset_is_consistent(tmp_path):
+    engine, db, counts = generate(tmp_path / "one.db")
+    assert counts["users"] == 300 and counts["scores"] == 5000 and counts["notifications"] == 900
+    assert crud.check_skill_matrix(db) == []
+
+    with engine.connect() as conn:
+        roles = dict(conn.exec_driver_sql("SELECT role, count(*) FROM users GROUP BY role").all())
+        assert roles == {"manager": 3, "trainer": 6, "employee": 291}
+        # Every score is by a trainer, for an employee, within range.
+        assert conn.exec_driver_sql("""
+            SELECT count(*) FROM scores JOIN users AS e ON e.id = scores.employee_id
+            JOIN users AS t ON t.id = scores.trainer_id
+            WHERE e.role = 'employee' AND t.role = 'trainer' AND score BETWEEN 0 AND 100
+              AND date BETWEEN '2024-07-01' AND '2026-07-01'""").scalar() == 5000
+        assert conn.exec_driver_sql("""
+            SELECT count(*) FROM users WHERE unread_notifications != (
+                SELECT count(*) FROM notifications WHERE user_id = users.id AND read = 0)""").scalar() == 0
+        # Completed steps come before the rest of their path.
+        steps = conn.exec_driver_sql("""
+            SELECT learning_path_id, completed FROM learning_steps ORDER BY learning_path_id, position""").all()
+        assert 3 * 60 <= len(steps) <= 8 * 60
+        previous = {}
+        for path_id, completed in steps:
+            assert not (completed and previous.get(path_id) == 0)
+            previous[path_id] = completed
+        # The indexes dropped for the load are back.
+        indexes = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"ix_scores_employee_date_id", "ix_notifications_user_date_id",
+                "ix_learning_steps_path_position"} <= indexes
+    db.close()
+    engine.dispose()
+
+
+def test_same_seed_generates_the_same_rows(tmp_path):
+    first = generate(tmp_path / "one.db")
+    second = generate(tmp_path / "two.db")
+    other = generate(tmp_path / "three.db", seed=8)
+    # Everything but server defaults (created_at) and salted password hashes.
+    for table, columns in (("users", "id, email, name, role, department, experience, unread_notifications"),
+                           ("skills", "id, name, category"),
+                           ("scores", "id, employee_id, skill_id, score, date, trainer_id"),
+                           ("learning_steps", "id, learning_path_id, position, title, completed, completed_date"),
+                           ("notifications", "id, user_id, type, date, read")):
+        rows = [dump(engine, table, columns) for engine, _, _ in (first, second, other)]
+        assert rows[0] == rows[1]
+        assert rows[0] != rows[2]
+    with pytest.raises(ValueError):
+        DatasetGenerator(first[1], seed=7, end=END).generate(10, 10, 10, 1, 1)
+    for engine, db, _ in (first, second, other):
+        db.close()
+        engine.dispose()
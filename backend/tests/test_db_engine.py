@@ -0,0 +1,108 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from sqlalchemy import create_engine, exc, text
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal, async_engine, engine
+from app.db import crud
+from app.db.engine import TimedQueuePool, create_db_engine, pool_stats
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def pragma(conn, name):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_tuned_profile_sets_sqlite_pragmas():
+    with engine.connect() as conn:
+        assert pragma(conn, "journal_mode") == "wal"
+        assert pragma(conn, "synchronous") == 1  # NORMAL
+        assert pragma(conn, "busy_timeout") == 5000
+        assert pragma(conn, "cache_size") == -65536
+
+    async def read_async():
+        async with async_engine.connect() as conn:
+            return (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+
+    assert asyncio.run(read_async()) == 5000
+
+
+def test_default_profile_leaves_sqlalchemy_defaults(tmp_path):
+    default = create_db_engine(f"sqlite:///{tmp_path / 'default.db'}", profile="default")
+    with default.connect() as conn:
+        assert pragma(conn, "journal_mode") == "delete"
+        assert pragma(conn, "synchronous") == 2  # FULL
+    assert not isinstance(default.pool, TimedQueuePool)
+    default.dispose()
+
+
+def test_pool_stats_count_checkouts_and_timeouts(tmp_path):
+    small = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool,
+                          pool_size=1, max_overflow=0, pool_timeout=0.05,
+                          connect_args={"check_same_thread": False})
+    with small.connect():
+        stats = pool_stats(small)
+        assert (stats["checked_out"], stats["checkouts"]) == (1, 1)
+        with pytest.raises(exc.TimeoutError):
+            small.connect()
+
+    stats = pool_stats(small)
+    assert (stats["checked_out"], stats["checked_in"]) == (0, 1)
+    assert (stats["checkouts"], stats["timeouts"]) == (2, 1)
+    assert stats["wait_ms_max"] >= 50
+    small.dispose()
+
+
+def test_admin_pool_endpoint_requires_super_user():
+    db = SessionLocal()
+    admin = crud.create_user(db, email="pool.admin@example.com", name="Admin",
+                             password="pass", role="super-user")
+    manager = crud.create_user(db, email="pool.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    admin_id, manager_id = admin.id, manager.id
+    db.close()
+
+    resp = client.get("/api/v1/admin/db/pool",
+                      headers={"Authorization": f"Bearer {create_access_token(data={'sub': admin_id})}"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["sync"]["pool"] == "TimedQueuePool"
+    assert body["sync"]["checkouts"] >= 1
+    assert {"checked_out", "overflow", "wait_ms_avg"} <= set(body["sync"])
+    assert "async" in body
+
+    resp = client.get("/api/v1/admin/db/pool",
+                      headers={"Authorization": f"Bearer {create_access_token(data={'sub': manager_id})}"})
+    assert resp.status_code == 403
+
+
+def test_process_exits_after_app_shutdown(tmp_path):
+    # Pooled async connections keep a worker thread each; if shutdown does not
+    # dispose the engines the interpreter never exits.
+    script = textwrap.dedent("""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.db.base import SessionLocal, engine
+        from app.db import crud, migrations
+        from app.core.security import create_access_token
+
+        migrations.upgrade(engine)
+        db = SessionLocal()
+        manager = crud.create_user(db, email="exit.manager@example.com", name="Manager",
+                                   password="pass", role="manager")
+        db.close()
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+        with TestClient(app) as client:
+            assert client.get("/api/v1/employees/", headers=headers).status_code == 200
+    """)
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'exit.db'}")
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", script], cwd=backend, env=env,
+                            capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,172 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud, models
+from app.core.security import create_access_token
+from app.services.email_outbox import EmailOutboxWorker
+from app.utils.email import LogMailer, SMTPMailer, build_message
+from smtp_stub import SMTPStub
+
+client = TestClient(app)
+
+
+def setup_function():
+    # Each test drains the outbox itself; start from an empty one.
+    db = SessionLocal()
+    db.query(models.OutboxEmail).delete()
+    db.commit()
+    db.close()
+
+
+def outbox():
+    db = SessionLocal()
+    rows = db.query(models.OutboxEmail).order_by(models.OutboxEmail.to_email).all()
+    db.close()
+    return rows
+
+
+def worker_for(server, **kwargs):
+    return EmailOutboxWorker(mailer_factory=lambda: SMTPMailer("127.0.0.1", server.port, "user", "pass"),
+                             **kwargs)
+
+
+def test_user_creation_queues_welcome_mail_without_sending():
+    db = SessionLocal()
+    admin = crud.create_user(db, email="outbox.super@example.com", name="Super",
+                             password="pass", role="super-user")
+    db.close()
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.id})}"}
+    for path, email in (("/api/v1/trainers/", "outbox.trainer@example.com"),
+                        ("/api/v1/managers/", "outbox.manager2@example.com")):
+        resp = client.post(path, headers=headers, json={"email": email, "name": "New", "password": "secret"})
+        assert resp.status_code in (200, 201), resp.text
+    resp = client.post("/api/v1/auth/register", json={
+        "email": "outbox.registered@example.com", "name": "Registered", "password": "secret", "role": "employee",
+    })
+    assert resp.status_code == 200, resp.text
+    assert [row.to_email for row in outbox()] == [
+        "outbox.manager2@example.com", "outbox.registered@example.com", "outbox.trainer@example.com"]
+
+    # A user that fails to commit leaves no mail behind.
+    resp = client.post("/api/v1/auth/register", json={
+        "email": "outbox.registered@example.com", "name": "Again", "password": "secret", "role": "employee",
+    })
+    assert resp.status_code == 400 and len(outbox()) == 3
+
+
+def test_worker_sends_batches_over_one_connection():
+    db = SessionLocal()
+    for i in range(7):
+        crud.queue_email(db, f"batch{i}@example.com", f"Subject {i}", f"Body {i}")
+    db.commit()
+    db.close()
+    with SMTPStub() as server:
+        worker = worker_for(server, batch_size=3)
+        assert [worker.drain_once() for _ in range(4)] == [3, 3, 1, 0]
+        worker._close_mailer()
+    assert outbox() == []
+    assert sorted(message["To"] for message in server.messages) == [f"batch{i}@example.com" for i in range(7)]
+    assert server.messages[0].get_payload().strip().startswith("Body")
+    assert server.connections == 1
+
+
+def test_failures_back_off_then_dead_letter():
+    db = SessionLocal()
+    crud.queue_email(db, "flaky@example.com", "Retry", "Temporary failure")
+    crud.queue_email(db, "gone@example.com", "Dead", "Permanent failure")
+    crud.queue_email(db, "fine@example.com", "Sent", "Goes through")
+    db.commit()
+    db.close()
+    with SMTPStub() as server:
+        server.refuse = {"flaky@example.com": (451, "Try later"), "gone@example.com": (550, "No such user")}
+        worker = worker_for(server, max_attempts=3, retry_base_seconds=60, retry_max_seconds=90)
+        assert worker.drain_once() == 3
+        flaky, gone = outbox()
+        assert (gone.status, gone.attempts) == ("dead", 1) and "550" in gone.last_error
+        assert (flaky.status, flaky.attempts) == ("pending", 1)
+        first_retry = flaky.next_attempt_at - datetime.utcnow()
+        assert timedelta(seconds=55) < first_retry <= timedelta(seconds=60)
+
+        assert worker.drain_once() == 0  # not due yet
+        assert worker.drain_once(datetime.utcnow() + timedelta(seconds=61)) == 1
+        flaky = outbox()[0]
+        assert flaky.attempts == 2 and flaky.next_attempt_at - datetime.utcnow() > timedelta(seconds=85)
+        worker.drain_once(datetime.utcnow() + timedelta(seconds=91))
+        assert outbox()[0].status == "dead" and outbox()[0].attempts == 3
+
+        # Requeued dead letters go out once the server accepts them.
+        server.refuse = {}
+        super_user = SessionLocal()
+        admin = crud.create_user(super_user, email="outbox.admin@example.com", name="Admin",
+                                 password="pass", role="super-user")
+        super_user.close()
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.id})}"}
+        assert client.get("/api/v1/admin/email-outbox", headers=headers).json()["dead"] == 2
+        assert client.post("/api/v1/admin/email-outbox/requeue", headers=headers).json() == {"requeued": 2}
+        assert worker.drain_once() == 2
+        worker._close_mailer()
+    assert outbox() == []
+    assert sorted(message["To"] for message in server.messages) == \
+        ["fine@example.com", "flaky@example.com", "gone@example.com"]
+
+
+def test_unreachable_server_is_retried_and_claims_are_exclusive():
+    db = SessionLocal()
+    crud.queue_email(db, "a@example.com", "A", "A")
+    crud.queue_email(db, "b@example.com", "B", "B")
+    db.commit()
+    db.close()
+    with SMTPStub() as server:
+        port = server.port
+    # Nothing listens on the port any more.
+    worker = EmailOutboxWorker(mailer_factory=lambda: SMTPMailer("127.0.0.1", port, timeout=1))
+    assert worker.drain_once() == 2
+    assert [(row.status, row.attempts) for row in outbox()] == [("pending", 1), ("pending", 1)]
+
+    later = datetime.utcnow() + timedelta(hours=1)
+    db = SessionLocal()
+    first = crud.claim_outbox_emails(db, later, later + timedelta(minutes=5), "first", 10)
+    second = crud.claim_outbox_emails(db, later, later + timedelta(minutes=5), "second", 10)
+    assert len(first) == 2 and second == []
+    db.close()
+
+
+def test_commit_wakes_the_running_worker():
+    with SMTPStub() as server:
+        worker = worker_for(server, poll_seconds=60)
+        import app.services.email_outbox as email_outbox
+        original, email_outbox.email_outbox_worker = email_outbox.email_outbox_worker, worker
+        worker.start()
+        try:
+            db = SessionLocal()
+            crud.queue_email(db, "woken@example.com", "Now", "Not in a minute")
+            db.commit()
+            db.close()
+            deadline = time.monotonic() + 5
+            while not server.messages and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            worker.stop(5)
+            email_outbox.email_outbox_worker = original
+    assert [message["To"] for message in server.messages] == ["woken@example.com"]
+    # The worker hangs up once the outbox is empty.
+    assert server.connections == 1
+
+
+def test_mailer_reopens_a_dropped_connection():
+    with SMTPStub() as server:
+        mailer = SMTPMailer("127.0.0.1", server.port)
+        mailer.send(build_message("x@example.com", "First", "first"))
+        mailer._smtp.close()  # as if the server had hung up on an idle connection
+        mailer.send(build_message("x@example.com", "Second", "second"))
+        mailer.close()
+    assert len(server.messages) == 2 and server.connections == 2
+
+
+def test_log_mailer_logs_instead_of_sending(caplog):
+    with caplog.at_level(logging.INFO, logger="app.utils.email"):
+        LogMailer().send(build_message("nobody@example.com", "Hello", "body"))
+    assert caplog.messages == ["No SMTP server configured; not sending email to nobody@example.com: Hello"]
@@ -0,0 +1,61 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, trainer, skill
+    db = SessionLocal()
+    manager = crud.create_user(db, email="batch.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="batch.trainer@example.com", name="Trainer",
+                               password="pass", role="trainer").id
+    skill = crud.create_skill(db, name="Batch Skill", category="Batch").id
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    db.close()
+
+
+def add_department(name, employees, scores_each):
+    db = SessionLocal()
+    for i in range(employees):
+        employee = crud.create_user(db, email=f"{name.lower()}{i}@example.com", name=f"{name} {i}",
+                                    password="pass", role="employee", department=name)
+        for value in range(scores_each):
+            crud.create_score(db, employee.id, skill, float(value), trainer)
+    db.close()
+
+
+def fetch(count_queries, **params):
+    with count_queries() as statements:
+        resp = client.get("/api/v1/employees/with-scores", params=params, headers=headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json(), len(statements)
+
+
+def test_query_count_is_independent_of_employee_count(count_queries):
+    add_department("Small", 2, 3)
+    add_department("Large", 20, 3)
+    fetch(count_queries, department="Small")  # warm the authenticated-user cache
+
+    small, small_queries = fetch(count_queries, department="Small")
+    large, large_queries = fetch(count_queries, department="Large")
+    assert len(small) == 2 and len(large) == 20
+    assert all(len(employee["scores"]) == 3 for employee in large)
+    assert small_queries == large_queries == 2
+
+    small, small_queries = fetch(count_queries, department="Small", latest=2)
+    large, large_queries = fetch(count_queries, department="Large", latest=2)
+    assert all(len(employee["scores"]) == 2 for employee in large)
+    assert small_queries == large_queries
+
+
+def test_latest_scores_are_newest_first_and_ids_filter(count_queries):
+    employees, _ = fetch(count_queries, department="Small")
+    first = employees[0]
+    chosen, _ = fetch(count_queries, ids=[first["id"]], latest=1)
+    assert [e["id"] for e in chosen] == [first["id"]]
+    assert chosen[0]["scores"] == first["scores"][:1]
@@ -0,0 +1,92 @@
+import csv
+import gzip
+import io
+import json
+import httpx
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud, models
+from app.core.security import create_access_token
+from app.services.export_service import ExportService
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, employee_id
+    db = SessionLocal()
+    manager = crud.create_user(db, email="export.manager@example.com", name="Export Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="export.trainer@example.com", name="Export Trainer",
+                               password="pass", role="trainer")
+    employee = crud.create_user(db, email="export.employee@example.com", name="Export, \"Quoted\"",
+                                password="pass", role="employee")
+    skill = crud.create_skill(db, name="Export Skill", category="Export")
+    for i in range(25):
+        crud.create_score(db, employee.id, skill.id, float(i), trainer.id)
+    crud.create_learning_path(db, "Export path", employee.id, manager.id)
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    employee_id = employee.id
+    db.close()
+
+
+def test_scores_export_as_ndjson():
+    resp = client.get("/api/v1/exports/scores", params={"employee_id": employee_id}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert resp.headers["content-disposition"] == 'attachment; filename="scores.ndjson"'
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(row["score"] for row in rows) == [float(i) for i in range(25)]
+    assert {(row["skill_name"], row["trainer_name"], row["employee_name"]) for row in rows} == \
+        {("Export Skill", "Export Trainer", 'Export, "Quoted"')}
+    dates = [(row["date"], row["id"]) for row in rows]
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_users_export_as_csv():
+    resp = client.get("/api/v1/exports/users", params={"format": "csv", "role": "employee"}, headers=headers)
+    assert resp.headers["content-type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert all(row["role"] == "employee" for row in rows)
+    exported = next(row for row in rows if row["id"] == employee_id)
+    assert exported["name"] == 'Export, "Quoted"' and "hashed_password" not in exported
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+
+def test_learning_paths_export_and_empty_csv():
+    resp = client.get("/api/v1/exports/learning-paths", params={"employee_id": employee_id}, headers=headers)
+    (path,) = [json.loads(line) for line in resp.text.splitlines()]
+    assert (path["title"], path["employee_name"], path["assigned_by_name"]) == \
+        ("Export path", 'Export, "Quoted"', "Export Manager")
+
+    resp = client.get("/api/v1/exports/learning-paths", params={"employee_id": "nobody", "format": "csv"},
+                      headers=headers)
+    assert resp.text.splitlines() == [
+        "id,title,employee_id,assigned_by,assigned_date,created_at,updated_at,employee_name,assigned_by_name"]
+
+
+def test_gzip_is_applied_while_streaming():
+    with httpx.Client(transport=client._transport, base_url="http://testserver") as raw:
+        with raw.stream("GET", "/api/v1/exports/scores", params={"employee_id": employee_id},
+                        headers={**headers, "Accept-Encoding": "gzip"}) as resp:
+            assert resp.headers["content-encoding"] == "gzip"
+            body = b"".join(resp.iter_raw())
+    assert len(gzip.decompress(body).splitlines()) == 25
+
+
+def test_batches_are_read_lazily():
+    db = SessionLocal()
+    batches = ExportService(db, batch_size=10).score_batches(employee_id=employee_id)
+    assert len(next(batches)) == 10
+    assert [len(batch) for batch in batches] == [10, 5]
+    db.close()
+
+
+def test_exports_are_for_managers():
+    db = SessionLocal()
+    employee = db.get(models.User, employee_id)
+    token = create_access_token(data={"sub": employee.id})
+    db.close()
+    resp = client.get("/api/v1/exports/users", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 403
@@ -0,0 +1,130 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def auth(user_id):
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': user_id})}"}
+
+
+def setup_module():
+    global ids, headers
+    db = SessionLocal()
+    users = {}
+    for key, role in (("manager", "manager"), ("other_manager", "manager"), ("alice", "employee"),
+                      ("bob", "employee"), ("carol", "employee")):
+        users[key] = crud.create_user(db, email=f"paths.{key}@example.com", name=f"Paths {key.title()}",
+                                      password="pass", role=role).id
+    # A path assigned by someone else, which the team view must leave out.
+    other_path = crud.create_learning_path(db, "Someone else's", users["alice"], users["other_manager"]).id
+    crud.create_learning_step(db, other_path, "Step", "course")
+    db.close()
+    ids = users
+    headers = {key: auth(user_id) for key, user_id in users.items()}
+
+
+def create(employee, title, steps):
+    resp = client.post("/api/v1/learning-paths/", headers=headers["manager"], json={
+        "title": title, "employee_id": ids[employee],
+        "steps": [{"title": step, "skill_type": "course"} for step in steps],
+    })
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+def complete(path, step, done=True, as_user=None):
+    return client.put(f"/api/v1/learning-paths/{path['id']}/steps/{step['id']}",
+                      json={"completed": done}, headers=as_user or headers[path_owner(path)])
+
+
+def path_owner(path):
+    return next(key for key, user_id in ids.items() if user_id == path["employee_id"])
+
+
+def test_paths_report_progress_and_completion_keeps_it_correct():
+    path = create("alice", "Backend basics", ["SQL", "HTTP", "Testing", "Deployment"])
+    assert [step["title"] for step in path["steps"]] == ["SQL", "HTTP", "Testing", "Deployment"]
+    assert [step["position"] for step in path["steps"]] == [0, 1, 2, 3]
+    assert (path["step_count"], path["completed_steps"], path["percent_complete"]) == (4, 0, 0)
+    assert path["employee_name"] == "Paths Alice"
+
+    first, second = path["steps"][:2]
+    resp = complete(path, first)
+    assert resp.status_code == 200
+    assert (resp.json()["completed_steps"], resp.json()["percent_complete"]) == (1, 25.0)
+    assert resp.json()["steps"][0]["completed_date"] is not None
+    # Repeating a completion does not count it twice.
+    assert complete(path, first).json()["completed_steps"] == 1
+    assert complete(path, second).json()["percent_complete"] == 50.0
+    undone = complete(path, first, done=False).json()
+    assert (undone["completed_steps"], undone["steps"][0]["completed_date"]) == (1, None)
+
+    mine = client.get("/api/v1/learning-paths/me", headers=headers["alice"]).json()
+    assert {p["id"]: (p["step_count"], p["completed_steps"]) for p in mine}[path["id"]] == (4, 1)
+    assert len(mine) == 2  # and the path from the other manager
+
+    # The new path was announced to Alice.
+    feed = client.get("/api/v1/notifications/", headers=headers["alice"]).json()
+    assert any(n["type"] == "learning_path" and "Backend basics" in n["message"] for n in feed)
+
+
+def test_finishing_a_path_notifies_the_manager():
+    path = create("bob", "Short path", ["Only step"])
+    done = complete(path, path["steps"][0]).json()
+    assert (done["completed_steps"], done["percent_complete"]) == (1, 100.0)
+    feed = client.get("/api/v1/notifications/", headers=headers["manager"]).json()
+    assert any(n["title"] == "Learning path completed" and "Short path" in n["message"] for n in feed)
+
+
+def test_team_progress_rolls_up_the_managers_paths_per_employee():
+    first = create("carol", "Carol one", ["A", "B"])
+    create("carol", "Carol two", ["C", "D", "E", "F"])
+    create("carol", "Carol empty", [])
+    for step in first["steps"]:
+        complete(first, step)
+
+    resp = client.get("/api/v1/learning-paths/team", headers=headers["manager"])
+    assert resp.status_code == 200
+    team = {row["employee_id"]: row for row in resp.json()}
+    carol = team[ids["carol"]]
+    assert carol == {"employee_id": ids["carol"], "employee_name": "Paths Carol", "path_count": 3,
+                     "completed_paths": 1, "step_count": 6, "completed_steps": 2,
+                     "percent_complete": 33.3}
+    # Only this manager's paths: Alice's path from the other manager is left out.
+    alice_paths = client.get("/api/v1/learning-paths/assigned", params={"employee_id": ids["alice"]},
+                             headers=headers["manager"]).json()
+    assert team[ids["alice"]]["path_count"] == len(alice_paths)
+
+    # Pages by employee id.
+    rows, cursor = [], None
+    while True:
+        resp = client.get("/api/v1/learning-paths/team", params={"limit": 1, **({"cursor": cursor} if cursor else {})},
+                          headers=headers["manager"])
+        rows += resp.json()
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert rows == sorted(team.values(), key=lambda row: row["employee_id"])
+
+
+def test_access_rules():
+    path = create("alice", "Private path", ["Step"])
+    step = path["steps"][0]
+    # Another employee can neither see nor complete it; managers can do both.
+    assert client.get(f"/api/v1/learning-paths/{path['id']}", headers=headers["bob"]).status_code == 404
+    assert complete(path, step, as_user=headers["bob"]).status_code == 404
+    assert client.get(f"/api/v1/learning-paths/{path['id']}", headers=headers["other_manager"]).status_code == 200
+    assert complete(path, step, as_user=headers["other_manager"]).status_code == 200
+    assert client.get("/api/v1/learning-paths/team", headers=headers["alice"]).status_code == 403
+    # Unknown steps, employees and cursors.
+    assert client.put(f"/api/v1/learning-paths/{path['id']}/steps/nope", json={"completed": True},
+                      headers=headers["alice"]).status_code == 404
+    resp = client.post("/api/v1/learning-paths/", headers=headers["manager"],
+                       json={"title": "Nobody's", "employee_id": ids["manager"], "steps": []})
+    assert resp.status_code == 404
+    assert client.get("/api/v1/learning-paths/me", params={"cursor": "bad"},
+                      headers=headers["alice"]).status_code == 400
@@ -30,7 +30,7 @@ def login(email: str, password: str):
     return resp.json()["access_token"]
 
 
-def test_manager_crud_flow():
+def test_manager_crud_flow(query_budget):
     db = next(get_db())
     super_user = create_super_user(db)
     token = login("admin@example.com", "adminpass")
@@ -49,13 +49,15 @@ def test_manager_crud_flow():
     manager_id = manager["id"]
 
     # List managers
-    resp = client.get("/api/v1/managers/", headers=get_auth_headers(token))
+    with query_budget(1, "GET /api/v1/managers/"):
+        resp = client.get("/api/v1/managers/", headers=get_auth_headers(token))
     assert resp.status_code == 200
     managers = resp.json()
     assert any(m["id"] == manager_id for m in managers)
 
     # Get single manager
-    resp = client.get(f"/api/v1/managers/{manager_id}", headers=get_auth_headers(token))
+    with query_budget(1, "GET /api/v1/managers/{manager_id}"):
+        resp = client.get(f"/api/v1/managers/{manager_id}", headers=get_auth_headers(token))
     assert resp.status_code == 200
     assert resp.json()["email"] == "manager1@example.com"
 
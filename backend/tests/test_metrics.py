@@ -0,0 +1,102 @@
+import logging
+import re
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.metrics import Histogram, metrics
+from app.core.security import create_access_token
+from app.utils.password import password_hasher
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, employee_id
+    db = SessionLocal()
+    manager = crud.create_user(db, email="metrics.manager@example.com", name="Metrics Manager",
+                               password="pass", role="manager")
+    employee = crud.create_user(db, email="metrics.employee@example.com", name="Metrics Employee",
+                                password="pass", role="employee")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    employee_id = employee.id
+    db.close()
+
+
+def sample(text, name, **labels):
+    """The value of one series in a /metrics body, or None."""
+    series = name + ("{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}" if labels else "")
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_histogram_buckets_are_upper_inclusive():
+    histogram = Histogram((1, 5))
+    for value in (0.5, 1, 3, 5, 9):
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 1] and histogram.count == 5 and histogram.sum == 18.5
+
+
+def test_requests_are_counted_per_route_template_with_their_sql():
+    route = "/api/v1/employees/{employee_id}"
+    client.get(f"/api/v1/employees/{employee_id}", headers=headers)  # caches the manager for auth
+    before = client.get("/metrics").text
+    for _ in range(3):
+        assert client.get(f"/api/v1/employees/{employee_id}", headers=headers).status_code == 200
+    assert client.get("/api/v1/employees/missing", headers=headers).status_code == 404
+    assert client.get("/no/such/path").status_code == 404
+    text = client.get("/metrics").text
+    assert client.get("/metrics").headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    def grew(name, **labels):
+        return (sample(text, name, **labels) or 0) - (sample(before, name, **labels) or 0)
+
+    assert grew("http_requests_total", method="GET", route=route, status="200") == 3
+    assert grew("http_requests_total", method="GET", route=route, status="404") == 1
+    assert grew("http_requests_total", method="GET", route="unmatched", status="404") == 1
+    assert grew("http_request_duration_seconds_count", method="GET", route=route) == 4
+    assert grew("http_request_duration_seconds_bucket", method="GET", route=route, le="+Inf") == 4
+    # The employee lookup is a single SELECT; the user cache serves auth.
+    assert grew("db_statements_per_request_sum", route=route) == 4
+    assert grew("db_seconds_per_request_sum", route=route) > 0
+    assert sample(text, "http_requests_in_flight") == 1  # the scrape itself
+
+
+def test_async_routes_count_their_sql():
+    route = "/api/v1/scores/"
+    before = sample(client.get("/metrics").text, "db_statements_per_request_count", route=route) or 0
+    assert client.get("/api/v1/scores/", headers=headers).status_code == 200
+    text = client.get("/metrics").text
+    assert sample(text, "db_statements_per_request_count", route=route) == before + 1
+    assert sample(text, "db_statements_per_request_sum", route=route) >= 1
+
+
+def test_slow_queries_are_logged_with_their_route(caplog, monkeypatch):
+    monkeypatch.setattr(metrics, "slow_query_seconds", 0.0)
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        client.get(f"/api/v1/employees/{employee_id}", headers=headers)
+    (record,) = [r for r in caplog.records if r.name == "app.sql"]
+    assert "on /api/v1/employees/{employee_id}: SELECT" in record.getMessage()
+    assert sample(client.get("/metrics").text, "db_slow_queries_total", route="/api/v1/employees/{employee_id}") >= 1
+
+
+def test_password_hasher_queue_is_exported():
+    before = client.get("/metrics").text
+    password_hasher.hash("metrics-password")
+    text = client.get("/metrics").text
+    assert "# TYPE password_hash_queue_depth gauge" in text
+    assert sample(text, "password_hash_queue_depth") == 0
+    assert sample(text, "password_hash_submitted_total") == sample(before, "password_hash_submitted_total") + 1
+    assert sample(text, "password_hash_completed_total") == sample(before, "password_hash_completed_total") + 1
+    assert sample(text, "password_hash_max_queue_depth") >= 1
+
+
+def test_user_cache_counters_are_exported():
+    client.get("/api/v1/auth/me", headers=headers)
+    before = client.get("/metrics").text
+    client.get("/api/v1/auth/me", headers=headers)  # served from the cache
+    text = client.get("/metrics").text
+    assert "# TYPE user_cache_hits_total counter" in text
+    assert sample(text, "user_cache_hits_total") == sample(before, "user_cache_hits_total") + 1
+    assert sample(text, "user_cache_misses_total") == sample(before, "user_cache_misses_total")
+    assert sample(text, "user_cache_size") >= 1
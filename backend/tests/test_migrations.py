@@ -0,0 +1,99 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from app.db import migrations, models
+from app.db.base import engine
+from app.db.engine import create_db_engine
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    new_engine = create_db_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield new_engine
+    new_engine.dispose()
+
+
+def test_migrated_schema_matches_the_models():
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"include_name": migrations.include_name})
+        diffs = compare_metadata(context, models.Base.metadata)
+    assert diffs == []
+    assert migrations.current_revision(engine) == migrations.head_revision()
+
+
+def test_check_schema_refuses_an_unmigrated_database(fresh_engine):
+    with pytest.raises(migrations.SchemaOutOfDate):
+        migrations.check_schema(fresh_engine)
+    migrations.upgrade(fresh_engine)
+    migrations.check_schema(fresh_engine)
+
+
+def test_pre_migration_database_is_stamped_and_upgraded(fresh_engine):
+    # What create_all produced before the chain: baseline tables, no
+    # alembic_version and none of the later indexes.
+    migrations.upgrade(fresh_engine, migrations.BASELINE_REVISION)
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE alembic_version")
+
+    migrations.upgrade(fresh_engine)
+    assert migrations.current_revision(fresh_engine) == migrations.head_revision()
+    inspector = inspect(fresh_engine)
+    assert inspector.has_table("skill_matrix")
+    score_indexes = {index["name"] for index in inspector.get_indexes("scores")}
+    assert {"ix_scores_date_id", "ix_scores_employee_date_id"} <= score_indexes
+
+
+def test_upgrade_rebuilds_a_stale_skill_matrix(fresh_engine):
+    # A database upgraded with create_all: scores from before the matrix
+    # existed, plus a cell that only counted the one score written since.
+    migrations.upgrade(fresh_engine, "0004")
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, email, name, hashed_password, role) VALUES "
+            "('e', 'stale.e@example.com', 'E', 'x', 'employee'), ('t', 'stale.t@example.com', 'T', 'x', 'trainer')")
+        conn.exec_driver_sql("INSERT INTO skills (id, name, category) VALUES ('s', 'Stale', 'Stale')")
+        conn.exec_driver_sql(
+            "INSERT INTO scores (id, employee_id, skill_id, score, date, trainer_id) VALUES "
+            "('a', 'e', 's', 90, '2024-01-01 00:00:00', 't'), ('b', 'e', 's', 60, '2024-02-01 00:00:00', 't')")
+        conn.exec_driver_sql(
+            "INSERT INTO skill_matrix VALUES ('e', 's', 'b', 60, '2024-02-01 00:00:00', 60, 1, 60, 3600)")
+
+    migrations.upgrade(fresh_engine)
+    with fresh_engine.connect() as conn:
+        row = conn.exec_driver_sql(
+            "SELECT latest_score_id, best_score, attempt_count, score_sum FROM skill_matrix").one()
+    assert tuple(row) == ("b", 90, 2, 150)
+
+
+def test_upgrade_numbers_existing_learning_steps_in_creation_order(fresh_engine):
+    migrations.upgrade(fresh_engine, "0008")
+    with fresh_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (id, email, name, hashed_password, role) VALUES "
+            "('e', 'steps.e@example.com', 'E', 'x', 'employee'), ('m', 'steps.m@example.com', 'M', 'x', 'manager')")
+        conn.exec_driver_sql(
+            "INSERT INTO learning_paths (id, title, employee_id, assigned_by) VALUES ('p', 'P', 'e', 'm')")
+        conn.exec_driver_sql(
+            "INSERT INTO learning_steps (id, learning_path_id, title, skill_type, created_at) VALUES "
+            "('z', 'p', 'First', 'course', '2024-01-01 00:00:00'), "
+            "('b', 'p', 'Third', 'course', '2024-01-02 00:00:00'), "
+            "('a', 'p', 'Second', 'course', '2024-01-01 00:00:00')")
+
+    migrations.upgrade(fresh_engine)
+    with fresh_engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT id, position FROM learning_steps ORDER BY position").all()
+    assert [tuple(row) for row in rows] == [("a", 0), ("z", 1), ("b", 2)]
+
+
+def test_downgrade_to_base_and_back(fresh_engine):
+    migrations.upgrade(fresh_engine)
+    migrations.upgrade(fresh_engine)  # already at head: no-op
+    config = migrations.alembic_config()
+    with fresh_engine.begin() as conn:
+        config.attributes["connection"] = conn
+        command.downgrade(config, "base")
+    assert not inspect(fresh_engine).has_table("users")
+    migrations.upgrade(fresh_engine)
+    assert inspect(fresh_engine).has_table("users")
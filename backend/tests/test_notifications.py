@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+from app.api.routes.notifications import notification_events
+from app.schemas.notification import UnreadCount
+from app.services.notification_broker import RESYNC, NotificationBroker, notification_broker
+from app.services.notification_service import NotificationService
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, user_id, other_headers
+    db = SessionLocal()
+    user = crud.create_user(db, email="notify.user@example.com", name="Notify User",
+                            password="pass", role="employee")
+    other = crud.create_user(db, email="notify.other@example.com", name="Notify Other",
+                             password="pass", role="employee")
+    for i in range(7):
+        crud.create_notification(db, user.id, "info", f"Title {i}", f"Message {i}")
+    crud.create_notification(db, other.id, "info", "Not yours", "Other user's")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': user.id})}"}
+    other_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': other.id})}"}
+    user_id = user.id
+    db.close()
+
+
+def unread(request_headers=None):
+    resp = client.get("/api/v1/notifications/unread-count", headers=request_headers or headers)
+    assert resp.status_code == 200
+    return resp.json()["unread"]
+
+
+def test_feed_pages_newest_first_and_counter_tracks_marks():
+    pages, cursor = [], None
+    while True:
+        resp = client.get("/api/v1/notifications/", params={"limit": 3, **({"cursor": cursor} if cursor else {})},
+                          headers=headers)
+        assert resp.status_code == 200
+        pages.append(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    feed = [item for page in pages for item in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert {item["user_id"] for item in feed} == {user_id}
+    keys = [(item["date"], item["id"]) for item in feed]
+    assert keys == sorted(keys, reverse=True)
+    assert unread() == 7
+
+    # Everything from the fourth newest down: four marked, three left.
+    resp = client.post("/api/v1/notifications/read", json={"up_to_id": feed[3]["id"]}, headers=headers)
+    assert resp.json() == {"marked": 4, "unread": 3}
+    unread_feed = client.get("/api/v1/notifications/", params={"unread_only": True}, headers=headers).json()
+    assert [item["id"] for item in unread_feed] == [item["id"] for item in feed[:3]]
+
+    resp = client.put(f"/api/v1/notifications/{feed[0]['id']}/read", headers=headers)
+    assert resp.status_code == 200 and resp.json()["read"] is True
+    # Marking it again does not count twice.
+    client.put(f"/api/v1/notifications/{feed[0]['id']}/read", headers=headers)
+    assert unread() == 2
+
+    assert client.post("/api/v1/notifications/read", json={}, headers=headers).json() == {"marked": 2, "unread": 0}
+    db = SessionLocal()
+    assert crud.get_unread_count(db, user_id) == sum(not n.read for n in crud.get_notifications_by_user(db, user_id))
+    db.close()
+
+
+def test_other_users_notifications_are_not_found():
+    mine = client.get("/api/v1/notifications/", headers=headers).json()[0]["id"]
+    assert client.put(f"/api/v1/notifications/{mine}/read", headers=other_headers).status_code == 404
+    resp = client.post("/api/v1/notifications/read", json={"up_to_id": mine}, headers=other_headers)
+    assert resp.status_code == 404
+    assert unread(other_headers) == 1
+
+
+def test_broker_delivers_across_threads_and_resyncs_on_overflow():
+    broker = NotificationBroker(max_queued=3)
+
+    async def scenario():
+        subscription = broker.subscribe("u1")
+        publisher = threading.Thread(target=broker.publish, args=("u1", "unread", '{"unread": 1}'))
+        publisher.start()
+        publisher.join()
+        assert await subscription.get(1) == ("unread", '{"unread": 1}')
+        assert await subscription.get(0.01) is None
+
+        for i in range(5):
+            broker.publish("u1", "unread", f'{{"unread": {i}}}')
+        await asyncio.sleep(0)
+        assert await subscription.get(1) == RESYNC
+        # Only what arrived after the overflow is left.
+        remaining = []
+        while (event := await subscription.get(0.01)) is not None:
+            remaining.append(event)
+        assert RESYNC not in remaining and len(remaining) < 3
+
+        assert broker.publish("u2", "unread", "{}") == 0
+        broker.close()
+        try:
+            await subscription.get(1)
+        except EOFError:
+            pass
+        else:
+            raise AssertionError("closed subscription kept going")
+        assert broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_event_stream_sends_count_then_published_events():
+    async def scenario():
+        subscription = notification_broker.subscribe(user_id)
+        events = notification_events(subscription, UnreadCount(unread=0), heartbeat=0.01)
+        assert await anext(events) == b'event: unread\ndata: {"unread":0}\n\n'
+        assert await anext(events) == b": keep-alive\n\n"
+
+        # A write from a worker thread reaches the open stream.
+        def write():
+            db = SessionLocal()
+            NotificationService(db).create_notification(user_id, "info", "Live", "Streamed")
+            db.close()
+        await asyncio.get_running_loop().run_in_executor(None, write)
+        frames = [await anext(events), await anext(events)]
+        assert frames[0].startswith(b"event: notification\ndata: ")
+        assert json.loads(frames[0].split(b"data: ", 1)[1])["title"] == "Live"
+        assert frames[1] == b'event: unread\ndata: {"unread":1}\n\n'
+
+        await events.aclose()
+        assert notification_broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
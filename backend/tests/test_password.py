@@ -0,0 +1,48 @@
+import asyncio
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.utils.password import PasswordHasher, password_hasher
+
+client = TestClient(app)
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(workers=2, rounds=4)
+    try:
+        hashed = hasher.hash("secret")
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("secret", hashed)
+        assert not hasher.verify("wrong", hashed)
+        assert asyncio.run(hasher.averify_and_update("secret", hashed)) == (True, None)
+
+        stats = hasher.stats()
+        assert stats["submitted"] == stats["completed"] == 4
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] >= 1
+    finally:
+        hasher.shutdown()
+
+
+def test_login_rehashes_when_cost_changes():
+    db = SessionLocal()
+    user = crud.create_user(db, email="rehash@example.com", name="Rehash",
+                            password="rehashpass", role="employee")
+    assert user.hashed_password.startswith("$2b$04$")
+
+    password_hasher.rounds = 5
+    try:
+        resp = client.post("/api/v1/auth/login",
+                           json={"email": "rehash@example.com", "password": "rehashpass"})
+        assert resp.status_code == 200, resp.text
+        db.expire_all()
+        assert crud.get_user(db, user.id).hashed_password.startswith("$2b$05$")
+
+        resp = client.post("/api/v1/auth/login",
+                           json={"email": "rehash@example.com", "password": "wrong"})
+        assert resp.status_code == 401
+    finally:
+        password_hasher.rounds = 4
+        crud.delete_user(db, user.id)
+        db.close()
@@ -0,0 +1,126 @@
+"""
+Every read route declares how many SQL statements one request may issue.
+Each route is measured at two dataset sizes: a count over budget, or one
+that grows with the data (an N+1), fails with the statements listed.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+# (caller role, path, query params, budget). Paths are filled from the
+# seeded ids. Authentication is served by the user cache, which each caller
+# warms before measuring.
+ROUTES = [
+    ("employee", "/api/v1/auth/me", {}, 0),
+    ("manager", "/api/v1/employees/", {}, 1),
+    ("manager", "/api/v1/employees/with-scores", {"department": "Budget"}, 2),
+    ("manager", "/api/v1/employees/with-scores", {"department": "Budget", "latest": 2}, 2),
+    ("manager", "/api/v1/employees/{employee_id}", {}, 1),
+    ("manager", "/api/v1/employees/{employee_id}/with-scores", {}, 2),
+    ("employee", "/api/v1/employees/me/profile", {}, 1),
+    ("manager", "/api/v1/trainers/", {}, 1),
+    ("manager", "/api/v1/trainers/{trainer_id}", {}, 1),
+    ("trainer", "/api/v1/trainers/me/profile", {}, 1),
+    ("trainer", "/api/v1/trainers/me/activity", {}, 1),
+    ("manager", "/api/v1/skills/", {}, 0),
+    ("manager", "/api/v1/skills/search", {"q": "budget"}, 2),
+    ("manager", "/api/v1/skills/category/{category}", {}, 0),
+    ("manager", "/api/v1/skills/{skill_id}", {}, 0),
+    ("manager", "/api/v1/scores/", {}, 1),
+    ("manager", "/api/v1/scores/details", {}, 1),
+    ("manager", "/api/v1/scores/aggregate", {"group_by": ["skill"]}, 1),
+    ("manager", "/api/v1/scores/matrix", {}, 1),
+    ("manager", "/api/v1/scores/employee/{employee_id}", {}, 1),
+    ("manager", "/api/v1/scores/{score_id}", {}, 1),
+    ("manager", "/api/v1/scores/{score_id}/details", {}, 1),
+    ("manager", "/api/v1/scores/employee/{employee_id}/average", {}, 1),
+    ("super-user", "/api/v1/managers/", {}, 1),
+    ("super-user", "/api/v1/managers/{manager_id}", {}, 1),
+    ("manager", "/api/v1/exports/scores", {}, 1),
+    ("manager", "/api/v1/exports/users", {}, 1),
+    ("manager", "/api/v1/exports/learning-paths", {}, 1),
+    ("employee", "/api/v1/notifications/", {}, 1),
+    ("employee", "/api/v1/notifications/unread-count", {}, 1),
+    ("employee", "/api/v1/learning-paths/me", {}, 1),
+    ("manager", "/api/v1/learning-paths/assigned", {}, 1),
+    ("manager", "/api/v1/learning-paths/team", {}, 1),
+    ("manager", "/api/v1/learning-paths/employee/{employee_id}", {}, 1),
+    ("employee", "/api/v1/learning-paths/{path_id}", {}, 2),
+]
+
+
+def route_id(route):
+    role, path, params, _ = route
+    return f"{path}?{'&'.join(params)}" if params else path
+
+
+def grow(ids, count):
+    """Add ``count`` more of everything the routes list: people, skills, scores, paths, notifications."""
+    db = SessionLocal()
+    start = len(ids["extra"])
+    for i in range(start, start + count):
+        employee_id = crud.create_user(db, email=f"budget.employee{i}@example.com", name=f"Budget {i}",
+                                       password="pass", role="employee", department="Budget").id
+        crud.create_user(db, email=f"budget.trainer{i}@example.com", name=f"Trainer {i}",
+                         password="pass", role="trainer")
+        crud.create_user(db, email=f"budget.manager{i}@example.com", name=f"Manager {i}",
+                         password="pass", role="manager")
+        skill_id = crud.create_skill(db, name=f"Budget skill {i}", category="Budget").id
+        for target in (employee_id, ids["employee_id"]):
+            crud.create_score(db, target, skill_id, float(i % 100), ids["trainer_id"])
+        crud.create_score(db, employee_id, ids["skill_id"], 50.0, ids["trainer_id"])
+        path_id = crud.create_learning_path(db, f"Budget path {i}", ids["employee_id"], ids["manager_id"]).id
+        crud.create_learning_step(db, path_id, "Step", "course")
+        crud.create_learning_step(db, ids["path_id"], f"Step {i}", "course")
+        crud.create_notification(db, ids["employee_id"], "info", f"Budget {i}", "Message")
+        ids["extra"].append(employee_id)
+    db.close()
+
+
+def measure(count_queries, ids, headers):
+    counts = {}
+    for route in ROUTES:
+        role, path, params, _ = route
+        url = path.format(**ids)
+        client.get(url, params=params, headers=headers[role])  # warm caches
+        with count_queries() as statements:
+            resp = client.get(url, params=params, headers=headers[role])
+        assert resp.status_code == 200, (url, resp.text)
+        counts[route_id(route)] = statements
+    return counts
+
+
+@pytest.fixture(scope="module")
+def measured(count_queries):
+    db = SessionLocal()
+    users = {role: crud.create_user(db, email=f"budget.{role}@example.com", name=role.title(),
+                                    password="pass", role=role, department="Budget").id
+             for role in ("employee", "trainer", "manager", "super-user")}
+    skill_id = crud.create_skill(db, name="Budget skill", category="Budget").id
+    score_id = crud.create_score(db, users["employee"], skill_id, 75.0, users["trainer"]).id
+    path_id = crud.create_learning_path(db, "Budget path", users["employee"], users["manager"]).id
+    db.close()
+    ids = {"employee_id": users["employee"], "trainer_id": users["trainer"], "manager_id": users["manager"],
+           "skill_id": skill_id, "score_id": score_id, "category": "Budget", "path_id": path_id, "extra": []}
+    headers = {role: {"Authorization": f"Bearer {create_access_token(data={'sub': user_id})}"}
+               for role, user_id in users.items()}
+    grow(ids, 2)
+    small = measure(count_queries, ids, headers)
+    grow(ids, 18)
+    large = measure(count_queries, ids, headers)
+    return small, large
+
+
+@pytest.mark.parametrize("route", ROUTES, ids=[route_id(route) for route in ROUTES])
+def test_route_stays_within_query_budget(measured, route):
+    small, large = (counts[route_id(route)] for counts in measured)
+    large.check(route[3], f"GET {route_id(route)}")
+    if len(small) != len(large):
+        pytest.fail(f"GET {route_id(route)} issued {len(small)} statements with 2 rows per table and "
+                    f"{len(large)} with 20:\n{large.format()}", pytrace=False)
@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import event
+from app.db.base import SessionLocal, engine
+from app.db import crud
+
+# SEARCH steps use an index or the primary key; SCAN steps read a whole table
+# (or a whole index) and are what these tests rule out for point lookups.
+
+
+def query_plans(call):
+    """Run ``call`` and return the EXPLAIN QUERY PLAN details of each SELECT it issued."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plans.append([row[-1] for row in rows])
+    return plans
+
+
+def assert_searches(plans, *tables, sorted_by_index=False):
+    assert plans, "no SELECT was issued"
+    details = [detail for plan in plans for detail in plan]
+    for table in tables:
+        steps = [d for d in details if d.split(" ")[1:2] == [table]]
+        assert steps, f"{table} not read: {details}"
+        for step in steps:
+            assert step.startswith("SEARCH") and ("INDEX" in step or "PRIMARY KEY" in step), details
+    if sorted_by_index:
+        assert not any("TEMP B-TREE" in d for d in details), details
+
+
+@pytest.fixture(scope="module")
+def db():
+    session = SessionLocal()
+    manager = crud.create_user(session, email="plans.manager@example.com", name="M",
+                               password="pass", role="manager")
+    trainer = crud.create_user(session, email="plans.trainer@example.com", name="T",
+                               password="pass", role="trainer")
+    employee = crud.create_user(session, email="plans.employee@example.com", name="E",
+                                password="pass", role="employee")
+    skill = crud.create_skill(session, name="Plans Skill", category="Plans")
+    crud.create_score(session, employee.id, skill.id, 80, trainer.id)
+    path = crud.create_learning_path(session, "Plans path", employee.id, manager.id)
+    crud.create_learning_step(session, path.id, "Step", "course")
+    crud.create_notification(session, employee.id, "feedback", "Title", "Message")
+    session.ids = {"manager": manager.id, "trainer": trainer.id, "employee": employee.id,
+                   "skill": skill.id, "path": path.id}
+    yield session
+    session.close()
+
+
+def test_user_lookups_use_indexes(db):
+    assert_searches(query_plans(lambda: crud.get_user(db, db.ids["employee"])), "users")
+    assert_searches(query_plans(lambda: crud.get_user_by_email(db, "plans.employee@example.com")), "users")
+    assert_searches(query_plans(lambda: crud.get_users_by_role(db, "trainer", after_id="0")),
+                    "users", sorted_by_index=True)
+
+
+def test_score_lookups_use_indexes(db):
+    ids = db.ids
+    assert_searches(query_plans(lambda: crud.get_scores_by_employee(db, ids["employee"])), "scores")
+    for feed_filter in ({"employee_id": ids["employee"]}, {"skill_id": ids["skill"]},
+                        {"trainer_id": ids["trainer"]}):
+        plans = query_plans(lambda: crud.get_scores_page(db, ("9999", "z"), limit=10, **feed_filter))
+        assert_searches(plans, "scores", sorted_by_index=True)
+    plans = query_plans(lambda: crud.get_score_details_page(db, trainer_id=ids["trainer"], limit=10))
+    assert_searches(plans, "scores", sorted_by_index=True)
+    plans = query_plans(lambda: crud.get_employees_with_scores(db, employee_ids=[ids["employee"]], latest=3))
+    assert_searches(plans, "users", "scores")
+
+
+def test_skill_matrix_lookups_use_indexes(db):
+    ids = db.ids
+    assert_searches(query_plans(lambda: crud.get_matrix_entries(db, employee_id=ids["employee"])),
+                    "skill_matrix", sorted_by_index=True)
+    assert_searches(query_plans(lambda: crud.get_matrix_entries(db, skill_id=ids["skill"])), "skill_matrix")
+
+
+def test_learning_path_and_notification_lookups_use_indexes(db):
+    ids = db.ids
+    assert_searches(query_plans(lambda: crud.get_learning_paths_by_employee(db, ids["employee"])),
+                    "learning_paths")
+    assert_searches(query_plans(lambda: crud.get_learning_steps_by_path(db, ids["path"])),
+                    "learning_steps", sorted_by_index=True)
+    for owner in ({"employee_id": ids["employee"]}, {"assigned_by": ids["manager"]}):
+        plans = query_plans(lambda: crud.get_learning_paths_progress(db, [], after_id="0", limit=10, **owner))
+        assert_searches(plans, "learning_paths", "learning_steps", sorted_by_index=True)
+    plans = query_plans(lambda: crud.get_team_learning_progress(db, ids["manager"]))
+    assert_searches(plans, "learning_paths", "learning_steps")
+    assert_searches(query_plans(lambda: crud.get_notifications_by_user(db, ids["employee"])), "notifications")
+    plans = query_plans(lambda: crud.get_notifications_page(db, ids["employee"], ("9999", "z"), limit=10))
+    assert_searches(plans, "notifications", sorted_by_index=True)
+    assert_searches(query_plans(lambda: crud.get_unread_count(db, ids["employee"])), "users")
+
+
+def test_skill_lookups_use_indexes(db):
+    assert_searches(query_plans(lambda: crud.get_skills_by_category(db, "Plans")), "skills")
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import make_url
+from app.main import app
+from app.core.config import settings
+from app.db import crud, session
+from app.db.base import SessionLocal, async_database_url
+from app.db.replicas import RecentWriters, ReplicaSet, copy_sqlite_database
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+PRIMARY = make_url(settings.database_url).database
+
+
+def replica_url(path):
+    return f"sqlite:///file:{path}?mode=ro&uri=true"
+
+
+@pytest.fixture
+def replica_set():
+    created = []
+
+    def make(*paths):
+        urls = [replica_url(path) for path in paths]
+        created.append(ReplicaSet.from_urls(urls, [async_database_url(url) for url in urls], check_interval=60))
+        return created[-1]
+
+    yield make
+    for replicas in created:
+        asyncio.run(replicas.dispose())
+
+def test_copy_sqlite_database(tmp_path, replica_set):
+    db = SessionLocal()
+    crud.create_user(db, email="copy.user@example.com", name="Copy", password="pass", role="employee")
+    db.close()
+    target = str(tmp_path / "replica.db")
+    copy_sqlite_database(PRIMARY, target)
+
+    replicas = replica_set(target)
+    with replicas.replicas[0].engine.connect() as conn:
+        emails = conn.exec_driver_sql("SELECT email FROM users").scalars().all()
+    assert "copy.user@example.com" in emails
+
+
+def test_round_robin_skips_replicas_failing_the_health_check(tmp_path, replica_set):
+    first, second = str(tmp_path / "one.db"), str(tmp_path / "two.db")
+    copy_sqlite_database(PRIMARY, first)
+    copy_sqlite_database(PRIMARY, second)
+    replicas = replica_set(first, second, str(tmp_path / "missing" / "three.db"))
+
+    assert replicas.checks_due()
+    replicas.run_checks()
+    assert not replicas.checks_due()
+    assert [replica.healthy for replica in replicas.replicas] == [True, True, False]
+    chosen = [replicas.choose().url for _ in range(4)]
+    assert chosen == [replicas.replicas[i].url for i in (0, 1, 0, 1)]
+
+    for replica in replicas.replicas:
+        replica.healthy = False
+    assert replicas.choose() is None
+
+
+def test_recent_writers_expire():
+    writers = RecentWriters(window=0.05)
+    writers.mark("someone")
+    assert writers.is_recent("someone") and not writers.is_recent("someone-else")
+    time.sleep(0.06)
+    assert not writers.is_recent("someone")
+
+
+def test_get_routes_read_replicas_but_writers_read_their_writes(tmp_path, monkeypatch, replica_set):
+    db = SessionLocal()
+    writer = crud.create_user(db, email="replica.writer@example.com", name="Writer",
+                              password="pass", role="manager")
+    reader = crud.create_user(db, email="replica.reader@example.com", name="Reader",
+                              password="pass", role="manager")
+    employee = crud.create_user(db, email="replica.employee@example.com", name="Employee",
+                                password="pass", role="employee", department="Old")
+    writer_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': writer.id})}"}
+    reader_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': reader.id})}"}
+    employee_id = employee.id
+    db.close()
+
+    target = str(tmp_path / "replica.db")
+    copy_sqlite_database(PRIMARY, target)
+    replicas = replica_set(target)
+    monkeypatch.setattr(session, "replicas", replicas)
+
+    resp = client.put(f"/api/v1/employees/{employee_id}", headers=writer_headers, json={"department": "New"})
+    assert resp.status_code == 200
+    # The writer is routed to the primary; everyone else reads the stale replica.
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=writer_headers).json()["department"] == "New"
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=reader_headers).json()["department"] == "Old"
+
+    copy_sqlite_database(PRIMARY, target)
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=reader_headers).json()["department"] == "New"
+
+    # With every replica down, reads fall back to the primary.
+    db = SessionLocal()
+    crud.update_user(db, employee_id, department="Newest")
+    db.close()
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=reader_headers).json()["department"] == "New"
+    replicas.replicas[0].healthy = False
+    assert client.get(f"/api/v1/employees/{employee_id}", headers=reader_headers).json()["department"] == "Newest"
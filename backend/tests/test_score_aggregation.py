@@ -0,0 +1,76 @@
+import statistics
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, employees, skills, trainer_id, created, dates
+    db = SessionLocal()
+    manager = crud.create_user(db, email="agg.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer_id = crud.create_user(db, email="agg.trainer@example.com", name="Trainer",
+                                  password="pass", role="trainer").id
+    employees = [
+        crud.create_user(db, email=f"agg.employee{i}@example.com", name=f"Employee {i}",
+                         password="pass", role="employee", department=f"Agg Dept {i % 2}").id
+        for i in range(3)
+    ]
+    skills = [crud.create_skill(db, name=f"Agg Skill {i}", category=f"Agg Category {i}").id
+              for i in range(2)]
+    created, dates = [], {}
+    for i in range(12):
+        employee, skill = employees[i % 3], skills[i % 2]
+        score = crud.create_score(db, employee, skill, float((i * 7) % 10 * 10), trainer_id)
+        created.append((employee, skill, score.score, score.id))
+        dates[score.id] = score.date
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    db.close()
+
+
+def test_employee_by_skill_matches_python_reference():
+    resp = client.get("/api/v1/scores/aggregate", params={"group_by": ["employee", "skill"],
+                                                          "trainer_id": trainer_id}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    rows = {(r["employee_id"], r["skill_id"]): r for r in resp.json()}
+    assert len(rows) == 6
+    for key, row in rows.items():
+        values = [s for e, k, s, _ in created if (e, k) == key]
+        assert row["count"] == len(values)
+        assert row["average"] == statistics.fmean(values)
+        assert row["min"] == min(values) and row["max"] == max(values)
+        assert abs(row["stddev"] - statistics.pstdev(values)) < 1e-9
+        # Rows created within the same second tie on date; the id breaks it.
+        latest = max((dates[i], i, s) for e, k, s, i in created if (e, k) == key)
+        assert row["latest_score"] == latest[2]
+
+
+def test_department_and_category_groups():
+    resp = client.get("/api/v1/scores/aggregate",
+                      params={"group_by": ["department", "category"], "trainer_id": trainer_id},
+                      headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert {(r["department"], r["category"]) for r in resp.json()} == {
+        (f"Agg Dept {d}", f"Agg Category {c}") for d in range(2) for c in range(2)
+    }
+    assert sum(r["count"] for r in resp.json()) == 12
+
+
+def test_invalid_group_is_rejected():
+    resp = client.get("/api/v1/scores/aggregate", params={"group_by": "salary"}, headers=headers)
+    assert resp.status_code == 422
+
+
+def test_employee_average_route():
+    employee = employees[0]
+    resp = client.get(f"/api/v1/scores/employee/{employee}/average", headers=headers)
+    assert resp.status_code == 200
+    expected = statistics.fmean(s for e, _, s, _ in created if e == employee)
+    assert resp.json() == {"employee_id": employee, "average_score": expected}
+
+    resp = client.get("/api/v1/scores/employee/nobody/average", headers=headers)
+    assert resp.status_code == 404
@@ -0,0 +1,132 @@
+import asyncio
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+from app.core.config import settings
+from app.services.notification_broker import notification_broker
+from app.utils.ingest import RecordError, parse_records
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, trainer_id, employee_id, skill_id
+    db = SessionLocal()
+    trainer = crud.create_user(db, email="bulk.trainer@example.com", name="Trainer",
+                               password="pass", role="trainer")
+    employee = crud.create_user(db, email="bulk.employee@example.com", name="Employee",
+                                password="pass", role="employee")
+    skill = crud.create_skill(db, name="Bulk Skill", category="Bulk")
+    trainer_id, employee_id, skill_id = trainer.id, employee.id, skill.id
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': trainer.id})}"}
+    db.close()
+
+
+def upload(body, content_type):
+    return client.post("/api/v1/scores/bulk", content=body,
+                       headers=dict(headers, **{"Content-Type": content_type}))
+
+
+def test_parse_records_formats():
+    csv_rows = parse_records("text/csv; charset=utf-8", b"score,feedback\n4,\n5,ok,extra\n")
+    assert csv_rows[0] == (1, {"score": "4"})
+    assert isinstance(csv_rows[1][1], RecordError)
+
+    ndjson_rows = parse_records("application/x-ndjson", b'{"a": 1}\n\nnot json\n[1]\n')
+    assert ndjson_rows[0] == (1, {"a": 1})
+    assert [type(record) for _, record in ndjson_rows[1:]] == [RecordError, RecordError]
+
+
+def test_json_upload_stores_valid_rows_and_reports_the_rest():
+    rows = [
+        {"employee_id": employee_id, "skill_id": skill_id, "score": 3.5},
+        {"employee_id": employee_id, "skill_id": "missing-skill", "score": 4},
+        {"employee_id": trainer_id, "skill_id": skill_id, "score": 4},
+        {"employee_id": employee_id, "skill_id": skill_id, "score": "high"},
+        {"employee_id": employee_id, "skill_id": skill_id, "score": 4.5, "feedback": "good"},
+    ]
+    resp = upload(json.dumps(rows), "application/json")
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["created"] == 2
+    assert [error["row"] for error in body["errors"]] == [2, 3, 4]
+    assert "skill_id" in body["errors"][0]["error"]
+    assert "employee_id" in body["errors"][1]["error"]
+
+    db = SessionLocal()
+    stored = [crud.get_score(db, score_id) for score_id in body["ids"]]
+    assert [(s.score, s.trainer_id, s.feedback) for s in stored] == [(3.5, trainer_id, None),
+                                                                     (4.5, trainer_id, "good")]
+    assert crud.check_skill_matrix(db) == []
+    db.close()
+
+
+def test_csv_and_ndjson_uploads():
+    csv_body = "employee_id,skill_id,score,feedback\n" + "".join(
+        f"{employee_id},{skill_id},{i},row {i}\n" for i in range(5))
+    resp = upload(csv_body, "text/csv")
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["created"] == 5
+
+    ndjson_body = "\n".join(json.dumps({"employee_id": employee_id, "skill_id": skill_id, "score": i})
+                            for i in range(3)) + "\n{broken\n"
+    resp = upload(ndjson_body, "application/x-ndjson")
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["created"] == 3
+    assert resp.json()["errors"][0]["row"] == 4
+
+    db = SessionLocal()
+    entry = crud.get_matrix_entries(db, employee_id=employee_id, skill_id=skill_id)[0]
+    assert entry.attempt_count == 10
+    assert entry.best_score == 4.5
+    assert crud.check_skill_matrix(db) == []
+    db.close()
+
+
+def test_unreadable_payloads_are_rejected():
+    assert upload("{}", "application/json").status_code == 400
+    assert upload("x", "text/plain").status_code == 400
+
+
+def test_oversized_uploads_are_refused_before_parsing(monkeypatch):
+    monkeypatch.setattr(settings, "score_bulk_max_bytes", 64)
+    body = json.dumps([{"employee_id": employee_id, "skill_id": skill_id, "score": 1}] * 5)
+    assert upload(body, "application/json").status_code == 413
+
+    monkeypatch.setattr(settings, "score_bulk_max_bytes", 10 * 1024 * 1024)
+    monkeypatch.setattr(settings, "score_bulk_max_rows", 2)
+    assert upload(body, "application/json").status_code == 413
+
+
+def test_upload_notifies_each_employee_once():
+    db = SessionLocal()
+    watched, other = (crud.create_user(db, email=f"bulk.{name}@example.com", name=name.title(),
+                                       password="pass", role="employee").id for name in ("watched", "other"))
+    db.close()
+    rows = [{"employee_id": watched, "skill_id": skill_id, "score": i} for i in range(3)]
+    rows.append({"employee_id": other, "skill_id": skill_id, "score": 1})
+
+    async def scenario():
+        subscription = notification_broker.subscribe(watched)
+        try:
+            resp = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: upload(json.dumps(rows), "application/json"))
+            assert resp.json()["created"] == 4
+            return [await subscription.get(1), await subscription.get(1)]
+        finally:
+            notification_broker.unsubscribe(subscription)
+
+    (event, data), unread = asyncio.run(scenario())
+    assert event == "notification" and json.loads(data)["message"] == "3 new scores were recorded for you."
+    assert unread == ("unread", '{"unread":1}')
+
+    db = SessionLocal()
+    for user_id, message in ((watched, "3 new scores were recorded for you."),
+                             (other, "A new score was recorded for you.")):
+        assert crud.get_unread_count(db, user_id) == 1
+        notification, _ = crud.get_notifications_page(db, user_id)[0]
+        assert (notification.type, notification.message) == ("assessment", message)
+    db.close()
@@ -0,0 +1,73 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module():
+    global manager_headers, trainer_headers, trainer_id, score_id
+    db = SessionLocal()
+    manager = crud.create_user(db, email="details.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="details.trainer@example.com", name="Dana Trainer",
+                               password="pass", role="trainer")
+    other = crud.create_user(db, email="details.other@example.com", name="Other Trainer",
+                             password="pass", role="trainer")
+    employee = crud.create_user(db, email="details.employee@example.com", name="Eli Employee",
+                                password="pass", role="employee")
+    skill = crud.create_skill(db, name="Details Skill", category="Details")
+    for i in range(5):
+        score = crud.create_score(db, employee.id, skill.id, float(i), trainer.id, feedback=f"f{i}")
+    crud.create_score(db, employee.id, skill.id, 1.0, other.id)
+    trainer_id, score_id = trainer.id, score.id
+    manager_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    trainer_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': trainer.id})}"}
+    db.close()
+
+
+def test_single_score_details_use_one_statement(count_queries):
+    client.get(f"/api/v1/scores/{score_id}/details", headers=manager_headers)  # warm user cache
+    with count_queries() as statements:
+        resp = client.get(f"/api/v1/scores/{score_id}/details", headers=manager_headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["skill_name"] == "Details Skill"
+    assert body["trainer_name"] == "Dana Trainer"
+    assert body["employee_name"] == "Eli Employee"
+    assert body["feedback"] == "f4"
+    assert len(statements) == 1
+
+    assert client.get("/api/v1/scores/missing/details", headers=manager_headers).status_code == 404
+
+
+def test_details_listing_resolves_names_in_one_statement(count_queries):
+    client.get("/api/v1/scores/details", headers=manager_headers)
+    with count_queries() as statements:
+        resp = client.get("/api/v1/scores/details", params={"trainer_id": trainer_id},
+                          headers=manager_headers)
+    assert resp.status_code == 200
+    rows = resp.json()
+    assert len(rows) == 5
+    assert {row["trainer_name"] for row in rows} == {"Dana Trainer"}
+    assert len(statements) == 1
+
+
+def test_trainer_activity_pages_own_scores():
+    items, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/trainers/me/activity", params=params, headers=trainer_headers)
+        assert resp.status_code == 200, resp.text
+        items.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert len(items) == 5
+    assert len({item["id"] for item in items}) == 5
+    assert all(item["trainer_id"] == trainer_id for item in items)
+    assert all(item["employee_name"] == "Eli Employee" for item in items)
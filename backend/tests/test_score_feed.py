@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, python_skill, sql_skill, trainer_id
+    db = SessionLocal()
+    manager = crud.create_user(db, email="feed.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="feed.trainer@example.com", name="Trainer",
+                               password="pass", role="trainer")
+    employee = crud.create_user(db, email="feed.employee@example.com", name="Employee",
+                                password="pass", role="employee")
+    python_skill = crud.create_skill(db, name="Feed Python", category="Programming").id
+    sql_skill = crud.create_skill(db, name="Feed SQL", category="Database").id
+    trainer_id = trainer.id
+    # Created within the same second, so only the id breaks date ties.
+    for i in range(7):
+        crud.create_score(db, employee.id, python_skill if i % 2 else sql_skill, float(i), trainer.id)
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    db.close()
+
+
+def collect(**params):
+    items, cursor = [], None
+    while True:
+        query = dict(params, limit=2)
+        if cursor:
+            query["cursor"] = cursor
+        resp = client.get("/api/v1/scores/", params=query, headers=headers)
+        assert resp.status_code == 200, resp.text
+        items.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+
+
+def test_feed_pages_are_newest_first_without_gaps_or_duplicates():
+    scores = collect(trainer_id=trainer_id)
+    assert len(scores) == 7
+    keys = [(s["date"], s["id"]) for s in scores]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_feed_filters_by_skill_and_date_range():
+    assert len(collect(skill_id=python_skill)) == 3
+    assert len(collect(skill_id=sql_skill, trainer_id=trainer_id)) == 4
+
+    now = datetime.utcnow()
+    assert len(collect(trainer_id=trainer_id, date_from=(now - timedelta(hours=1)).isoformat())) == 7
+    assert collect(trainer_id=trainer_id, date_to=(now - timedelta(hours=1)).isoformat()) == []
@@ -0,0 +1,83 @@
+import json
+import pytest
+from typing import List
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud, models
+from app.core.security import create_access_token
+from app.schemas.employee import EmployeeResponse
+from app.schemas.score import ScoreResponse
+from app.utils.serialization import RowListEncoder
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, employee_id
+    db = SessionLocal()
+    manager = crud.create_user(db, email="serial.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="serial.trainer@example.com", name="Trainer",
+                               password="pass", role="trainer")
+    employee = crud.create_user(db, email="serial.employee@example.com", name="Employee",
+                                password="pass", role="employee", department="Serial")
+    skill = crud.create_skill(db, name="Serial Skill", category="Serial")
+    for value in (70, 85.5):
+        crud.create_score(db, employee.id, skill.id, value, trainer.id, feedback="ok")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    employee_id = employee.id
+    db.close()
+
+
+def as_models(schema, objects) -> bytes:
+    # What the routes sent before: one model_validate per ORM object.
+    return TypeAdapter(List[schema]).dump_json([schema.model_validate(obj) for obj in objects])
+
+
+def test_row_encoder_matches_model_validation():
+    db = SessionLocal()
+    encoder = RowListEncoder(ScoreResponse)
+    rows = crud.get_scores_by_employee(db, employee_id, encoder.columns(models.Score))
+    assert encoder.encode(rows) == as_models(ScoreResponse, crud.get_scores_by_employee(db, employee_id))
+
+    encoder = RowListEncoder(EmployeeResponse)
+    rows = crud.get_users_by_role(db, "employee", columns=encoder.columns(models.User))
+    assert encoder.encode(rows) == as_models(EmployeeResponse, crud.get_users_by_role(db, "employee"))
+    db.close()
+
+
+def test_trailing_columns_are_ignored():
+    encoder = RowListEncoder(ScoreResponse)
+    db = SessionLocal()
+    rows = crud.get_scores_page(db, employee_id=employee_id, columns=encoder.columns(models.Score))
+    db.close()
+    assert len(rows[0]) == len(encoder.fields) + 1  # the sort date
+    assert sorted(score["score"] for score in json.loads(encoder.encode(rows))) == [70.0, 85.5]
+
+
+def test_list_routes_send_pre_encoded_json():
+    resp = client.get("/api/v1/scores/", params={"limit": 1}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    assert len(resp.json()) == 1 and "X-Next-Cursor" in resp.headers
+
+    resp = client.get("/api/v1/scores/details", params={"employee_id": employee_id}, headers=headers)
+    assert [(s["skill_name"], s["employee_name"], s["trainer_name"]) for s in resp.json()] == \
+        [("Serial Skill", "Employee", "Trainer")] * 2
+
+    resp = client.get(f"/api/v1/scores/employee/{employee_id}", headers=headers)
+    assert sorted(s["score"] for s in resp.json()) == [70.0, 85.5]
+
+
+def test_columns_are_matched_by_label():
+    encoder = RowListEncoder(ScoreResponse)
+    db = SessionLocal()
+    expected = encoder.encode(crud.get_scores_by_employee(db, employee_id, encoder.columns(models.Score)))
+    reordered = crud.get_scores_by_employee(db, employee_id, encoder.columns(models.Score)[::-1])
+    assert encoder.encode(reordered) == expected
+    missing = crud.get_scores_by_employee(db, employee_id, encoder.columns(models.Score, ["score", "date"]))
+    db.close()
+    with pytest.raises(ValueError, match="no column for feedback, id"):
+        encoder.encode(missing)
@@ -0,0 +1,79 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+from app.services.skill_catalog import SkillCatalogCache, skill_catalog
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers
+    db = SessionLocal()
+    manager = crud.create_user(db, email="catalog.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    db.close()
+
+
+def test_unchanged_catalog_is_revalidated_with_304():
+    skill_catalog.refresh()
+    resp = client.get("/api/v1/skills/", params={"limit": 1000})
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    db = SessionLocal()
+    ids = [skill["id"] for skill in resp.json()]
+    assert ids == [skill.id for skill in crud.get_all_skills(db)] == sorted(ids)
+    assert [skill.id for skill in crud.get_skills(db, skip=1, limit=2)] == ids[1:3]
+    db.close()
+
+    loads = skill_catalog.loads
+    resp = client.get("/api/v1/skills/", params={"limit": 1000}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304 and resp.content == b""
+    assert resp.headers["etag"] == etag
+    assert skill_catalog.loads == loads  # served from memory
+
+
+def test_skill_writes_publish_a_new_snapshot():
+    etag = client.get("/api/v1/skills/").headers["etag"]
+    resp = client.post("/api/v1/skills/", headers=headers,
+                       json={"name": "Catalog Rust", "category": "Catalog Systems"})
+    skill_id = resp.json()["id"]
+
+    resp = client.get("/api/v1/skills/", headers={"If-None-Match": etag})
+    assert resp.status_code == 200 and resp.headers["etag"] != etag
+    assert client.get(f"/api/v1/skills/{skill_id}").json()["name"] == "Catalog Rust"
+    assert [s["id"] for s in client.get("/api/v1/skills/category/Catalog Systems").json()] == [skill_id]
+
+    client.put(f"/api/v1/skills/{skill_id}", headers=headers, json={"category": "Catalog Languages"})
+    assert client.get("/api/v1/skills/category/Catalog Systems").json() == []
+    assert [s["id"] for s in client.get("/api/v1/skills/category/Catalog Languages").json()] == [skill_id]
+
+    client.delete(f"/api/v1/skills/{skill_id}", headers=headers)
+    assert client.get(f"/api/v1/skills/{skill_id}").status_code == 404
+    assert client.get("/api/v1/skills/category/Catalog Languages").json() == []
+
+
+def test_large_categories_are_served_whole():
+    db = SessionLocal()
+    crud.bulk_create_skills(db, [{"name": f"Catalog Bulk {i}", "category": "Catalog Bulk"} for i in range(150)])
+    db.close()
+    skill_catalog.refresh()
+    assert len(client.get("/api/v1/skills/category/Catalog Bulk").json()) == 150
+    assert len(client.get("/api/v1/skills/", params={"skip": 10, "limit": 25}).json()) == 25
+
+
+def test_snapshot_reloads_after_max_age():
+    now = [0.0]
+    cache = SkillCatalogCache(max_age=60, timer=lambda: now[0])
+    first = cache.get()
+    db = SessionLocal()
+    crud.create_skill(db, name="Catalog Elsewhere", category="Catalog Remote")
+    db.close()
+
+    now[0] = 59
+    assert cache.get() is first
+    now[0] = 60
+    assert "Catalog Remote" in cache.get().by_category
+    assert cache.loads == 2
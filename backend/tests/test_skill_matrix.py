@@ -0,0 +1,79 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+
+client = TestClient(app)
+
+
+def setup_module():
+    global db, headers, employee, trainer, skill, other_skill
+    db = SessionLocal()
+    manager = crud.create_user(db, email="matrix.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    trainer = crud.create_user(db, email="matrix.trainer@example.com", name="Trainer",
+                               password="pass", role="trainer").id
+    employee = crud.create_user(db, email="matrix.employee@example.com", name="Employee",
+                                password="pass", role="employee", department="Matrix").id
+    skill = crud.create_skill(db, name="Matrix Skill", category="Matrix").id
+    other_skill = crud.create_skill(db, name="Matrix Other", category="Matrix").id
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+
+
+def teardown_module():
+    db.close()
+
+
+def cell(skill_id):
+    resp = client.get("/api/v1/scores/matrix", params={"employee_id": employee, "skill_id": skill_id},
+                      headers=headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()[0] if resp.json() else None
+
+
+def test_matrix_follows_score_writes():
+    first = crud.create_score(db, employee, skill, 60.0, trainer)
+    best = crud.create_score(db, employee, skill, 90.0, trainer)
+    last = crud.create_score(db, employee, skill, 70.0, trainer)
+    row = cell(skill)
+    assert row["attempt_count"] == 3
+    assert row["best_score"] == 90.0
+    assert row["average_score"] == (60 + 90 + 70) / 3
+    assert crud.check_skill_matrix(db) == []
+
+    # Lowering the best score re-reads the best from the cell.
+    crud.update_score(db, best.id, score=50.0)
+    assert cell(skill)["best_score"] == 70.0
+    assert crud.check_skill_matrix(db) == []
+
+    # Deleting the latest score falls back to the previous latest.
+    latest_id = max((s.date, s.id) for s in (first, best, last))[1]
+    crud.delete_score(db, latest_id)
+    row = cell(skill)
+    assert row["attempt_count"] == 2
+    assert crud.check_skill_matrix(db) == []
+
+    for score in crud.get_scores_by_employee(db, employee):
+        crud.delete_score(db, score.id)
+    assert cell(skill) is None
+    assert crud.check_skill_matrix(db) == []
+
+
+def test_rebuild_matches_incremental_maintenance():
+    for value in (10.0, 40.0, 20.0):
+        crud.create_score(db, employee, other_skill, value, trainer)
+    before = cell(other_skill)
+    db.execute(crud.models.SkillMatrixEntry.__table__.delete())
+    db.commit()
+    assert crud.check_skill_matrix(db)
+
+    crud.rebuild_skill_matrix(db)
+    assert crud.check_skill_matrix(db) == []
+    assert cell(other_skill) == before
+
+
+def test_matrix_filters_by_department():
+    resp = client.get("/api/v1/scores/matrix", params={"department": "Matrix"}, headers=headers)
+    assert resp.status_code == 200
+    assert {row["employee_id"] for row in resp.json()} == {employee}
@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+from app.services.skill_service import SkillService
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers
+    db = SessionLocal()
+    manager = crud.create_user(db, email="search.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    crud.create_skill(db, name="Zebrafish Genetics", category="Search Biology",
+                      description="Breeding zebrafish lines")
+    crud.create_skill(db, name="Lab Safety", category="Search Biology",
+                      description="Handling zebrafish tanks safely")
+    crud.create_skill(db, name="Zebrafish Imaging", category="Search Microscopy",
+                      description="Confocal imaging")
+    db.close()
+
+
+def search(q, **params):
+    resp = client.get("/api/v1/skills/search", params={"q": q, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def test_prefix_search_ranks_name_matches_first():
+    result = search("zebraf")
+    assert result["total"] == 3
+    names = [skill["name"] for skill in result["skills"]]
+    assert names[-1] == "Lab Safety"  # matched in the description only
+    assert result["categories"] == [{"category": "Search Biology", "count": 2},
+                                    {"category": "Search Microscopy", "count": 1}]
+
+    assert [s["name"] for s in search("zebrafish ima")["skills"]] == ["Zebrafish Imaging"]
+    assert search("\"zebra* -(")["total"] == 3  # FTS syntax is treated as plain words
+    assert client.get("/api/v1/skills/search", params={"q": ""}).status_code == 422
+
+
+def test_category_filter_keeps_the_facets():
+    result = search("zebrafish", category="Search Microscopy")
+    assert result["total"] == 1
+    assert [s["name"] for s in result["skills"]] == ["Zebrafish Imaging"]
+    assert len(result["categories"]) == 2
+    assert len(search("zebrafish", limit=1, skip=1)["skills"]) == 1
+
+
+def test_index_follows_skill_writes():
+    resp = client.post("/api/v1/skills/", headers=headers,
+                       json={"name": "Quokka Handling", "category": "Search Fauna"})
+    skill_id = resp.json()["id"]
+    assert [s["id"] for s in search("quokka")["skills"]] == [skill_id]
+
+    client.put(f"/api/v1/skills/{skill_id}", headers=headers,
+               json={"name": "Wombat Handling", "category": "Search Marsupials"})
+    assert search("quokka")["total"] == 0
+    assert search("wombat")["categories"] == [{"category": "Search Marsupials", "count": 1}]
+
+    client.delete(f"/api/v1/skills/{skill_id}", headers=headers)
+    assert search("wombat")["total"] == 0
+
+
+def test_service_returns_whole_categories():
+    db = SessionLocal()
+    crud.bulk_create_skills(db, [{"name": f"Search Bulk {i}", "category": "Search Bulk"} for i in range(150)])
+    assert len(SkillService(db).get_skills_by_category("Search Bulk")) == 150
+    db.close()
@@ -0,0 +1,67 @@
+import app.main  # noqa: F401  (creates the tables)
+from app.core.cache import TTLCache, user_cache
+from app.core.security import create_access_token, get_current_user
+from app.db.base import SessionLocal
+from app.db import crud
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_hits_misses_and_expiry():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=2, ttl=10, timer=timer)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    timer.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=10, timer=FakeTimer())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_does_not_store_load_racing_with_invalidation():
+    cache = TTLCache(maxsize=10, ttl=10, timer=FakeTimer())
+
+    def loader(key):
+        cache.invalidate(key)  # a write lands while the load is in flight
+        return "stale"
+
+    assert cache.get_or_load("a", loader) == "stale"
+    assert cache.get("a") is None
+
+
+def test_update_and_delete_invalidate_cached_user():
+    db = SessionLocal()
+    user = crud.create_user(db, email="cached@example.com", name="Cached",
+                            password="cachedpass", role="employee")
+    token = create_access_token(data={"sub": user.id})
+
+    assert get_current_user(token).name == "Cached"
+    assert user_cache.get(user.id) is not None
+
+    crud.update_user(db, user.id, name="Renamed")
+    assert user_cache.get(user.id) is None
+    assert get_current_user(token).name == "Renamed"
+
+    crud.delete_user(db, user.id)
+    assert get_current_user(token) is None
+    db.close()
@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.utils.password import password_hasher, verify_password
+
+client = TestClient(app)
+
+
+def setup_module():
+    global headers, manager_headers
+    db = SessionLocal()
+    admin = crud.create_user(db, email="import.admin@example.com", name="Admin",
+                             password="pass", role="super-user")
+    manager = crud.create_user(db, email="import.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    crud.create_user(db, email="import.existing@example.com", name="Existing",
+                     password="pass", role="employee")
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': admin.id})}",
+               "Content-Type": "text/csv"}
+    manager_headers = dict(headers, Authorization=f"Bearer {create_access_token(data={'sub': manager.id})}")
+    db.close()
+
+
+def test_hash_many_keeps_input_order():
+    hashes = password_hasher.hash_many(["a", "b"])
+    assert verify_password("a", hashes[0]) and verify_password("b", hashes[1])
+
+
+def test_csv_import_creates_new_users_and_skips_existing():
+    body = (
+        "email,name,password,role,department,experience\n"
+        "import.one@example.com,One,secret1,employee,Engineering,3\n"
+        "import.existing@example.com,Existing,secret,employee,,\n"
+        "import.two@example.com,Two,secret2,trainer,Training,\n"
+        "import.one@example.com,One Again,secret,employee,,\n"
+        "import.three@example.com,Three,secret,wizard,,\n"
+        "not-an-email,Four,secret,employee,,\n"
+    )
+    resp = client.post("/api/v1/users/import", content=body, headers=headers)
+    assert resp.status_code == 200, resp.text
+    result = resp.json()
+    assert (result["created"], result["skipped"], result["failed"]) == (2, 1, 3)
+    assert [error["row"] for error in result["errors"]] == [4, 5, 6]
+
+    db = SessionLocal()
+    one = crud.get_user_by_email(db, "import.one@example.com")
+    assert (one.name, one.role, one.department, one.experience) == ("One", "employee", "Engineering", 3)
+    assert verify_password("secret1", one.hashed_password)
+    assert crud.get_user_by_email(db, "import.two@example.com").role == "trainer"
+    db.close()
+
+    again = client.post("/api/v1/users/import", content=body, headers=headers).json()
+    assert (again["created"], again["skipped"]) == (0, 4)
+
+
+def test_import_requires_super_user():
+    resp = client.post("/api/v1/users/import", content="email\n", headers=manager_headers)
+    assert resp.status_code == 403
+
+
+def test_oversized_imports_are_refused(monkeypatch):
+    body = "email,name,password,role\n" + "".join(
+        f"import.big{i}@example.com,Big,secret,employee\n" for i in range(3))
+    monkeypatch.setattr(settings, "user_import_max_rows", 2)
+    assert client.post("/api/v1/users/import", content=body, headers=headers).status_code == 413
+
+    monkeypatch.setattr(settings, "user_import_max_rows", 20000)
+    monkeypatch.setattr(settings, "user_import_max_bytes", 32)
+    assert client.post("/api/v1/users/import", content=body, headers=headers).status_code == 413
@@ -0,0 +1,69 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.db.base import SessionLocal
+from app.db import crud
+from app.core.security import create_access_token
+from app.utils.pagination import encode_cursor
+
+client = TestClient(app)
+
+
+def setup_module():
+    db = SessionLocal()
+    for i in range(5):
+        crud.create_user(db, email=f"listing.employee{i}@example.com", name=f"Employee {i}",
+                         password="pass", role="employee")
+    for i in range(3):
+        crud.create_user(db, email=f"listing.trainer{i}@example.com", name=f"Trainer {i}",
+                         password="pass", role="trainer")
+    manager = crud.create_user(db, email="listing.manager@example.com", name="Manager",
+                               password="pass", role="manager")
+    global headers
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': manager.id})}"}
+    db.close()
+
+
+def collect(path):
+    items, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get(path, params=params, headers=headers)
+        assert resp.status_code == 200, resp.text
+        page = resp.json()
+        assert len(page) <= 2
+        items.extend(page)
+        pages += 1
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items, pages
+
+
+def test_employee_pages_contain_only_employees_in_id_order():
+    employees, pages = collect("/api/v1/employees/")
+    ids = [e["id"] for e in employees]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {e["role"] for e in employees} == {"employee"}
+    assert sum(e["email"].startswith("listing.employee") for e in employees) == 5
+    assert pages == (len(employees) + 1) // 2
+
+
+def test_trainer_pages_are_full_until_the_last():
+    trainers, _ = collect("/api/v1/trainers/")
+    assert sum(t["email"].startswith("listing.trainer") for t in trainers) == 3
+    assert {t["role"] for t in trainers} == {"trainer"}
+
+
+def test_invalid_cursor_is_rejected():
+    resp = client.get("/api/v1/employees/", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert resp.status_code == 400
+
+
+def test_cursor_with_non_string_keys_is_rejected():
+    for path, cursor in (("/api/v1/trainers/", encode_cursor({"a": 1})),
+                         ("/api/v1/scores/", encode_cursor(["x"], 1)),
+                         ("/api/v1/scores/details", encode_cursor("2024-01-01", None))):
+        resp = client.get(path, params={"cursor": cursor}, headers=headers)
+        assert resp.status_code == 400, (path, resp.text)